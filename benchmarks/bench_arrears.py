@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Benchmark - Loan arrears job
+============================
+Runs DatabaseManager.run_arrears_job (one pass over loans and their
+schedules, bulk status flips) and the previous way of finding delinquent
+loans: every active loan read into Python, its paid-up months worked out
+from amount_paid / monthly_installment and compared with the months elapsed.
+The job is run twice: the first run flags every loan already past the
+default threshold, the second shows the steady daily cost.
+
+Usage:
+    python benchmarks/bench_arrears.py
+"""
+
+import time
+from datetime import date
+
+from dateutil.relativedelta import relativedelta
+
+from synthetic import build_database, scratch_path
+
+from database.db_manager import DatabaseManager, arrears_run_report
+
+MEMBERS = 20_000
+LOANS = [100_000, 500_000]
+
+
+def arrears_legacy(db, as_of):
+    """Days past due per active loan from elapsed months in Python"""
+    delinquent = {}
+    for loan in db.fetchall("SELECT * FROM loans WHERE status = 'Active'"):
+        installment = loan['monthly_installment']
+        covered = int(loan['amount_paid'] // installment) if installment else 0
+        if covered >= loan['duration_months']:
+            continue
+        first_unpaid = date.fromisoformat(loan['start_date']) + relativedelta(months=covered)
+        if first_unpaid < as_of:
+            delinquent[loan['loan_id']] = (as_of - first_unpaid).days
+    return delinquent
+
+
+def main():
+    as_of = date.today()
+    print(f"{'loans':>8} {'in arrears':>11} {'first (s)':>10} {'rerun (s)':>10} {'legacy (s)':>11}")
+    for count in LOANS:
+        path = build_database(scratch_path('arrears'), members=MEMBERS, loans=count)
+        db = DatabaseManager(path)
+
+        start = time.perf_counter()
+        legacy = arrears_legacy(db, as_of)
+        legacy_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        first = db.run_arrears_job(as_of.isoformat(), 'bench')
+        first_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        rerun = db.run_arrears_job(as_of.isoformat(), 'bench')
+        rerun_s = time.perf_counter() - start
+
+        print(f"{first['loans_checked']:>8,} {first['loans_in_arrears']:>11,} "
+              f"{first_s:10.2f} {rerun_s:10.2f} {legacy_s:11.2f}")
+        print(f"  (legacy found {len(legacy):,} delinquent)")
+        print(arrears_run_report(first))
+        print(arrears_run_report(rerun))
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Benchmark - Cashbook PDF
+========================
+Renders a year of cash transactions with the streaming
+ReportGenerator.generate_cashbook_pdf and with the previous approach (every
+transaction loaded, filtered in Python, one reportlab Table), comparing
+time and peak Python memory.
+
+Usage:
+    python benchmarks/bench_cashbook.py
+"""
+
+import os
+import time
+import tracemalloc
+from datetime import date, timedelta
+
+from reportlab.lib.pagesizes import A4
+from reportlab.platypus import SimpleDocTemplate, Table
+
+from synthetic import build_database, scratch_path
+
+from database.db_manager import DatabaseManager
+from reports.report_generator import ReportGenerator
+
+MEMBERS = 5_000
+# Spread over three years, a third of them cash
+TRANSACTIONS = [15_000, 45_000, 90_000]
+
+
+def legacy_cashbook(db, start_date, end_date, filepath):
+    """Load the whole period, filter cash rows in Python, build one Table"""
+    transactions = db.get_transactions(None, start_date, end_date)
+    cash = [t for t in transactions if t.get('payment_method') == 'Cash']
+    data = [['Date', 'Member ID', 'Description', 'Receipts', 'Payments']]
+    for txn in cash:
+        amount = f"{txn['amount']:,.2f}"
+        data.append([txn['transaction_date'], txn['member_id'],
+                     txn['description'] or txn['transaction_type'],
+                     amount if txn['is_credit'] else '-',
+                     '-' if txn['is_credit'] else amount])
+    SimpleDocTemplate(filepath, pagesize=A4).build([Table(data, repeatRows=1)])
+    return len(cash)
+
+
+def measure(fn, *args):
+    """Seconds of an untraced call and peak traced memory (MB) of a second one"""
+    start = time.perf_counter()
+    fn(*args)
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    fn(*args)
+    peak = tracemalloc.get_traced_memory()[1] / 1e6
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def main():
+    end_date = date.today().isoformat()
+    start_date = (date.today() - timedelta(days=365)).isoformat()
+
+    print(f"{'cash rows':>10} {'streaming (s)':>14} {'peak MB':>8} {'legacy (s)':>11} {'peak MB':>8}")
+    for count in TRANSACTIONS:
+        path = build_database(scratch_path('cashbook'), members=MEMBERS, transactions=count)
+        db = DatabaseManager(path)
+        reports = ReportGenerator(db)
+        reports.reports_dir = os.path.dirname(path)
+        reports.use_cache = False
+        cash_rows = db.fetchone(
+            "SELECT COUNT(*) AS n FROM transactions WHERE payment_method = 'Cash' "
+            "AND transaction_date BETWEEN ? AND ?", (start_date, end_date)
+        )['n']
+
+        stream_s, stream_mb = measure(reports.generate_cashbook_pdf, start_date, end_date)
+        legacy_s, legacy_mb = measure(legacy_cashbook, db, start_date, end_date,
+                                      os.path.join(os.path.dirname(path), 'legacy_cashbook.pdf'))
+
+        print(f"{cash_rows:>10,} {stream_s:14.2f} {stream_mb:8.1f} {legacy_s:11.2f} {legacy_mb:8.1f}")
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Benchmark - Reads during writes
+===============================
+Runs dashboard snapshots on pooled reader threads while the main
+connection posts savings deposits, once with the old rollback journal and
+once in WAL mode, and reports snapshot latency and writer throughput.
+
+Usage:
+    python benchmarks/bench_concurrent_reads.py
+"""
+
+import threading
+import time
+
+from synthetic import build_database, scratch_path
+
+from database.dashboard_stats import DashboardStatsService
+from database.db_manager import DatabaseManager
+
+MEMBERS = 20_000
+LOANS = 80_000
+TRANSACTIONS = 300_000
+DEPOSITS = 2_000
+READER_THREADS = 3
+
+
+def run(journal_mode):
+    """Writer and readers side by side; returns (p50 ms, max ms, reads, writes/s)"""
+    path = build_database(scratch_path('concurrent'), members=MEMBERS, loans=LOANS,
+                          transactions=TRANSACTIONS)
+    db = DatabaseManager(path)
+    db.execute(f"PRAGMA journal_mode = {journal_mode}")
+    if journal_mode != 'WAL':
+        db.execute("PRAGMA synchronous = FULL")
+    accounts = [row['account_id'] for row in db.fetchall("SELECT account_id FROM savings_accounts")]
+
+    latencies = []
+    done = threading.Event()
+
+    def read_loop():
+        while not done.is_set():
+            start = time.perf_counter()
+            with db.reader() as reader:
+                DashboardStatsService(reader).snapshot()
+            latencies.append((time.perf_counter() - start) * 1000)
+
+    threads = [threading.Thread(target=read_loop) for _ in range(READER_THREADS)]
+    for t in threads:
+        t.start()
+
+    start = time.perf_counter()
+    for i in range(DEPOSITS):
+        db.deposit_to_savings(accounts[i % len(accounts)], 100.0, {'payment_method': 'Cash'}, 'bench')
+    write_s = time.perf_counter() - start
+
+    done.set()
+    for t in threads:
+        t.join()
+    db.close()
+
+    latencies.sort()
+    return latencies[len(latencies) // 2], latencies[-1], len(latencies), DEPOSITS / write_s
+
+
+def main():
+    print(f"{'journal':>8} {'read p50 (ms)':>14} {'read max (ms)':>14} {'reads':>6} {'writes/s':>9}")
+    for mode in ('DELETE', 'WAL'):
+        p50, worst, reads, rate = run(mode)
+        print(f"{mode:>8} {p50:14.1f} {worst:14.1f} {reads:>6} {rate:9.0f}")
+
+
+if __name__ == "__main__":
+    main()
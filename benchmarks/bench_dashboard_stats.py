@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Benchmark - Dashboard statistics refresh cost
+=============================================
+Compares the old Python-side aggregation in DashboardModule.get_statistics
+with DashboardStatsService as the loans table grows from 8k to 1M rows.
+"cold" is a snapshot after a write; "idle" is a refresh with no writes
+since the last one, which the service answers from its cache.
+
+Usage:
+    python benchmarks/bench_dashboard_stats.py [--skip-legacy]
+"""
+
+import sys
+import time
+from decimal import Decimal
+
+from synthetic import build_database, scratch_path
+
+from database.db_manager import DatabaseManager
+from database.dashboard_stats import DashboardStatsService
+
+LOAN_COUNTS = [0, 100_000, 1_000_000]   # added on top of the ~8.4k shipped loans
+TRANSACTIONS = 200_000
+REPEATS = 5
+
+
+def legacy_statistics(db):
+    """The member/savings/loan part of the previous get_statistics"""
+    members = db.fetchall("SELECT is_active, is_deceased FROM members")
+    active = sum(1 for m in members if m['is_active'] and not m['is_deceased'])
+    savings = db.fetchall("""
+        SELECT sa.current_balance, st.type_name
+        FROM savings_accounts sa
+        JOIN savings_types st ON sa.savings_type_id = st.savings_type_id
+    """)
+    total_savings = sum(Decimal(str(s['current_balance'])) for s in savings)
+    loans = db.fetchall("""
+        SELECT principal_amount, interest_amount, amount_paid, balance_outstanding, status
+        FROM loans
+    """)
+    disbursed = sum(Decimal(str(l['principal_amount'])) for l in loans)
+    outstanding = sum(Decimal(str(l['balance_outstanding'])) for l in loans if l['status'] == 'Active')
+    paid = sum(Decimal(str(l['amount_paid'])) for l in loans)
+    return active, total_savings, disbursed, outstanding, paid
+
+
+def best_of(fn, repeats=REPEATS):
+    """Best wall-clock time in milliseconds"""
+    best = float('inf')
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main():
+    skip_legacy = '--skip-legacy' in sys.argv
+
+    print(f"{'loans':>10} {'cold (ms)':>11} {'idle (ms)':>11} {'legacy (ms)':>13}")
+    for extra in LOAN_COUNTS:
+        path = build_database(scratch_path('dashboard'), loans=extra, transactions=TRANSACTIONS)
+        db = DatabaseManager(path)
+        service = DashboardStatsService(db)
+        loan_total = db.fetchone("SELECT COUNT(*) AS n FROM loans")['n']
+
+        def cold():
+            db.change_count += 1   # what a committed write does to data_version()
+            service.snapshot()
+
+        cold_ms = best_of(cold)
+        idle_ms = best_of(service.snapshot)
+        legacy_ms = None if skip_legacy else best_of(lambda: legacy_statistics(db), repeats=1)
+
+        legacy_text = f"{legacy_ms:13.1f}" if legacy_ms is not None else f"{'-':>13}"
+        print(f"{loan_total:>10,} {cold_ms:11.1f} {idle_ms:11.3f} {legacy_text}")
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Benchmark - Death benefit levy
+==============================
+Charges the levy for one deceased member with
+DatabaseManager.process_death_benefit and, for a sample of members, with one
+withdraw_from_savings() (its own transaction and balance refresh) per
+member, extrapolated to all members charged.
+
+Usage:
+    python benchmarks/bench_death_benefit.py
+"""
+
+import time
+
+from synthetic import build_database, scratch_path
+
+from database.db_manager import DatabaseManager
+
+MEMBERS = [10_000, 100_000]
+LEGACY_SAMPLE = 2_000
+DECEASED = 'SYN000001'
+
+
+def levy_legacy(db, accounts, charge):
+    """One committed withdrawal per member"""
+    for account in accounts:
+        db.withdraw_from_savings(account['account_id'], charge,
+                                 {'description': 'Death benefit levy'}, 'bench')
+
+
+def main():
+    print(f"{'members':>8} {'set-based (s)':>14} {'per-member est. (s)':>20}")
+    for count in MEMBERS:
+        path = build_database(scratch_path('death_benefit'), members=count)
+        db = DatabaseManager(path)
+        db.execute("UPDATE members SET is_deceased = 1, is_active = 0, deceased_date = date('now') "
+                   "WHERE member_id = ?", (DECEASED,))
+        db.conn.commit()
+
+        start = time.perf_counter()
+        result = db.process_death_benefit(DECEASED, 'bench')
+        set_s = time.perf_counter() - start
+
+        sample = db.fetchall("""
+            SELECT sa.account_id
+            FROM savings_accounts sa
+            JOIN savings_types st ON st.savings_type_id = sa.savings_type_id
+            WHERE st.type_code = 'PREMIUM' AND sa.current_balance >= ? LIMIT ?
+        """, (result['per_member_charge'], LEGACY_SAMPLE))
+        start = time.perf_counter()
+        levy_legacy(db, sample, result['per_member_charge'])
+        legacy_s = (time.perf_counter() - start) * result['members_charged'] / len(sample)
+
+        print(f"{result['members_charged']:>8,} {set_s:14.2f} {legacy_s:20.1f}")
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Benchmark - Monthly savings interest
+====================================
+Posts a month of interest with DatabaseManager.post_monthly_interest (dry
+run, then for real) and, for a sample of accounts, with one UPDATE, ledger
+row and balance refresh per account, extrapolated to all accounts.
+
+Usage:
+    python benchmarks/bench_interest.py
+"""
+
+import time
+
+from synthetic import build_database, scratch_path
+
+from database.db_manager import DatabaseManager
+
+# Two interest-bearing accounts per member
+MEMBERS = [50_000, 250_000]
+LEGACY_SAMPLE = 2_000
+
+
+def post_legacy(db, accounts, posting_date):
+    """One account at a time, the way the modules post"""
+    with db.transaction():
+        for account in accounts:
+            interest = round(account['current_balance'] * account['interest_rate'] / 100, 2)
+            db.execute(
+                "UPDATE savings_accounts SET current_balance = current_balance + ?, "
+                "total_interest_earned = total_interest_earned + ? WHERE account_id = ?",
+                (interest, interest, account['account_id'])
+            )
+            db.record_transaction(account['member_id'], 'Interest', 'Savings',
+                                  str(account['account_id']), interest, True,
+                                  {'transaction_date': posting_date}, 'bench')
+            db.refresh_member_balance(account['member_id'])
+
+
+def main():
+    print(f"{'accounts':>9} {'dry run (s)':>12} {'post (s)':>9} {'per-account est. (s)':>21}")
+    for count in MEMBERS:
+        path = build_database(scratch_path('interest'), members=count)
+        db = DatabaseManager(path)
+        # Fresh copy with nothing posted, so this is last month
+        period = db.get_next_interest_period()
+
+        start = time.perf_counter()
+        preview = db.post_monthly_interest(period, 'bench', dry_run=True)
+        dry_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        db.post_monthly_interest(period, 'bench')
+        post_s = time.perf_counter() - start
+
+        sample = db.fetchall("""
+            SELECT sa.account_id, sa.member_id, sa.current_balance, st.interest_rate
+            FROM savings_accounts sa
+            JOIN savings_types st ON st.savings_type_id = sa.savings_type_id
+            WHERE sa.is_active = 1 LIMIT ?
+        """, (LEGACY_SAMPLE,))
+        start = time.perf_counter()
+        post_legacy(db, sample, preview['posting_date'])
+        legacy_s = (time.perf_counter() - start) * preview['accounts'] / len(sample)
+
+        print(f"{preview['accounts']:>9,} {dry_s:12.2f} {post_s:9.2f} {legacy_s:21.1f}")
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Benchmark - Loan schedule
+=========================
+Lists the installments due this month with DatabaseManager.get_installments_due
+(one range scan of idx_loan_schedule_due) and the previous way: every active
+loan read back and its due dates stepped out with relativedelta, with the
+installments its amount_paid covers skipped. Also times a single repayment,
+which now allocates itself against the schedule.
+
+Usage:
+    python benchmarks/bench_loan_schedule.py
+"""
+
+import time
+from datetime import date
+
+from dateutil.relativedelta import relativedelta
+
+from synthetic import build_database, scratch_path
+
+from database.db_manager import DatabaseManager
+
+MEMBERS = 20_000
+LOANS = [100_000, 500_000]
+
+
+def due_legacy(db, start_date, end_date):
+    """Date arithmetic across every active loan"""
+    due = []
+    for loan in db.fetchall("""
+        SELECT loan_id, start_date, monthly_installment, amount_paid, duration_months
+        FROM loans WHERE status = 'Active'
+    """):
+        start = date.fromisoformat(loan['start_date'])
+        installment = loan['monthly_installment']
+        covered = int(loan['amount_paid'] // installment) if installment else 0
+        for n in range(covered, loan['duration_months']):
+            due_date = start + relativedelta(months=n)
+            if due_date > end_date:
+                break
+            if due_date >= start_date:
+                due.append((loan['loan_id'], n + 1, due_date))
+    return due
+
+
+def timed(fn, *args):
+    """Result and seconds taken by one call"""
+    start = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - start
+
+
+def main():
+    start_date = date.today().replace(day=1)
+    end_date = start_date + relativedelta(months=1, days=-1)
+
+    print(f"{'loans':>8} {'due':>7} {'schedule (s)':>13} {'legacy (s)':>11} {'repayment (ms)':>15}")
+    for count in LOANS:
+        path = build_database(scratch_path('loan_schedule'), members=MEMBERS, loans=count)
+        db = DatabaseManager(path)
+
+        due, schedule_s = timed(db.get_installments_due,
+                                start_date.isoformat(), end_date.isoformat())
+        _, legacy_s = timed(due_legacy, db, start_date, end_date)
+
+        loan_id = due[0]['loan_id']
+        _, repay_s = timed(db.record_loan_repayment, loan_id, due[0]['amount_outstanding'],
+                           {'payment_date': start_date.isoformat()}, 'bench')
+
+        print(f"{count:>8,} {len(due):>7,} {schedule_s:13.3f} {legacy_s:11.2f} {repay_s * 1000:15.1f}")
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
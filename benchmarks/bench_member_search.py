@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Benchmark - Member search
+=========================
+Compares the old leading-wildcard LIKE search with the members_fts
+full-text search behind DatabaseManager.search_members at 100k members.
+
+Usage:
+    python benchmarks/bench_member_search.py
+"""
+
+import time
+
+from synthetic import build_database, scratch_path
+
+from database.db_manager import DatabaseManager
+
+MEMBERS = 100_000
+QUERIES = ['musa', 'SYN0500', 'first1234', 'last42', 'last42 first', '0800001', 'member77']
+REPEATS = 20
+
+
+def legacy_search(db, term):
+    """The LIKE query search_members used to run"""
+    like = f"%{term}%"
+    return db.fetchall("""
+        SELECT * FROM members
+        WHERE (
+            member_id LIKE ?
+            OR first_name LIKE ?
+            OR middle_name LIKE ?
+            OR last_name LIKE ?
+            OR (first_name || ' ' || COALESCE(middle_name, '') || ' ' || last_name) LIKE ?
+        )
+        ORDER BY member_id
+    """, (like, like, like, like, like))
+
+
+def best_of(fn, repeats=REPEATS):
+    """Best wall-clock time in milliseconds"""
+    best = float('inf')
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main():
+    path = build_database(scratch_path('search'), members=MEMBERS)
+    db = DatabaseManager(path)
+    total = db.fetchone("SELECT COUNT(*) AS n FROM members")['n']
+    print(f"{total:,} members")
+    print(f"{'query':>14} {'hits':>6} {'fts (ms)':>10} {'like (ms)':>11}")
+    for term in QUERIES:
+        hits = len(db.search_members(term))
+        fts_ms = best_of(lambda: db.search_members(term))
+        like_ms = best_of(lambda: legacy_search(db, term), repeats=3)
+        print(f"{term:>14} {hits:>6} {fts_ms:10.3f} {like_ms:11.1f}")
+    db.close()
+
+
+if __name__ == "__main__":
+    main()
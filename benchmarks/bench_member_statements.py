@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Benchmark - Month-end member statements
+=======================================
+Generates a month of statements for every active member with the batch
+ReportGenerator.generate_member_statements_pdf (set-based fetch, process
+pool) and, for a sample, with one generate_member_statement_pdf call per
+member, extrapolated to all members.
+
+Usage:
+    python benchmarks/bench_member_statements.py
+"""
+
+import os
+import tempfile
+import time
+from datetime import date, timedelta
+
+from synthetic import build_database, scratch_path
+
+from database.db_manager import DatabaseManager
+from reports.report_generator import ReportGenerator
+
+MEMBERS = [1_000, 5_000]
+TRANSACTIONS_PER_MEMBER = 40
+SERIAL_SAMPLE = 100
+
+
+def main():
+    end_date = date.today().isoformat()
+    start_date = (date.today() - timedelta(days=30)).isoformat()
+
+    print(f"{'members':>8} {'workers':>8} {'batch (s)':>10} {'serial est. (s)':>16}")
+    for count in MEMBERS:
+        path = build_database(scratch_path('statements'), members=count,
+                              transactions=count * TRANSACTIONS_PER_MEMBER)
+        db = DatabaseManager(path)
+        reports = ReportGenerator(db)
+        reports.reports_dir = tempfile.mkdtemp(prefix='nfc_statements_')
+        members = [m['member_id'] for m in db.get_all_members()]
+
+        start = time.perf_counter()
+        reports.generate_member_statements_pdf(start_date, end_date)
+        batch_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for member_id in members[:SERIAL_SAMPLE]:
+            reports.generate_member_statement_pdf(member_id, start_date, end_date)
+        serial_s = (time.perf_counter() - start) * len(members) / SERIAL_SAMPLE
+
+        print(f"{len(members):>8,} {os.cpu_count():>8} {batch_s:10.1f} {serial_s:16.1f}")
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Benchmark - Payroll batch posting
+=================================
+Posts a month of payroll deductions (half savings deposits, half loan
+repayments) through DatabaseManager.post_batch, and a sample of the same
+lines through the one-at-a-time deposit_to_savings / record_loan_repayment
+calls, extrapolated to the full batch.
+
+Usage:
+    python benchmarks/bench_post_batch.py
+"""
+
+import time
+
+from synthetic import build_database, scratch_path
+
+from database.db_manager import DatabaseManager
+
+MEMBERS = 50_000
+LOANS = 60_000
+BATCH_SIZES = [1_000, 10_000, 50_000]
+LEGACY_SAMPLE = 1_000
+
+
+def payroll_entries(db, count):
+    """Alternate savings and loan lines over existing accounts and active loans"""
+    accounts = db.fetchall(
+        "SELECT account_number FROM savings_accounts WHERE is_active = 1 LIMIT ?", (count,)
+    )
+    loans = db.fetchall(
+        "SELECT loan_id, loan_number FROM loans WHERE status = 'Active' LIMIT ?", (count,)
+    )
+    entries = []
+    for i in range(count):
+        if i % 2 == 0:
+            entries.append({'entry_type': 'Savings', 'amount': 5000.0,
+                            'reference': accounts[(i // 2) % len(accounts)]['account_number']})
+        else:
+            loan = loans[(i // 2) % len(loans)]
+            entries.append({'entry_type': 'Loan', 'amount': 2500.0,
+                            'reference': loan['loan_number'], 'loan_id': loan['loan_id']})
+    return entries
+
+
+def post_legacy(db, entries):
+    """The per-line calls the modules use, one commit each"""
+    accounts = {row['account_number']: row['account_id'] for row in db.fetchall(
+        "SELECT account_id, account_number FROM savings_accounts"
+    )}
+    for entry in entries:
+        data = {'payment_method': 'Payroll'}
+        if entry['entry_type'] == 'Savings':
+            db.deposit_to_savings(accounts[entry['reference']], entry['amount'], data, 'bench')
+        else:
+            db.record_loan_repayment(entry['loan_id'], entry['amount'], data, 'bench')
+
+
+def main():
+    print(f"{'lines':>7} {'post_batch (s)':>15} {'legacy est. (s)':>16}")
+    for size in BATCH_SIZES:
+        path = build_database(scratch_path('post_batch'), members=MEMBERS, loans=LOANS)
+        db = DatabaseManager(path)
+        entries = payroll_entries(db, size)
+
+        start = time.perf_counter()
+        db.post_batch(entries, 'bench')
+        batch_s = time.perf_counter() - start
+
+        sample = entries[:LEGACY_SAMPLE]
+        start = time.perf_counter()
+        post_legacy(db, sample)
+        legacy_s = (time.perf_counter() - start) * size / len(sample)
+
+        print(f"{size:>7,} {batch_s:15.2f} {legacy_s:16.1f}")
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Benchmark - Query plans before and after the composite indexes
+==============================================================
+Builds the same synthetic database with and without
+migrations/add_composite_indexes.sql, prints EXPLAIN QUERY PLAN for the
+member-level lookups it targets and times each one.
+
+Usage:
+    python benchmarks/bench_query_plans.py
+"""
+
+import time
+
+from synthetic import MIGRATIONS, build_database, scratch_path
+
+from database.queries import QUERIES
+
+MEMBERS = 50_000
+LOANS = 300_000
+TRANSACTIONS = 2_000_000
+REPEATS = 200
+
+CHECKS = [
+    ('transactions.list_member_from_to', ('SYN000123', '2024-01-01', '2025-12-31')),
+    ('loans.member_active', ('SYN000123',)),
+    ('savings.member_accounts', ('SYN000123',)),
+    ('member_balances.refresh_member', ('SYN000123',)),
+    ('station members', ('S0001',)),
+]
+
+STATION_MEMBERS = "SELECT * FROM members WHERE station_id = ? ORDER BY member_id"
+
+
+def plan(conn, sql, params):
+    """EXPLAIN QUERY PLAN details, one string per step"""
+    return [row[3] for row in conn.execute("EXPLAIN QUERY PLAN " + sql, params)]
+
+
+def time_ms(conn, sql, params):
+    """Mean milliseconds per run, inside a transaction that is rolled back"""
+    start = time.perf_counter()
+    for _ in range(REPEATS):
+        conn.execute(sql, params).fetchall()
+    elapsed = (time.perf_counter() - start) * 1000 / REPEATS
+    conn.rollback()
+    return elapsed
+
+
+def main():
+    import sqlite3
+
+    variants = [
+        ('before', MIGRATIONS[:MIGRATIONS.index('add_composite_indexes.sql')]),
+        ('after', MIGRATIONS),
+    ]
+    results = {}
+    for label, migrations in variants:
+        path = build_database(scratch_path(f'plans_{label}'), stations=20, members=MEMBERS,
+                              loans=LOANS, transactions=TRANSACTIONS, migrations=migrations)
+        conn = sqlite3.connect(path)
+        for name, params in CHECKS:
+            sql = STATION_MEMBERS if name == 'station members' else QUERIES[name]
+            results[(label, name)] = (plan(conn, sql, params), time_ms(conn, sql, params))
+        conn.close()
+
+    for name, _ in CHECKS:
+        print(name)
+        for label, _ in variants:
+            steps, ms = results[(label, name)]
+            print(f"  {label:<7} {ms:8.3f} ms")
+            for step in steps:
+                print(f"           {step}")
+        print()
+
+
+if __name__ == "__main__":
+    main()
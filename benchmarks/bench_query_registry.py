@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Benchmark - Named queries and the statement cache
+=================================================
+Runs a mixed lookup workload (member, savings, loans, ledger, settings)
+through DatabaseManager with sqlite3's statement cache disabled and sized
+by queries.STATEMENT_CACHE_SIZE, then prints the per-query counters.
+
+Usage:
+    python benchmarks/bench_query_registry.py
+"""
+
+import time
+
+from synthetic import build_database, scratch_path
+
+from database import queries
+from database.db_manager import DatabaseManager
+
+MEMBERS = 20_000
+LOANS = 60_000
+TRANSACTIONS = 200_000
+LOOKUPS = 5_000
+
+
+def workload(db, member_ids):
+    """Per-member screens as the Loans/Savings/Transactions modules load them"""
+    for i in range(LOOKUPS):
+        member_id = member_ids[i % len(member_ids)]
+        db.get_member(member_id)
+        db.get_member_savings_accounts(member_id)
+        db.get_member_loans(member_id)
+        db.get_transactions(member_id, '2024-01-01', '2030-12-31')
+        db.get_setting('next_member_number')
+
+
+def main():
+    path = build_database(scratch_path('registry'), members=MEMBERS, loans=LOANS,
+                          transactions=TRANSACTIONS)
+
+    print(f"{'statement cache':>16} {'workload (s)':>13}")
+    for size in (0, queries.STATEMENT_CACHE_SIZE):
+        queries.STATEMENT_CACHE_SIZE = size
+        db = DatabaseManager(path)
+        member_ids = [m['member_id'] for m in db.get_all_members()]
+        queries.reset_stats()
+
+        start = time.perf_counter()
+        workload(db, member_ids)
+        print(f"{size:>16} {time.perf_counter() - start:13.2f}")
+        db.close()
+
+    print()
+    print(f"{'query':<34} {'calls':>7} {'total (ms)':>11} {'mean (ms)':>10} {'rows':>8}")
+    for name, stats in queries.query_stats():
+        print(f"{name:<34} {stats.calls:>7,} {stats.total_time * 1000:11.1f} "
+              f"{stats.mean_ms:10.3f} {stats.rows:>8,}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Benchmark - Report cache
+========================
+Runs the cashbook, member summary and loan portfolio reports three times:
+cold, again with nothing changed (served from the report cache), and
+after one new transaction (rebuilt).
+
+Usage:
+    python benchmarks/bench_report_cache.py
+"""
+
+import tempfile
+import time
+from datetime import date, timedelta
+
+from synthetic import build_database, scratch_path
+
+from database.db_manager import DatabaseManager
+from reports.report_generator import ReportGenerator
+
+MEMBERS = 5_000
+LOANS = 20_000
+TRANSACTIONS = 100_000
+
+
+def timed(fn, *args):
+    """Seconds taken by one call"""
+    start = time.perf_counter()
+    fn(*args)
+    return time.perf_counter() - start
+
+
+def main():
+    end_date = date.today().isoformat()
+    start_date = (date.today() - timedelta(days=365)).isoformat()
+
+    path = build_database(scratch_path('report_cache'), members=MEMBERS, loans=LOANS,
+                          transactions=TRANSACTIONS)
+    db = DatabaseManager(path)
+    reports = ReportGenerator(db)
+    reports.reports_dir = tempfile.mkdtemp(prefix='nfc_report_cache_')
+    member_id = db.get_all_members()[0]['member_id']
+
+    runs = [
+        ('cashbook', reports.generate_cashbook_pdf, (start_date, end_date)),
+        ('member summary', reports.generate_member_summary_excel, (start_date, end_date)),
+        ('loan portfolio', reports.generate_loan_portfolio_excel, ()),
+    ]
+
+    cold = [timed(fn, *args) for _, fn, args in runs]
+    warm = [timed(fn, *args) for _, fn, args in runs]
+    with db.transaction():
+        db.record_transaction(member_id, 'Deposit', 'Savings', None, 1000.0, True,
+                              {'payment_method': 'Cash'}, 'bench')
+    changed = [timed(fn, *args) for _, fn, args in runs]
+
+    print(f"{'report':>15} {'cold (s)':>9} {'cached (s)':>11} {'after change (s)':>17}")
+    for (name, _, _), c, w, a in zip(runs, cold, warm, changed):
+        print(f"{name:>15} {c:9.2f} {w:11.4f} {a:17.2f}")
+    db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Benchmark - Per-station statistics
+==================================
+Compares the old three-queries-per-station loop in StationsModule with
+DatabaseManager.get_station_stats_bulk for 3, 100 and 1,000 stations.
+
+Usage:
+    python benchmarks/bench_station_stats.py
+"""
+
+import time
+
+from synthetic import build_database, scratch_path
+
+from database.db_manager import DatabaseManager
+
+STATION_COUNTS = [3, 100, 1000]   # 3 = the shipped stations only
+MEMBERS = 50_000
+LOANS = 200_000
+REPEATS = 5
+
+
+def legacy_station_stats(db, station_id):
+    """The per-station queries StationsModule used to run"""
+    members = db.fetchall("SELECT is_active FROM members WHERE station_id = ?", (station_id,))
+    savings = db.fetchone("""
+        SELECT COALESCE(SUM(sa.current_balance), 0) as total_savings
+        FROM savings_accounts sa
+        JOIN members m ON sa.member_id = m.member_id
+        WHERE m.station_id = ?
+    """, (station_id,))
+    loans = db.fetchone("""
+        SELECT COALESCE(SUM(l.balance_outstanding), 0) as total_loans_amount
+        FROM loans l
+        JOIN members m ON l.member_id = m.member_id
+        WHERE m.station_id = ? AND l.status = 'Active'
+    """, (station_id,))
+    return {
+        'total_members': len(members),
+        'active_members': sum(1 for m in members if m['is_active']),
+        'total_savings': savings['total_savings'],
+        'total_loans_amount': loans['total_loans_amount'],
+    }
+
+
+def best_of(fn, repeats=REPEATS):
+    """Best wall-clock time in milliseconds"""
+    best = float('inf')
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main():
+    print(f"{'stations':>9} {'bulk (ms)':>11} {'legacy (ms)':>13}")
+    for count in STATION_COUNTS:
+        path = build_database(scratch_path('stations'), stations=count - 3,
+                              members=MEMBERS, loans=LOANS)
+        db = DatabaseManager(path)
+        stations = db.get_all_stations(enabled_only=False)
+
+        bulk_ms = best_of(db.get_station_stats_bulk)
+        legacy_ms = best_of(
+            lambda: [legacy_station_stats(db, s['station_id']) for s in stations], repeats=1
+        )
+
+        print(f"{len(stations):>9,} {bulk_ms:11.1f} {legacy_ms:13.1f}")
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
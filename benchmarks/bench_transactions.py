@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+Benchmark - Commit batching
+===========================
+Runs the same savings deposits with one commit each and grouped inside a
+single DatabaseManager.transaction() block.
+
+Usage:
+    python benchmarks/bench_transactions.py
+"""
+
+import time
+
+from synthetic import build_database, scratch_path
+
+from database.db_manager import DatabaseManager
+
+DEPOSITS = [100, 1_000, 5_000]
+
+
+def run_deposits(db, accounts, count):
+    """Deposit into accounts round-robin through the public API"""
+    for i in range(count):
+        db.deposit_to_savings(accounts[i % len(accounts)], 100.0,
+                              {'payment_method': 'Cash'}, 'bench')
+
+
+def main():
+    path = build_database(scratch_path('transactions'))
+    db = DatabaseManager(path)
+    accounts = [row['account_id'] for row in db.fetchall(
+        "SELECT account_id FROM savings_accounts WHERE is_active = 1"
+    )]
+
+    print(f"{'deposits':>9} {'commit each (s)':>16} {'one transaction (s)':>20}")
+    for count in DEPOSITS:
+        start = time.perf_counter()
+        run_deposits(db, accounts, count)
+        each_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        with db.transaction():
+            run_deposits(db, accounts, count)
+        batched_s = time.perf_counter() - start
+
+        print(f"{count:>9,} {each_s:16.2f} {batched_s:20.2f}")
+    db.close()
+
+
+if __name__ == "__main__":
+    main()
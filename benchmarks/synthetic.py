@@ -0,0 +1,205 @@
+"""
+Synthetic Data - Scale up a copy of the shipped database for benchmarks
+=======================================================================
+Copies data/nfc_cooperative.db to a scratch location, applies the schema
+migrations and pads the tables with generated rows so the benchmark
+scripts can measure how costs grow with data volume.
+"""
+
+import os
+import shutil
+import sqlite3
+import sys
+import tempfile
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SOURCE_DB = os.path.join(PROJECT_DIR, 'data', 'nfc_cooperative.db')
+
+sys.path.insert(0, os.path.join(PROJECT_DIR, 'src'))
+
+from database.migration_runner import MIGRATIONS as SCHEMA_MIGRATIONS, MigrationRunner
+
+# Migrations the application code expects, in order
+MIGRATIONS = [m.filename for m in SCHEMA_MIGRATIONS]
+
+
+def scratch_path(name: str) -> str:
+    """Path for a throwaway benchmark database"""
+    return os.path.join(tempfile.gettempdir(), f"nfc_bench_{name}.db")
+
+
+def build_database(path: str, stations: int = 0, members: int = 0,
+                   loans: int = 0, transactions: int = 0, repayments: int = 0,
+                   migrations=MIGRATIONS) -> str:
+    """Create a migrated copy of the shipped database padded with synthetic rows"""
+    for suffix in ('', '-wal', '-shm'):
+        if os.path.exists(path + suffix):
+            os.remove(path + suffix)
+    shutil.copyfile(SOURCE_DB, path)
+
+    runner = MigrationRunner(path)
+    runner.apply_pending(migrations)
+    runner.close()
+
+    conn = sqlite3.connect(path)
+
+    if stations:
+        add_stations(conn, stations)
+    if members:
+        add_members(conn, members)
+    if loans:
+        add_loans(conn, loans)
+    if transactions:
+        add_transactions(conn, transactions)
+    if repayments:
+        add_repayments(conn, repayments)
+
+    if loans and 'add_loan_schedule.sql' in migrations:
+        from database.queries import LOAN_SCHEDULE_BACKFILL, QUERIES
+        conn.execute(LOAN_SCHEDULE_BACKFILL)
+        conn.execute(QUERIES['loan_schedule.allocate_all'])
+
+    if 'add_member_balances.sql' in migrations:
+        from database.queries import MEMBER_BALANCE_REFRESH
+        conn.execute(MEMBER_BALANCE_REFRESH)
+
+    conn.commit()
+    conn.execute("ANALYZE")
+    conn.close()
+    return path
+
+
+def add_stations(conn: sqlite3.Connection, count: int):
+    """Add synthetic stations S0001..."""
+    conn.execute("""
+        WITH RECURSIVE seq(n) AS (SELECT 1 UNION ALL SELECT n + 1 FROM seq WHERE n < ?)
+        INSERT INTO stations (station_id, station_name, address, city, enabled)
+        SELECT printf('S%04d', n), printf('NFC - Bench %d', n), 'Bench', 'Bench', 1
+        FROM seq
+    """, (count,))
+
+
+def add_members(conn: sqlite3.Connection, count: int):
+    """Add synthetic members spread over all stations, each with savings accounts"""
+    conn.execute("DROP TABLE IF EXISTS temp.bench_stations")
+    conn.execute("""
+        CREATE TEMP TABLE bench_stations AS
+        SELECT ROW_NUMBER() OVER (ORDER BY station_id) - 1 AS idx, station_id
+        FROM stations
+    """)
+    conn.execute("CREATE INDEX temp.idx_bench_stations ON bench_stations(idx)")
+    station_count = conn.execute("SELECT COUNT(*) FROM temp.bench_stations").fetchone()[0]
+    conn.execute("""
+        WITH RECURSIVE seq(n) AS (SELECT 1 UNION ALL SELECT n + 1 FROM seq WHERE n < ?)
+        INSERT INTO members (
+            member_id, station_id, registration_number, first_name, middle_name,
+            last_name, gender, date_joined, phone_number, email, employee_id,
+            is_active, is_deceased
+        )
+        SELECT
+            printf('SYN%06d', n), bs.station_id, printf('SYN%06d', n),
+            printf('FIRST%d', n), CASE WHEN n % 2 = 0 THEN printf('MIDDLE%d', n) END,
+            printf('LAST%d', n % 5000), CASE WHEN n % 2 = 0 THEN 'Male' ELSE 'Female' END,
+            date('2015-01-01', '+' || (n % 3650) || ' days'),
+            printf('080%08d', n), printf('member%d@example.com', n), printf('EMP%06d', n),
+            CASE WHEN n % 10 = 0 THEN 0 ELSE 1 END, CASE WHEN n % 97 = 0 THEN 1 ELSE 0 END
+        FROM seq
+        CROSS JOIN temp.bench_stations bs ON bs.idx = n % ?
+    """, (count, station_count))
+    conn.execute("""
+        INSERT INTO savings_accounts (
+            member_id, savings_type_id, account_number, current_balance, total_deposits
+        )
+        SELECT m.member_id, st.savings_type_id,
+               m.member_id || '-' || substr(upper(st.type_code), 1, 4),
+               (abs(random()) % 500000) + 1000, (abs(random()) % 500000) + 1000
+        FROM members m
+        JOIN savings_types st ON st.type_code IN ('PREMIUM', 'SHARES')
+        WHERE m.member_id LIKE 'SYN%'
+    """)
+
+
+def add_loans(conn: sqlite3.Connection, count: int):
+    """Add synthetic loans for existing members"""
+    conn.execute("DROP TABLE IF EXISTS temp.bench_members")
+    conn.execute("""
+        CREATE TEMP TABLE bench_members AS
+        SELECT ROW_NUMBER() OVER (ORDER BY member_id) - 1 AS idx, member_id, station_id
+        FROM members
+    """)
+    conn.execute("CREATE INDEX temp.idx_bench_members ON bench_members(idx)")
+    member_count = conn.execute("SELECT COUNT(*) FROM temp.bench_members").fetchone()[0]
+    conn.execute("""
+        WITH RECURSIVE seq(n) AS (SELECT 1 UNION ALL SELECT n + 1 FROM seq WHERE n < ?),
+        base AS (
+            SELECT n, (abs(random()) % 490000) + 10000 AS principal,
+                   (n % 7) + 1 AS loan_type_id, (n % 24) + 1 AS duration
+            FROM seq
+        )
+        INSERT INTO loans (
+            member_id, station_id, loan_type_id, loan_number,
+            principal_amount, interest_rate, interest_amount, total_amount,
+            monthly_installment, duration_months, amount_paid, balance_outstanding,
+            disbursement_date, start_date, end_date, status
+        )
+        SELECT
+            bm.member_id, bm.station_id, b.loan_type_id, printf('SYN-L-%08d', b.n),
+            b.principal, 10, b.principal * 0.1, b.principal * 1.1,
+            b.principal * 1.1 / b.duration, b.duration,
+            CASE WHEN b.n % 3 = 0 THEN b.principal * 1.1 ELSE (b.n % 5) * b.principal * 1.1 / b.duration END,
+            CASE WHEN b.n % 3 = 0 THEN 0 ELSE b.principal * 1.1 - (b.n % 5) * b.principal * 1.1 / b.duration END,
+            date('2023-01-01', '+' || (b.n % 1000) || ' days'),
+            date('2023-02-01', '+' || (b.n % 1000) || ' days'),
+            date('2023-02-01', '+' || (b.n % 1000) || ' days', '+' || b.duration || ' months'),
+            CASE WHEN b.n % 3 = 0 THEN 'Completed' ELSE 'Active' END
+        FROM base b
+        CROSS JOIN temp.bench_members bm ON bm.idx = b.n % ?
+    """, (count, member_count))
+
+
+def add_transactions(conn: sqlite3.Connection, count: int):
+    """Add synthetic ledger rows spread over the last three years"""
+    conn.execute("DROP TABLE IF EXISTS temp.bench_members")
+    conn.execute("""
+        CREATE TEMP TABLE bench_members AS
+        SELECT ROW_NUMBER() OVER (ORDER BY member_id) - 1 AS idx, member_id, station_id
+        FROM members
+    """)
+    conn.execute("CREATE INDEX temp.idx_bench_members ON bench_members(idx)")
+    member_count = conn.execute("SELECT COUNT(*) FROM temp.bench_members").fetchone()[0]
+    conn.execute("""
+        WITH RECURSIVE seq(n) AS (SELECT 1 UNION ALL SELECT n + 1 FROM seq WHERE n < ?)
+        INSERT INTO transactions (
+            transaction_date, member_id, station_id, transaction_type, account_type,
+            account_id, description, amount, is_credit, payment_method, receipt_number
+        )
+        SELECT
+            date('now', '-' || (n % 1095) || ' days'), bm.member_id, bm.station_id,
+            CASE n % 4 WHEN 0 THEN 'Savings Deposit' WHEN 1 THEN 'Savings Withdrawal'
+                       WHEN 2 THEN 'Loan Repayment' ELSE 'Loan Disbursement' END,
+            CASE WHEN n % 4 < 2 THEN 'Savings' ELSE 'Loan' END,
+            CAST(n AS TEXT), 'Synthetic', (abs(random()) % 100000) + 100,
+            CASE WHEN n % 4 IN (0, 3) THEN 1 ELSE 0 END,
+            CASE n % 3 WHEN 0 THEN 'Cash' WHEN 1 THEN 'Cheque' ELSE 'Transfer' END,
+            printf('SYN-R-%08d', n)
+        FROM seq
+        CROSS JOIN temp.bench_members bm ON bm.idx = n % ?
+    """, (count, member_count))
+
+
+def add_repayments(conn: sqlite3.Connection, count: int):
+    """Add synthetic repayment rows spread over existing loans and the last two years"""
+    loan_count = conn.execute("SELECT COUNT(*) FROM loans").fetchone()[0]
+    for round_number in range(-(-count // loan_count) if loan_count else 0):
+        conn.execute("""
+            INSERT INTO loan_repayments (
+                loan_id, member_id, payment_date, expected_amount, actual_amount,
+                balance_before, balance_after, payment_method, receipt_number
+            )
+            SELECT
+                loan_id, member_id, date('now', '-' || ((loan_id * 7 + ? * 31) % 730) || ' days'),
+                monthly_installment, ROUND(monthly_installment * (0.5 + ((loan_id + ?) % 6) * 0.2), 2),
+                0, 0, 'Cash', printf('SYN-P-%d-%08d', ?, loan_id)
+            FROM loans
+            LIMIT ?
+        """, (round_number, round_number, round_number, count - round_number * loan_count))
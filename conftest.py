@@ -0,0 +1,93 @@
+"""
+Shared pytest fixtures
+======================
+Tests run against a migrated copy of data/nfc_cooperative.db, so they see
+the same schema and reference data (savings types, loan types, settings)
+as the application. The migrations are applied once per session; each test
+gets its own copy of the result.
+"""
+
+import os
+import shutil
+import sys
+
+import pytest
+
+PROJECT_DIR = os.path.dirname(os.path.abspath(__file__))
+SOURCE_DB = os.path.join(PROJECT_DIR, 'data', 'nfc_cooperative.db')
+
+sys.path.insert(0, os.path.join(PROJECT_DIR, 'src'))
+
+from database.db_manager import DatabaseManager
+from database.migration_runner import MigrationRunner
+
+
+@pytest.fixture(scope='session')
+def migrated_db_path(tmp_path_factory):
+    """A copy of the shipped database with every migration applied"""
+    path = str(tmp_path_factory.mktemp('template') / 'nfc_cooperative.db')
+    shutil.copyfile(SOURCE_DB, path)
+    runner = MigrationRunner(path)
+    try:
+        runner.apply_pending()
+    finally:
+        runner.close()
+    return path
+
+
+@pytest.fixture
+def db_path(migrated_db_path, tmp_path):
+    """A private copy of the migrated database for one test"""
+    path = str(tmp_path / 'nfc_cooperative.db')
+    shutil.copyfile(migrated_db_path, path)
+    return path
+
+
+@pytest.fixture
+def db(db_path):
+    """DatabaseManager on the test's own database"""
+    manager = DatabaseManager(db_path)
+    yield manager
+    manager.close()
+
+
+@pytest.fixture
+def add_member(db):
+    """Factory for active members with a premium savings account
+
+    Returns (member_id, premium account number).
+    """
+    def factory(first_name='Test', last_name='Member', premium_balance=0.0):
+        member_id = db.add_member({
+            'station_id': '01',
+            'first_name': first_name,
+            'last_name': last_name,
+            'gender': 'Female',
+            'date_joined': '2020-01-01',
+        }, 'pytest')
+        account_id = db.create_savings_account(member_id, 1)
+        if premium_balance:
+            db.deposit_to_savings(account_id, premium_balance,
+                                  {'transaction_date': '2020-01-01'}, 'pytest')
+        return member_id, f"{member_id}-PREM"
+    return factory
+
+
+@pytest.fixture
+def add_loan(db, add_member):
+    """Factory for loans of a new member; returns the loan row"""
+    def factory(principal=1000.0, interest_rate=20.0, duration=4, start_date='2026-01-15'):
+        member_id, _ = add_member()
+        loan_id = db.disburse_loan({
+            'member_id': member_id,
+            'station_id': '01',
+            'loan_type_id': 1,
+            'principal_amount': principal,
+            'interest_rate': interest_rate,
+            'duration_months': duration,
+            'disbursement_date': start_date,
+            'start_date': start_date,
+            'end_date': start_date,
+        }, 'pytest')
+        return db.query_one('loans.get', (loan_id,))
+    return factory
@@ -21,6 +21,7 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 from gui.login_window import LoginWindow
 from gui.main_window import MainWindow
 from database.db_manager import DatabaseManager
+from database.migration_runner import MigrationRunner
 
 class NFCCooperativeApp(QApplication):
     """Main application class"""
@@ -265,6 +266,13 @@ class NFCCooperativeApp(QApplication):
                 )
                 sys.exit(1)
             
+            # Bring the schema up to date before anything queries it
+            runner = MigrationRunner(db_path)
+            try:
+                runner.apply_pending()
+            finally:
+                runner.close()
+            
             self.db_manager = DatabaseManager(db_path)
             
         except Exception as e:
@@ -286,6 +294,49 @@ class NFCCooperativeApp(QApplication):
         # Show main window
         self.main_window = MainWindow(self)
         self.main_window.show()
+        
+        if user_data['can_operate']:
+            self.post_due_interest()
+    
+    def post_due_interest(self):
+        """Offer to post each ended month of savings interest not posted yet
+
+        Only when auto-calculation is on, and only after the operator has
+        seen the month's totals and confirmed them.
+        """
+        from PyQt6.QtWidgets import QMessageBox
+        if self.db_manager.get_setting('interest_auto_calculate') != '1':
+            return
+        
+        try:
+            # One month at a time, oldest first, until none is due or the operator stops
+            while True:
+                period = self.db_manager.get_due_interest_period()
+                if not period:
+                    return
+                preview = self.db_manager.post_monthly_interest(
+                    period, self.current_user['username'], dry_run=True
+                )
+                reply = QMessageBox.question(
+                    self.main_window,
+                    "Interest Posting",
+                    f"Savings interest for {period} has not been posted yet.\n\n"
+                    f"Posting date: {preview['posting_date']}\n"
+                    f"Accounts to credit: {preview['accounts']:,}\n"
+                    f"Members: {preview['members']:,}\n"
+                    f"Total interest: ₦{preview['total_interest']:,.2f}\n\n"
+                    f"Post it now?",
+                    QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
+                )
+                if reply != QMessageBox.StandardButton.Yes:
+                    return
+                self.db_manager.post_monthly_interest(period, self.current_user['username'])
+        except Exception as e:
+            QMessageBox.warning(
+                self.main_window,
+                "Interest Posting",
+                f"Monthly interest could not be posted:\n{str(e)}"
+            )
 
 
 def main():
@@ -0,0 +1,11 @@
+-- Cashbook Index Migration Script
+-- Lets the cashbook read one payment method's ledger rows in date order
+-- Run this before using the updated application
+
+-- Cashbook pages and the opening balance (transactions.cashbook*).
+-- transaction_id is the rowid and already ends every index key, so the
+-- ORDER BY transaction_date, transaction_id needs no sort.
+CREATE INDEX IF NOT EXISTS idx_transactions_method_date
+    ON transactions(payment_method, transaction_date);
+
+ANALYZE transactions;
@@ -0,0 +1,32 @@
+-- Composite Indexes Migration Script
+-- Replaces single-column indexes with composite ones that match how the
+-- application filters and sorts
+-- Run this before using the updated application
+
+-- Ledger by member and date range, newest first (get_transactions,
+-- member statements). transaction_id is the rowid, which SQLite appends to
+-- every index key, so ORDER BY transaction_date, transaction_id is
+-- satisfied by the index without listing it.
+CREATE INDEX IF NOT EXISTS idx_transactions_member_date
+    ON transactions(member_id, transaction_date);
+DROP INDEX IF EXISTS idx_transactions_member;
+
+-- A member's loans by status, newest first (get_member_loans), and the
+-- active-loan totals in member_balances
+CREATE INDEX IF NOT EXISTS idx_loans_member_status
+    ON loans(member_id, status, created_date);
+DROP INDEX IF EXISTS idx_loans_member;
+
+-- A member's open savings accounts (get_member_savings_accounts and the
+-- member_balances savings totals)
+CREATE INDEX IF NOT EXISTS idx_savings_member_active
+    ON savings_accounts(member_id, is_active);
+DROP INDEX IF EXISTS idx_savings_member;
+
+-- Station member lists, already in member order
+CREATE INDEX IF NOT EXISTS idx_members_station_member
+    ON members(station_id, member_id);
+DROP INDEX IF EXISTS idx_members_station;
+
+-- Refresh planner statistics for the new indexes
+ANALYZE;
@@ -0,0 +1,16 @@
+-- Death Benefit Indexes Migration Script
+-- Supports the set-based death benefit levy
+-- Run this before using the updated application
+
+-- A member's death is processed once; the unique key is what stops a
+-- second levy for the same deceased member
+CREATE UNIQUE INDEX IF NOT EXISTS idx_death_benefits_deceased
+    ON death_benefits(deceased_member_id);
+
+-- Every levy adds one charge per active member; read back per benefit
+-- (the levy summary) and per member (their statement)
+CREATE INDEX IF NOT EXISTS idx_death_benefit_charges_benefit
+    ON death_benefit_charges(benefit_id);
+
+CREATE INDEX IF NOT EXISTS idx_death_benefit_charges_member
+    ON death_benefit_charges(member_id);
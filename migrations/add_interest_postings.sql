@@ -0,0 +1,14 @@
+-- Interest Postings Migration Script
+-- Records each month of savings interest that has been posted
+-- Run this before using the updated application
+
+-- One row per posted month ('YYYY-MM'); the primary key is what stops a
+-- month from being credited twice
+CREATE TABLE IF NOT EXISTS interest_postings (
+    period TEXT PRIMARY KEY,
+    posting_date TEXT NOT NULL,
+    accounts INTEGER NOT NULL,
+    total_interest DECIMAL(15,2) NOT NULL,
+    posted_date TEXT DEFAULT (datetime('now')),
+    created_by TEXT
+);
@@ -0,0 +1,45 @@
+-- Loan Arrears Migration Script
+-- Snapshot of every open loan's arrears, rebuilt by the arrears job
+-- Run this before using the updated application
+
+-- One row per open (Active or Defaulted) loan as at the last run, read
+-- from loan_schedule: installments due before as_of and not fully paid
+CREATE TABLE IF NOT EXISTS loan_arrears (
+    loan_id INTEGER PRIMARY KEY,
+    member_id TEXT NOT NULL,
+    station_id TEXT NOT NULL,
+    as_of TEXT NOT NULL,
+    oldest_due_date TEXT,
+    days_past_due INTEGER NOT NULL DEFAULT 0,
+    installments_overdue INTEGER NOT NULL DEFAULT 0,
+    arrears_amount DECIMAL(15,2) NOT NULL DEFAULT 0.00,
+    balance_outstanding DECIMAL(15,2) NOT NULL,
+    FOREIGN KEY (loan_id) REFERENCES loans(loan_id)
+);
+
+-- Delinquency lists and the default/cure status flips (days_past_due >= ?)
+CREATE INDEX IF NOT EXISTS idx_loan_arrears_days
+    ON loan_arrears(days_past_due);
+
+CREATE INDEX IF NOT EXISTS idx_loan_arrears_member
+    ON loan_arrears(member_id);
+
+-- One row per run of the arrears job with its per-step timings
+CREATE TABLE IF NOT EXISTS arrears_runs (
+    run_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    as_of TEXT NOT NULL,
+    default_days INTEGER NOT NULL,
+    loans_checked INTEGER NOT NULL,
+    loans_in_arrears INTEGER NOT NULL,
+    total_arrears DECIMAL(15,2) NOT NULL,
+    loans_defaulted INTEGER NOT NULL,
+    loans_cured INTEGER NOT NULL,
+    timings TEXT,                     -- JSON: step -> seconds
+    total_seconds REAL,
+    run_date TEXT DEFAULT (datetime('now')),
+    created_by TEXT
+);
+
+-- Days past due at which an active loan is marked Defaulted
+INSERT OR IGNORE INTO system_settings (setting_key, setting_value, setting_type, description)
+VALUES ('loan_default_days', '90', 'Integer', 'Days past due before a loan is marked as defaulted');
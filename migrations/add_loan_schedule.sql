@@ -0,0 +1,71 @@
+-- Loan Schedule Migration Script
+-- Stores every loan's installments, so what is due (and overdue) is read
+-- from rows instead of worked out from dates at report time
+-- Run this before using the updated application
+
+-- One row per installment, written at disbursement. Repayments are
+-- allocated to the oldest unpaid installments first.
+CREATE TABLE IF NOT EXISTS loan_schedule (
+    loan_id INTEGER NOT NULL,
+    installment_number INTEGER NOT NULL,
+    due_date TEXT NOT NULL,
+    amount_due DECIMAL(15,2) NOT NULL,
+    amount_paid DECIMAL(15,2) NOT NULL DEFAULT 0.00,
+    status TEXT NOT NULL DEFAULT 'Pending' CHECK(status IN ('Pending', 'Partial', 'Paid')),
+    paid_date TEXT,
+    PRIMARY KEY (loan_id, installment_number),
+    FOREIGN KEY (loan_id) REFERENCES loans(loan_id)
+);
+
+-- Installments falling due in a date range (loan_schedule.due_between)
+CREATE INDEX IF NOT EXISTS idx_loan_schedule_due
+    ON loan_schedule(due_date);
+
+-- Backfill existing loans (same as LOAN_SCHEDULE_BACKFILL): the first
+-- installment falls on start_date, each later one a calendar month on with
+-- the day clamped to the month's end, and the last takes the rounding
+-- remainder
+INSERT INTO loan_schedule (loan_id, installment_number, due_date, amount_due)
+WITH RECURSIVE seq(loan_id, n, duration) AS (
+    SELECT loan_id, 1, duration_months FROM loans
+    WHERE duration_months > 0
+      AND loan_id NOT IN (SELECT loan_id FROM loan_schedule)
+    UNION ALL
+    SELECT loan_id, n + 1, duration FROM seq WHERE n < duration
+)
+SELECT s.loan_id, s.n,
+       MIN(
+           date(l.start_date, 'start of month', '+' || (s.n - 1) || ' months',
+                '+' || (CAST(strftime('%d', l.start_date) AS INTEGER) - 1) || ' days'),
+           date(l.start_date, 'start of month', '+' || s.n || ' months', '-1 day')
+       ),
+       CASE WHEN s.n < s.duration THEN ROUND(l.total_amount * 1.0 / s.duration, 2)
+            ELSE ROUND(l.total_amount - ROUND(l.total_amount * 1.0 / s.duration, 2) * (s.duration - 1), 2)
+       END
+FROM seq s
+JOIN loans l ON l.loan_id = s.loan_id;
+
+-- Allocate what has been repaid so far (same as loan_schedule.allocate_all)
+UPDATE loan_schedule
+SET amount_paid = a.allocated,
+    status = CASE WHEN a.allocated >= loan_schedule.amount_due THEN 'Paid'
+                  WHEN a.allocated > 0 THEN 'Partial'
+                  ELSE 'Pending' END,
+    paid_date = CASE WHEN a.allocated >= loan_schedule.amount_due
+                     THEN COALESCE(loan_schedule.paid_date, a.paid_date) END
+FROM (
+    SELECT s.loan_id, s.installment_number,
+           (SELECT MAX(r.payment_date) FROM loan_repayments r
+            WHERE r.loan_id = s.loan_id) AS paid_date,
+           ROUND(MIN(s.amount_due, MAX(0,
+               l.amount_paid - (SUM(s.amount_due) OVER w - s.amount_due)
+           )), 2) AS allocated
+    FROM loan_schedule s
+    JOIN loans l ON l.loan_id = s.loan_id
+    WINDOW w AS (PARTITION BY s.loan_id ORDER BY s.installment_number)
+) a
+WHERE loan_schedule.loan_id = a.loan_id
+  AND loan_schedule.installment_number = a.installment_number
+  AND loan_schedule.amount_paid IS NOT a.allocated;
+
+ANALYZE loan_schedule;
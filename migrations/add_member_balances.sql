@@ -0,0 +1,80 @@
+-- Member Balances Migration Script
+-- Replaces the fan-out join in vw_member_summary with a maintained
+-- one-row-per-member balance table
+-- Run this before using the updated application
+
+-- Pre-aggregated balances, kept current by DatabaseManager on every
+-- savings deposit/withdrawal, loan disbursement and loan repayment
+CREATE TABLE IF NOT EXISTS member_balances (
+    member_id TEXT PRIMARY KEY,
+    premium_savings DECIMAL(15,2) NOT NULL DEFAULT 0.00,
+    fixed_target_deposits DECIMAL(15,2) NOT NULL DEFAULT 0.00,
+    shares_investment DECIMAL(15,2) NOT NULL DEFAULT 0.00,
+    total_savings DECIMAL(15,2) NOT NULL DEFAULT 0.00,
+    total_loans_outstanding DECIMAL(15,2) NOT NULL DEFAULT 0.00,
+    modified_date TEXT DEFAULT (datetime('now')),
+    FOREIGN KEY (member_id) REFERENCES members(member_id)
+);
+
+-- Backfill from two pre-aggregated subqueries (savings and loans are
+-- grouped separately, so accounts and loans no longer multiply each other)
+INSERT OR REPLACE INTO member_balances (
+    member_id, premium_savings, fixed_target_deposits, shares_investment,
+    total_savings, total_loans_outstanding, modified_date
+)
+SELECT
+    m.member_id,
+    COALESCE(sv.premium_savings, 0),
+    COALESCE(sv.fixed_target_deposits, 0),
+    COALESCE(sv.shares_investment, 0),
+    COALESCE(sv.total_savings, 0),
+    COALESCE(ln.total_loans_outstanding, 0),
+    datetime('now')
+FROM members m
+LEFT JOIN (
+    SELECT
+        sa.member_id,
+        SUM(CASE WHEN st.type_code = 'PREMIUM' THEN sa.current_balance ELSE 0 END) AS premium_savings,
+        SUM(CASE WHEN st.type_code IN ('TARGET', 'FIXED_DEPOSIT') THEN sa.current_balance ELSE 0 END) AS fixed_target_deposits,
+        SUM(CASE WHEN st.type_code = 'SHARES' THEN sa.current_balance ELSE 0 END) AS shares_investment,
+        SUM(sa.current_balance) AS total_savings
+    FROM savings_accounts sa
+    JOIN savings_types st ON sa.savings_type_id = st.savings_type_id
+    WHERE sa.is_active = 1
+    GROUP BY sa.member_id
+) sv ON sv.member_id = m.member_id
+LEFT JOIN (
+    SELECT member_id, SUM(balance_outstanding) AS total_loans_outstanding
+    FROM loans
+    WHERE status = 'Active'
+    GROUP BY member_id
+) ln ON ln.member_id = m.member_id;
+
+-- Member summary now reads one balance row per member
+DROP VIEW IF EXISTS vw_member_summary;
+
+CREATE VIEW vw_member_summary AS
+SELECT
+    m.member_id,
+    m.registration_number,
+    m.first_name || ' ' || COALESCE(m.middle_name || ' ', '') || m.last_name AS full_name,
+    m.station_id,
+    s.station_name,
+    m.is_active,
+    m.is_deceased,
+
+    -- Total Savings
+    COALESCE(mb.premium_savings, 0) AS premium_savings,
+    COALESCE(mb.fixed_target_deposits, 0) AS fixed_target_deposits,
+    COALESCE(mb.shares_investment, 0) AS shares_investment,
+    COALESCE(mb.total_savings, 0) AS total_savings,
+
+    -- Total Loans
+    COALESCE(mb.total_loans_outstanding, 0) AS total_loans_outstanding,
+
+    -- Net Balance
+    COALESCE(mb.total_savings, 0) - COALESCE(mb.total_loans_outstanding, 0) AS net_balance
+
+FROM members m
+LEFT JOIN stations s ON m.station_id = s.station_id
+LEFT JOIN member_balances mb ON m.member_id = mb.member_id;
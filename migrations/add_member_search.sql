@@ -0,0 +1,74 @@
+-- Member Search Migration Script
+-- Adds an FTS5 full-text index over member identifiers, names and contacts
+-- Run this before using the updated application
+
+-- External-content index: the text lives in members, FTS5 keeps only the
+-- inverted index. prefix='2 3' pre-builds short prefixes for type-ahead.
+CREATE VIRTUAL TABLE IF NOT EXISTS members_fts USING fts5(
+    member_id,
+    first_name,
+    middle_name,
+    last_name,
+    phone_number,
+    employee_id,
+    email,
+    content='members',
+    content_rowid='rowid',
+    prefix='2 3'
+);
+
+-- Rank ID and surname hits above phone/email hits
+INSERT INTO members_fts(members_fts, rank)
+VALUES ('rank', 'bm25(10.0, 4.0, 2.0, 4.0, 1.0, 1.0, 1.0)');
+
+-- Keep the index in sync with members
+CREATE TRIGGER IF NOT EXISTS trg_members_fts_insert
+AFTER INSERT ON members
+BEGIN
+    INSERT INTO members_fts (
+        rowid, member_id, first_name, middle_name, last_name,
+        phone_number, employee_id, email
+    )
+    VALUES (
+        NEW.rowid, NEW.member_id, NEW.first_name, NEW.middle_name, NEW.last_name,
+        NEW.phone_number, NEW.employee_id, NEW.email
+    );
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_members_fts_delete
+AFTER DELETE ON members
+BEGIN
+    INSERT INTO members_fts (
+        members_fts, rowid, member_id, first_name, middle_name, last_name,
+        phone_number, employee_id, email
+    )
+    VALUES (
+        'delete', OLD.rowid, OLD.member_id, OLD.first_name, OLD.middle_name, OLD.last_name,
+        OLD.phone_number, OLD.employee_id, OLD.email
+    );
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_members_fts_update
+AFTER UPDATE OF member_id, first_name, middle_name, last_name,
+                phone_number, employee_id, email ON members
+BEGIN
+    INSERT INTO members_fts (
+        members_fts, rowid, member_id, first_name, middle_name, last_name,
+        phone_number, employee_id, email
+    )
+    VALUES (
+        'delete', OLD.rowid, OLD.member_id, OLD.first_name, OLD.middle_name, OLD.last_name,
+        OLD.phone_number, OLD.employee_id, OLD.email
+    );
+    INSERT INTO members_fts (
+        rowid, member_id, first_name, middle_name, last_name,
+        phone_number, employee_id, email
+    )
+    VALUES (
+        NEW.rowid, NEW.member_id, NEW.first_name, NEW.middle_name, NEW.last_name,
+        NEW.phone_number, NEW.employee_id, NEW.email
+    );
+END;
+
+-- Index the existing members
+INSERT INTO members_fts(members_fts) VALUES ('rebuild');
@@ -0,0 +1,86 @@
+-- Report Fingerprint Migration Script
+-- Counts edits to the tables reports take their labels from
+-- Run this before using the updated application
+
+-- Cached reports (see reports.fingerprint) show member names, stations and
+-- savings/loan type names. A counter bumped by every insert, update and
+-- delete on those tables changes even when two edits land in the same
+-- second, which MAX(modified_date) cannot tell apart.
+CREATE TABLE IF NOT EXISTS reference_data_version (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    version INTEGER NOT NULL DEFAULT 0
+);
+
+INSERT OR IGNORE INTO reference_data_version (id, version) VALUES (1, 0);
+
+CREATE TRIGGER IF NOT EXISTS trg_members_insert_reference_version
+AFTER INSERT ON members
+BEGIN
+    UPDATE reference_data_version SET version = version + 1 WHERE id = 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_members_update_reference_version
+AFTER UPDATE ON members
+BEGIN
+    UPDATE reference_data_version SET version = version + 1 WHERE id = 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_members_delete_reference_version
+AFTER DELETE ON members
+BEGIN
+    UPDATE reference_data_version SET version = version + 1 WHERE id = 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_stations_insert_reference_version
+AFTER INSERT ON stations
+BEGIN
+    UPDATE reference_data_version SET version = version + 1 WHERE id = 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_stations_update_reference_version
+AFTER UPDATE ON stations
+BEGIN
+    UPDATE reference_data_version SET version = version + 1 WHERE id = 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_stations_delete_reference_version
+AFTER DELETE ON stations
+BEGIN
+    UPDATE reference_data_version SET version = version + 1 WHERE id = 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_savings_types_insert_reference_version
+AFTER INSERT ON savings_types
+BEGIN
+    UPDATE reference_data_version SET version = version + 1 WHERE id = 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_savings_types_update_reference_version
+AFTER UPDATE ON savings_types
+BEGIN
+    UPDATE reference_data_version SET version = version + 1 WHERE id = 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_savings_types_delete_reference_version
+AFTER DELETE ON savings_types
+BEGIN
+    UPDATE reference_data_version SET version = version + 1 WHERE id = 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_loan_types_insert_reference_version
+AFTER INSERT ON loan_types
+BEGIN
+    UPDATE reference_data_version SET version = version + 1 WHERE id = 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_loan_types_update_reference_version
+AFTER UPDATE ON loan_types
+BEGIN
+    UPDATE reference_data_version SET version = version + 1 WHERE id = 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_loan_types_delete_reference_version
+AFTER DELETE ON loan_types
+BEGIN
+    UPDATE reference_data_version SET version = version + 1 WHERE id = 1;
+END;
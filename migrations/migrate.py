@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Apply schema migrations to the application database
+===================================================
+Runs every pending script from this folder in order and prints how long
+each statement took. Safe to re-run: applied versions are skipped.
+
+Usage:
+    python migrations/migrate.py                 # data/nfc_cooperative.db
+    python migrations/migrate.py --db other.db
+    python migrations/migrate.py --status        # list applied and pending
+"""
+
+import argparse
+import os
+import sys
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(PROJECT_DIR, 'src'))
+
+from database.migration_runner import MigrationError, MigrationRunner
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Apply pending schema migrations")
+    parser.add_argument('--db', default=os.path.join(PROJECT_DIR, 'data', 'nfc_cooperative.db'),
+                        help="database file (default: data/nfc_cooperative.db)")
+    parser.add_argument('--status', action='store_true',
+                        help="show applied and pending migrations without changing anything")
+    args = parser.parse_args()
+
+    if not os.path.exists(args.db):
+        print(f"Database not found: {args.db}")
+        return 1
+
+    runner = MigrationRunner(args.db, progress=print)
+    try:
+        if args.status:
+            for row in runner.applied():
+                print(f"  applied  {row['version']:>3}  {row['filename']:<32} "
+                      f"{row['applied_date']}  {row['duration_ms']:,.1f} ms")
+            for migration in runner.pending():
+                print(f"  pending  {migration.version:>3}  {migration.filename}")
+            return 0
+
+        results = runner.apply_pending()
+        if not results:
+            print("Database is up to date.")
+        return 0
+    except MigrationError as e:
+        print(f"\n{e}\n\nThe failed migration was rolled back.")
+        return 1
+    finally:
+        runner.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
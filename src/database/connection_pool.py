@@ -0,0 +1,68 @@
+"""
+Connection Pool - Shared read-only connections
+==============================================
+With the database in WAL mode, readers see a consistent snapshot and do
+not block the writer (or each other). The pool hands out read-only
+DatabaseManager instances so background work can query while the main
+connection posts transactions.
+"""
+
+import queue
+import threading
+from contextlib import contextmanager
+from typing import Callable, List
+
+
+class ReadConnectionPool:
+    """Fixed-size pool of read-only connections, opened on demand"""
+
+    def __init__(self, factory: Callable, size: int = 4):
+        self.factory = factory
+        self.size = size
+        self.idle = queue.LifoQueue()
+        self.opened: List = []
+        self.lock = threading.Lock()
+        self.closed = False
+
+    @contextmanager
+    def connection(self):
+        """Borrow a reader for the duration of the block"""
+        reader = self.acquire()
+        try:
+            yield reader
+        finally:
+            self.release(reader)
+
+    def acquire(self):
+        """Take an idle reader, open a new one, or wait for one to come back"""
+        try:
+            return self.idle.get_nowait()
+        except queue.Empty:
+            pass
+
+        with self.lock:
+            if self.closed:
+                raise RuntimeError("Connection pool is closed")
+            if len(self.opened) < self.size:
+                reader = self.factory()
+                self.opened.append(reader)
+                return reader
+
+        return self.idle.get()
+
+    def release(self, reader):
+        """Return a reader to the pool"""
+        if self.closed:
+            reader.close()
+        else:
+            self.idle.put(reader)
+
+    def close(self):
+        """Close every reader; borrowed ones close when they are returned"""
+        with self.lock:
+            self.closed = True
+        while True:
+            try:
+                self.idle.get_nowait().close()
+            except queue.Empty:
+                break
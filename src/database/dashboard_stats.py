@@ -0,0 +1,223 @@
+"""
+Dashboard Statistics - SQL-side aggregation for the dashboard cards
+===================================================================
+"""
+
+import threading
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from decimal import Decimal
+from typing import Dict, List, Optional, Tuple
+
+from .loan_analytics import PAR_DAYS
+
+PERIOD_LABELS = {
+    'daily': 'Daily (Last 7 Days)',
+    'weekly': 'Weekly (Last 8 Weeks)',
+    'monthly': 'Monthly (Last 12 Months)',
+    'yearly': 'Yearly (Last 5 Years)',
+}
+
+
+def _money(value) -> Decimal:
+    """Convert a SQL SUM result to Decimal"""
+    return Decimal(str(value or 0))
+
+
+@dataclass
+class DashboardSnapshot:
+    """All values shown on the dashboard at one point in time"""
+
+    # Members
+    total_members: int = 0
+    active_members: int = 0
+    inactive_members: int = 0
+    deceased_members: int = 0
+
+    # Savings
+    total_savings: Decimal = Decimal('0')
+    savings_accounts: int = 0
+    savings_by_type: Dict[str, Decimal] = field(default_factory=dict)
+
+    # Loans
+    total_loans: int = 0
+    active_loans: int = 0
+    completed_loans: int = 0
+    loans_disbursed: Decimal = Decimal('0')
+    loans_outstanding: Decimal = Decimal('0')
+    loans_collected: Decimal = Decimal('0')
+
+    # Portfolio risk (see loan_analytics): balance and share of the open
+    # balance more than N days past due, per PAR_DAYS threshold
+    portfolio_at_risk: Dict[int, Decimal] = field(default_factory=dict)
+    par_ratios: Dict[int, float] = field(default_factory=dict)
+    aging: List[Dict] = field(default_factory=list)
+    collections: List[Dict] = field(default_factory=list)
+
+    # Transactions (last 30 days)
+    transactions_30days: int = 0
+    deposits_30days: Decimal = Decimal('0')
+    withdrawals_30days: Decimal = Decimal('0')
+
+    # Transaction counts per bucket, newest bucket first
+    period_transactions: Dict[str, int] = field(default_factory=dict)
+    period_label: str = PERIOD_LABELS['daily']
+    daily_transactions: Dict[str, int] = field(default_factory=dict)
+
+    @property
+    def net_flow_30days(self) -> Decimal:
+        """Deposits minus withdrawals over the last 30 days"""
+        return self.deposits_30days - self.withdrawals_30days
+
+    @property
+    def last_month_collection_rate(self) -> float:
+        """Share of last month's installments that was collected"""
+        return self.collections[-2]['rate'] if len(self.collections) > 1 else 0.0
+
+
+class DashboardStatsService:
+    """Computes dashboard statistics with a handful of GROUP BY queries
+
+    Snapshots are cached on the writer's data_version(), so a refresh
+    with no writes since the last one costs a single PRAGMA. Portfolio
+    risk figures are the expensive part and are cached separately, so
+    switching the graph time period does not recompute them either.
+    Keep one instance per window; background loads pass the pooled reader
+    to query through and the version read on the GUI thread.
+    """
+
+    def __init__(self, db_manager):
+        self.db = db_manager
+        self.analytics = db_manager.loan_analytics
+        self.lock = threading.Lock()
+        self._snapshots: Dict[Tuple, DashboardSnapshot] = {}
+        self._risk_key = None
+        self._risk: Dict = {}
+
+    def snapshot(self, time_period: str = 'daily', today: Optional[date] = None,
+                 db=None, version=None) -> DashboardSnapshot:
+        """Build a snapshot for the given graph time period
+
+        db is the manager to query through (default: self.db). version is
+        the writer's data_version(), read here when not given; a pooled
+        reader's own PRAGMA data_version is not comparable across readers.
+        """
+        today = today or date.today()
+        db = db or self.db
+        version = version or self.analytics.db.data_version()
+        key = (version, today, time_period)
+        with self.lock:
+            if key in self._snapshots:
+                return self._snapshots[key]
+
+            stats = DashboardSnapshot()
+            self._load_member_stats(stats, db)
+            self._load_savings_stats(stats, db)
+            self._load_loan_stats(stats, db)
+            self._load_loan_risk_stats(stats, db, today, version)
+            self._load_transaction_stats(stats, db, time_period, today)
+
+            # Only snapshots of the current data are worth keeping
+            self._snapshots = {k: v for k, v in self._snapshots.items() if k[:2] == key[:2]}
+            self._snapshots[key] = stats
+            return stats
+
+    def _load_member_stats(self, stats: DashboardSnapshot, db):
+        """Member counts by status"""
+        row = db.query_one('dashboard.member_counts')
+        stats.total_members = row['total_members']
+        stats.active_members = row['active_members']
+        stats.inactive_members = row['inactive_members']
+        stats.deceased_members = row['deceased_members']
+
+    def _load_savings_stats(self, stats: DashboardSnapshot, db):
+        """Savings balances grouped by savings type"""
+        rows = db.query('dashboard.savings_by_type')
+        stats.savings_by_type = {row['type_name']: _money(row['balance']) for row in rows}
+        stats.savings_accounts = sum(row['accounts'] for row in rows)
+        stats.total_savings = sum(stats.savings_by_type.values(), Decimal('0'))
+
+    def _load_loan_stats(self, stats: DashboardSnapshot, db):
+        """Loan counts and amounts in a single pass over loans"""
+        row = db.query_one('dashboard.loan_totals')
+        stats.total_loans = row['total_loans']
+        stats.active_loans = row['active_loans']
+        stats.completed_loans = row['completed_loans']
+        stats.loans_disbursed = _money(row['loans_disbursed'])
+        stats.loans_outstanding = _money(row['loans_outstanding'])
+        stats.loans_collected = _money(row['loans_collected'])
+
+    def _load_loan_risk_stats(self, stats: DashboardSnapshot, db, today: date, version):
+        """Portfolio at risk, aging and collection rates from the NumPy analytics"""
+        if self._risk_key != (version, today):
+            portfolio = self.analytics.analytics(today, db, version)
+            self._risk = {
+                'portfolio_at_risk': {days: _money(portfolio.par(days)) for days in PAR_DAYS},
+                'par_ratios': {days: portfolio.par_ratio(days) for days in PAR_DAYS},
+                'aging': portfolio.aging_rows(),
+                'collections': portfolio.collections,
+            }
+            self._risk_key = (version, today)
+        stats.portfolio_at_risk = self._risk['portfolio_at_risk']
+        stats.par_ratios = self._risk['par_ratios']
+        stats.aging = self._risk['aging']
+        stats.collections = self._risk['collections']
+
+    def _load_transaction_stats(self, stats: DashboardSnapshot, db, time_period: str, today: date):
+        """30-day totals and per-period transaction counts"""
+        # Daily rows cover the 30-day cards, the 7-day chart and the 8-week chart
+        week_start = today - timedelta(days=today.weekday())
+        first_day = min(today - timedelta(days=30), week_start - timedelta(weeks=7))
+
+        rows = db.query('dashboard.transactions_by_day', (first_day.isoformat(),))
+        by_day = {row['day']: row for row in rows}
+
+        # Last 30 days
+        thirty_days_ago = (today - timedelta(days=30)).isoformat()
+        recent = [row for day, row in by_day.items() if day >= thirty_days_ago]
+        stats.transactions_30days = sum(row['count'] for row in recent)
+        stats.deposits_30days = _money(sum(row['deposits'] or 0 for row in recent))
+        stats.withdrawals_30days = _money(sum(row['withdrawals'] or 0 for row in recent))
+
+        # Last 7 days, kept for the charts view
+        stats.daily_transactions = {}
+        for i in range(7):
+            day = today - timedelta(days=i)
+            row = by_day.get(day.isoformat())
+            stats.daily_transactions[day.strftime('%a')] = row['count'] if row else 0
+
+        stats.period_label = PERIOD_LABELS.get(time_period, PERIOD_LABELS['daily'])
+
+        if time_period == 'weekly':
+            stats.period_transactions = {}
+            for i in range(8):
+                start = week_start - timedelta(weeks=i)
+                days = [(start + timedelta(days=d)).isoformat() for d in range(7)]
+                stats.period_transactions[f"Week {8 - i}"] = sum(
+                    by_day[d]['count'] for d in days if d in by_day
+                )
+
+        elif time_period == 'monthly':
+            months = []
+            year, month = today.year, today.month
+            for _ in range(12):
+                months.append((year, month))
+                year, month = (year, month - 1) if month > 1 else (year - 1, 12)
+            counts = self._count_by_prefix(db, 7, f"{months[-1][0]:04d}-{months[-1][1]:02d}-01")
+            stats.period_transactions = {
+                date(y, m, 1).strftime('%b %Y'): counts.get(f"{y:04d}-{m:02d}", 0)
+                for y, m in months
+            }
+
+        elif time_period == 'yearly':
+            years = [str(today.year - i) for i in range(5)]
+            counts = self._count_by_prefix(db, 4, f"{years[-1]}-01-01")
+            stats.period_transactions = {year: counts.get(year, 0) for year in years}
+
+        else:
+            stats.period_transactions = dict(stats.daily_transactions)
+
+    def _count_by_prefix(self, db, length: int, since: str) -> Dict[str, int]:
+        """Count transactions grouped by the first `length` characters of the date"""
+        rows = db.query('dashboard.transactions_by_prefix', (length, since))
+        return {row['bucket']: row['count'] for row in rows}
@@ -3,51 +3,315 @@ Database Manager - Handles all database operations
 ==================================================
 """
 
+import calendar
+import math
+import re
 import sqlite3
-from datetime import datetime
-from typing import Optional, List, Dict, Any, Tuple
+from contextlib import contextmanager, nullcontext
+from datetime import date, datetime, timedelta
+from decimal import Decimal, ROUND_HALF_UP
+from pathlib import Path
+from typing import Optional, List, Dict, Any, Iterator, Tuple
 import hashlib
+import json
+import time
+
+from dateutil.relativedelta import relativedelta
+
+from . import profiler, queries
+from .connection_pool import ReadConnectionPool
+from .loan_analytics import LoanAnalyticsService
+from .queries import QUERIES
+
+
+class BatchPostingError(ValueError):
+    """A posting batch failed validation; errors is a list of (line, message)"""
+
+    def __init__(self, errors: List[Tuple[int, str]]):
+        self.errors = errors
+        lines = [f"Line {line}: {message}" for line, message in errors[:10]]
+        if len(errors) > 10:
+            lines.append(f"... and {len(errors) - 10} more")
+        super().__init__(f"{len(errors)} invalid entries\n" + "\n".join(lines))
+
+
+class _DryRunComplete(Exception):
+    """Raised inside transaction() to roll back a dry run's writes"""
+
+
+def _round_half_up(value: float) -> float:
+    """Round to kobo with halves away from zero, as SQLite's ROUND() does"""
+    return float(Decimal(repr(value)).quantize(Decimal('0.01'), rounding=ROUND_HALF_UP))
+
+
+def loan_schedule_rows(loan_id: int, start_date: str, duration: int,
+                       total_amount: float) -> List[Tuple]:
+    """loan_schedule rows for a flat-rate loan
+
+    The first installment falls on start_date and each later one a month on,
+    stepped with relativedelta like the disbursement dialog's end date. The
+    last installment takes the rounding remainder so they sum to total_amount.
+    """
+    start = datetime.strptime(start_date, '%Y-%m-%d').date()
+    installment = _round_half_up(total_amount / duration)
+    rows = []
+    for n in range(1, duration + 1):
+        amount = installment if n < duration else _round_half_up(total_amount - installment * (duration - 1))
+        due_date = start + relativedelta(months=n - 1)
+        rows.append((loan_id, n, due_date.isoformat(), amount))
+    return rows
+
+
+def arrears_run_report(run: Dict) -> str:
+    """Plain-text summary of an arrears run with its per-step timings"""
+    lines = [
+        f"Arrears run as at {run['as_of']} (default after {run['default_days']} days)",
+        f"  Loans checked:    {run['loans_checked']:,}",
+        f"  Loans in arrears: {run['loans_in_arrears']:,}",
+        f"  Total arrears:    {run['total_arrears']:,.2f}",
+        f"  Newly defaulted:  {run['loans_defaulted']:,}",
+        f"  Cured:            {run['loans_cured']:,}",
+        "",
+        f"  {'step':<16}{'ms':>10}",
+    ]
+    for label, seconds in run['timings'].items():
+        lines.append(f"  {label:<16}{seconds * 1000:>10.1f}")
+    lines.append(f"  {'total':<16}{run['total_seconds'] * 1000:>10.1f}")
+    return "\n".join(lines)
 
 
 class DatabaseManager:
     """Manages all database operations"""
     
-    def __init__(self, db_path: str):
+    # Applied to every connection. Negative cache_size is in KiB.
+    CONNECTION_PRAGMAS = (
+        "PRAGMA foreign_keys = ON",
+        "PRAGMA busy_timeout = 5000",
+        "PRAGMA cache_size = -32000",
+        "PRAGMA mmap_size = 268435456",
+        "PRAGMA temp_store = MEMORY",
+    )
+    
+    # Background readers kept open by reader()
+    READ_POOL_SIZE = 4
+    
+    def __init__(self, db_path: str, read_only: bool = False, owner=None):
         self.db_path = db_path
+        self.read_only = read_only
         self.conn = None
+        # Readers open lazily, so the pool costs nothing until reader() is used
+        self.read_pool = None if read_only else ReadConnectionPool(
+            lambda: DatabaseManager(db_path, read_only=True, owner=self), self.READ_POOL_SIZE
+        )
+        # Portfolio analytics cache, shared by pooled readers with their writer
+        self.loan_analytics = owner.loan_analytics if owner else LoanAnalyticsService(self)
+        # Bumped on every commit through this manager (see data_version)
+        self.change_count = 0
+        # Nesting level of transaction() blocks; 0 = none open
+        self.transaction_depth = 0
         self.connect()
     
     def connect(self):
         """Connect to database"""
-        self.conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        if self.read_only:
+            # Background readers open the file with mode=ro so they can never write
+            uri = Path(self.db_path).resolve().as_uri() + "?mode=ro"
+            self.conn = sqlite3.connect(uri, uri=True, check_same_thread=False,
+                                        cached_statements=queries.STATEMENT_CACHE_SIZE)
+        else:
+            self.conn = sqlite3.connect(self.db_path, check_same_thread=False,
+                                        cached_statements=queries.STATEMENT_CACHE_SIZE)
         self.conn.row_factory = sqlite3.Row
-        # Enable foreign keys
-        self.conn.execute("PRAGMA foreign_keys = ON")
+        for pragma in self.CONNECTION_PRAGMAS:
+            self.conn.execute(pragma)
+        
+        if not self.read_only:
+            # WAL lets readers run alongside the writer; it is stored in the
+            # file, so this only converts the database the first time.
+            # synchronous=NORMAL is durable in WAL except on power loss.
+            self.conn.execute("PRAGMA journal_mode = WAL")
+            self.conn.execute("PRAGMA synchronous = NORMAL")
+    
+    @contextmanager
+    def reader(self):
+        """Borrow a pooled read-only DatabaseManager for background queries
+
+        Safe to use from any thread; each reader serves one borrower at a
+        time. A read-only manager hands out itself.
+        """
+        if self.read_only:
+            yield self
+            return
+        
+        with self.read_pool.connection() as reader:
+            yield reader
     
     def execute(self, query: str, params: tuple = ()) -> sqlite3.Cursor:
         """Execute a query"""
-        return self.conn.execute(query, params)
+        if profiler.current is None:
+            return self.conn.execute(query, params)
+        start = time.perf_counter()
+        cursor = self.conn.execute(query, params)
+        self._profile(query, params, start)
+        return cursor
+    
+    def _profile(self, query: str, params, start: float):
+        """Report a finished statement to the query profiler, if one is enabled"""
+        active = profiler.current
+        if active is not None:
+            active.record(self.conn, query, params, time.perf_counter() - start)
     
     def commit(self):
-        """Commit transaction"""
+        """Commit transaction (left to the outermost block inside transaction())"""
+        if self.transaction_depth:
+            return
         self.conn.commit()
+        self.change_count += 1
     
     def rollback(self):
         """Rollback transaction"""
         self.conn.rollback()
     
+    @contextmanager
+    def transaction(self):
+        """Run a block of writes as one atomic unit
+
+        The outermost block commits once when it exits and rolls everything
+        back if it raises. Nested blocks become savepoints, so an inner
+        failure that is caught only undoes the inner block's writes.
+        Mutating methods use this themselves, so calling them inside an
+        outer block joins its transaction instead of committing.
+        """
+        depth = self.transaction_depth
+        savepoint = f"sp_{depth}"
+        
+        if depth == 0:
+            # Join writes already pending on the connection rather than failing
+            if not self.conn.in_transaction:
+                self.conn.execute("BEGIN IMMEDIATE")
+        else:
+            self.conn.execute(f"SAVEPOINT {savepoint}")
+        
+        self.transaction_depth += 1
+        try:
+            yield self
+        except BaseException:
+            self.transaction_depth = depth
+            if depth == 0:
+                self.conn.rollback()
+            else:
+                self.conn.execute(f"ROLLBACK TO {savepoint}")
+                self.conn.execute(f"RELEASE {savepoint}")
+            raise
+        
+        self.transaction_depth = depth
+        if depth == 0:
+            self.commit()
+        else:
+            self.conn.execute(f"RELEASE {savepoint}")
+    
+    def data_version(self) -> Tuple[int, int]:
+        """Token that changes whenever committed data may have changed
+
+        Combines the local commit counter with SQLite's PRAGMA data_version,
+        which moves when another connection commits to the same file.
+        """
+        external = self.conn.execute("PRAGMA data_version").fetchone()[0]
+        return (self.change_count, external)
+    
     def fetchone(self, query: str, params: tuple = ()) -> Optional[Dict]:
         """Fetch one row"""
-        cursor = self.execute(query, params)
-        row = cursor.fetchone()
+        if profiler.current is None:
+            row = self.conn.execute(query, params).fetchone()
+        else:
+            start = time.perf_counter()
+            row = self.conn.execute(query, params).fetchone()
+            self._profile(query, params, start)
         return dict(row) if row else None
     
     def fetchall(self, query: str, params: tuple = ()) -> List[Dict]:
         """Fetch all rows"""
-        cursor = self.execute(query, params)
-        rows = cursor.fetchall()
+        if profiler.current is None:
+            rows = self.conn.execute(query, params).fetchall()
+        else:
+            start = time.perf_counter()
+            rows = self.conn.execute(query, params).fetchall()
+            self._profile(query, params, start)
         return [dict(row) for row in rows]
     
+    # Named queries (see queries.py) - same as above, but counted per name
+    
+    def run(self, name: str, params: tuple = ()) -> sqlite3.Cursor:
+        """Execute a named statement"""
+        start = time.perf_counter()
+        cursor = self.conn.execute(QUERIES[name], params)
+        queries.record(name, time.perf_counter() - start, cursor.rowcount)
+        self._profile(QUERIES[name], params, start)
+        return cursor
+    
+    def run_many(self, name: str, seq_of_params) -> sqlite3.Cursor:
+        """Execute a named statement once per parameter tuple"""
+        start = time.perf_counter()
+        cursor = self.conn.executemany(QUERIES[name], seq_of_params)
+        queries.record(name, time.perf_counter() - start, cursor.rowcount)
+        # No single parameter set to explain the plan with
+        self._profile(QUERIES[name], None, start)
+        return cursor
+    
+    def query(self, name: str, params: tuple = ()) -> List[Dict]:
+        """Fetch all rows of a named query"""
+        start = time.perf_counter()
+        rows = [dict(row) for row in self.conn.execute(QUERIES[name], params).fetchall()]
+        queries.record(name, time.perf_counter() - start, len(rows))
+        self._profile(QUERIES[name], params, start)
+        return rows
+    
+    def query_one(self, name: str, params: tuple = ()) -> Optional[Dict]:
+        """Fetch one row of a named query"""
+        start = time.perf_counter()
+        row = self.conn.execute(QUERIES[name], params).fetchone()
+        queries.record(name, time.perf_counter() - start, 1 if row else 0)
+        self._profile(QUERIES[name], params, start)
+        return dict(row) if row else None
+    
+    def query_rows(self, name: str, params: tuple = ()) -> List[tuple]:
+        """Fetch all rows of a named query as plain tuples
+
+        Skips building a dict per row, for bulk loads into arrays.
+        """
+        start = time.perf_counter()
+        cursor = self.conn.cursor()
+        cursor.row_factory = None
+        rows = cursor.execute(QUERIES[name], params).fetchall()
+        queries.record(name, time.perf_counter() - start, len(rows))
+        self._profile(QUERIES[name], params, start)
+        return rows
+    
+    def iter_query(self, name: str, params: tuple = (), batch_size: int = 500) -> Iterator[Dict]:
+        """Stream the rows of a named query, batch_size rows in memory at a time
+
+        Only the time spent inside SQLite is counted, not the caller's work
+        between rows.
+        """
+        start = time.perf_counter()
+        cursor = self.conn.execute(QUERIES[name], params)
+        elapsed = time.perf_counter() - start
+        count = 0
+        try:
+            while True:
+                fetch_start = time.perf_counter()
+                batch = cursor.fetchmany(batch_size)
+                elapsed += time.perf_counter() - fetch_start
+                if not batch:
+                    break
+                count += len(batch)
+                for row in batch:
+                    yield dict(row)
+        finally:
+            cursor.close()
+            queries.record(name, elapsed, count)
+            self._profile(QUERIES[name], params, time.perf_counter() - elapsed)
+    
     # ========================================================================
     # AUTHENTICATION
     # ========================================================================
@@ -57,25 +321,18 @@ class DatabaseManager:
         # Hash password
         password_hash = hashlib.sha256(password.encode()).hexdigest()
         
-        query = """
-            SELECT * FROM users 
-            WHERE username = ? AND password_hash = ? AND is_active = 1
-        """
-        user = self.fetchone(query, (username, password_hash))
+        user = self.query_one('users.authenticate', (username, password_hash))
         
         if user:
             # Update last login
-            self.execute(
-                "UPDATE users SET last_login = ? WHERE user_id = ?",
-                (datetime.now().isoformat(), user['user_id'])
-            )
-            self.commit()
+            with self.transaction():
+                self.run('users.set_last_login', (datetime.now().isoformat(), user['user_id']))
         
         return user
     
     def get_user_by_id(self, user_id: int) -> Optional[Dict]:
         """Get user by ID"""
-        return self.fetchone("SELECT * FROM users WHERE user_id = ?", (user_id,))
+        return self.query_one('users.get', (user_id,))
     
     # ========================================================================
     # MEMBERS
@@ -83,107 +340,148 @@ class DatabaseManager:
     
     def get_all_members(self, active_only: bool = True) -> List[Dict]:
         """Get all members"""
-        query = "SELECT * FROM members"
-        if active_only:
-            query += " WHERE is_active = 1"
-        query += " ORDER BY member_id"
-        return self.fetchall(query)
+        return self.query('members.all_active' if active_only else 'members.all')
     
     def get_member(self, member_id: str) -> Optional[Dict]:
         """Get member by ID"""
-        return self.fetchone("SELECT * FROM members WHERE member_id = ?", (member_id,))
-    
-    def search_members(self, search_term: str) -> List[Dict]:
-        """Search members by name or ID - searches first, middle, last names"""
-        query = """
-            SELECT * FROM members 
-            WHERE (
-                member_id LIKE ? 
-                OR first_name LIKE ? 
-                OR middle_name LIKE ?
-                OR last_name LIKE ?
-                OR (first_name || ' ' || COALESCE(middle_name, '') || ' ' || last_name) LIKE ?
-            )
-            ORDER BY member_id
+        return self.query_one('members.get', (member_id,))
+    
+    # Searches matching more members than this are returned unranked
+    MEMBER_SEARCH_RANK_LIMIT = 500
+    
+    def search_members(self, search_term: str, limit: int = 50) -> List[Dict]:
+        """Search members by ID, name, phone, employee ID or email, best match first
+
+        Every word must match the start of a word in one of the indexed
+        columns (members_fts full-text index).
         """
-        term = f"%{search_term}%"
-        # Search across: member_id, first_name, middle_name, last_name, and full name combined
-        return self.fetchall(query, (term, term, term, term, term))
+        match = self._member_fts_query(search_term)
+        if not match:
+            return []
+        
+        # Ranking has to score every match, which is what makes broad
+        # prefixes ("a", "080") slow. Only rank selective searches; for broad
+        # ones return the first matches in index order.
+        matches = self.query_one(
+            'members.search_count', (match, self.MEMBER_SEARCH_RANK_LIMIT + 1)
+        )['n']
+        name = 'members.search_ranked' if matches <= self.MEMBER_SEARCH_RANK_LIMIT else 'members.search_unranked'
+        return self.query(name, (match, limit))
+    
+    @staticmethod
+    def _member_fts_query(search_term: str) -> str:
+        """Turn user input into an FTS5 query of quoted word prefixes"""
+        words = re.findall(r'\w+', search_term or '')
+        return ' '.join(f'"{word}"*' for word in words)
+    
+    def rebuild_member_search_index(self):
+        """Rebuild members_fts from members (e.g. after a VACUUM renumbers rowids)"""
+        with self.transaction():
+            self.run('members.rebuild_search_index')
+    
+    def get_members_page(self, after_member_id: Optional[str] = None, limit: int = 200,
+                         search_term: Optional[str] = None) -> List[Dict]:
+        """Get the next page of members (with station name) after a member ID"""
+        name = 'members.page'
+        params = []
+        if search_term:
+            match = self._member_fts_query(search_term)
+            if not match:
+                return []
+            name += '_search'
+            params.append(match)
+        if after_member_id is not None:
+            # Keyset paging - seek past the last row instead of using OFFSET
+            name += '_after'
+            params.append(after_member_id)
+        params.append(limit)
+        return self.query(name, tuple(params))
+    
+    def get_member_status_counts(self, search_term: Optional[str] = None) -> Dict:
+        """Count members by status, optionally limited to a search"""
+        if not search_term:
+            return self.query_one('members.status_counts')
+        match = self._member_fts_query(search_term)
+        if not match:
+            return {'total': 0, 'active': 0, 'inactive': 0, 'deceased': 0}
+        return self.query_one('members.status_counts_search', (match,))
     
     def add_member(self, member_data: Dict, created_by: str) -> str:
         """Add new member"""
-        # Get next member ID
-        next_num = self.get_next_member_number()
-        member_id = f"NFC{next_num:04d}"
-        
-        query = """
-            INSERT INTO members (
-                member_id, station_id, registration_number,
-                first_name, middle_name, last_name, gender,
-                date_of_birth, date_joined, address, phone_number, email,
-                employee_id, grade_level,
-                nok1_name, nok1_relationship, nok1_address, nok1_phone,
-                nok2_name, nok2_relationship, nok2_address, nok2_phone,
+        with self.transaction():
+            # Get next member ID
+            next_num = self.get_next_member_number()
+            member_id = f"NFC{next_num:04d}"
+            
+            self.run('members.insert', (
+                member_id, member_data['station_id'], member_id,
+                member_data['first_name'], member_data.get('middle_name'),
+                member_data['last_name'], member_data['gender'],
+                member_data.get('date_of_birth'), member_data['date_joined'],
+                member_data.get('address'), member_data.get('phone_number'),
+                member_data.get('email'), member_data.get('employee_id'),
+                member_data.get('grade_level'),
+                member_data.get('nok1_name'), member_data.get('nok1_relationship'),
+                member_data.get('nok1_address'), member_data.get('nok1_phone'),
+                member_data.get('nok2_name'), member_data.get('nok2_relationship'),
+                member_data.get('nok2_address'), member_data.get('nok2_phone'),
                 created_by
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """
-        
-        self.execute(query, (
-            member_id, member_data['station_id'], member_id,
-            member_data['first_name'], member_data.get('middle_name'),
-            member_data['last_name'], member_data['gender'],
-            member_data.get('date_of_birth'), member_data['date_joined'],
-            member_data.get('address'), member_data.get('phone_number'),
-            member_data.get('email'), member_data.get('employee_id'),
-            member_data.get('grade_level'),
-            member_data.get('nok1_name'), member_data.get('nok1_relationship'),
-            member_data.get('nok1_address'), member_data.get('nok1_phone'),
-            member_data.get('nok2_name'), member_data.get('nok2_relationship'),
-            member_data.get('nok2_address'), member_data.get('nok2_phone'),
-            created_by
-        ))
+            ))
+            
+            # Update next member number
+            self.update_setting('next_member_number', str(next_num + 1))
+            
         
-        # Update next member number
-        self.update_setting('next_member_number', str(next_num + 1))
-        
-        self.commit()
         return member_id
     
     def update_member(self, member_id: str, member_data: Dict, modified_by: str):
         """Update member"""
-        query = """
-            UPDATE members SET
-                station_id = ?, first_name = ?, middle_name = ?, last_name = ?,
-                gender = ?, date_of_birth = ?, address = ?, phone_number = ?,
-                email = ?, employee_id = ?, grade_level = ?,
-                nok1_name = ?, nok1_relationship = ?, nok1_address = ?, nok1_phone = ?,
-                nok2_name = ?, nok2_relationship = ?, nok2_address = ?, nok2_phone = ?,
-                modified_by = ?
-            WHERE member_id = ?
-        """
-        
-        self.execute(query, (
-            member_data['station_id'], member_data['first_name'],
-            member_data.get('middle_name'), member_data['last_name'],
-            member_data['gender'], member_data.get('date_of_birth'),
-            member_data.get('address'), member_data.get('phone_number'),
-            member_data.get('email'), member_data.get('employee_id'),
-            member_data.get('grade_level'),
-            member_data.get('nok1_name'), member_data.get('nok1_relationship'),
-            member_data.get('nok1_address'), member_data.get('nok1_phone'),
-            member_data.get('nok2_name'), member_data.get('nok2_relationship'),
-            member_data.get('nok2_address'), member_data.get('nok2_phone'),
-            modified_by, member_id
-        ))
-        self.commit()
+        with self.transaction():
+            self.run('members.update', (
+                member_data['station_id'], member_data['first_name'],
+                member_data.get('middle_name'), member_data['last_name'],
+                member_data['gender'], member_data.get('date_of_birth'),
+                member_data.get('address'), member_data.get('phone_number'),
+                member_data.get('email'), member_data.get('employee_id'),
+                member_data.get('grade_level'),
+                member_data.get('nok1_name'), member_data.get('nok1_relationship'),
+                member_data.get('nok1_address'), member_data.get('nok1_phone'),
+                member_data.get('nok2_name'), member_data.get('nok2_relationship'),
+                member_data.get('nok2_address'), member_data.get('nok2_phone'),
+                modified_by, member_id
+            ))
+    
+    def set_member_status(self, member_id: str, is_active: bool, is_deceased: bool,
+                          deceased_date: Optional[str], modified_by: str):
+        """Mark a member active, inactive or deceased"""
+        with self.transaction():
+            self.run('members.set_status', (
+                1 if is_active else 0, 1 if is_deceased else 0, deceased_date,
+                modified_by, member_id
+            ))
     
     def get_member_summary(self, member_id: Optional[str] = None) -> List[Dict]:
-        """Get member account summary"""
-        query = "SELECT * FROM vw_member_summary"
+        """Get member account summary (one row per member from member_balances)"""
         if member_id:
-            query += " WHERE member_id = ?"
-            return self.fetchall(query, (member_id,))
-        return self.fetchall(query)
+            return self.query('members.summary_one', (member_id,))
+        return self.query('members.summary')
+    
+    def iter_member_summary(self) -> Iterator[Dict]:
+        """Stream every member's account summary, in member order"""
+        return self.iter_query('members.summary')
+    
+    # ========================================================================
+    # MEMBER BALANCES
+    # ========================================================================
+    
+    def refresh_member_balance(self, member_id: str):
+        """Recompute one member's row in member_balances (does not commit)"""
+        self.run('member_balances.refresh_member', (member_id,))
+    
+    def rebuild_member_balances(self):
+        """Recompute member_balances for every member"""
+        with self.transaction():
+            self.run('member_balances.refresh_all')
     
     # ========================================================================
     # STATIONS
@@ -191,29 +489,59 @@ class DatabaseManager:
     
     def get_all_stations(self, enabled_only: bool = True) -> List[Dict]:
         """Get all stations"""
-        query = "SELECT * FROM stations"
-        if enabled_only:
-            query += " WHERE enabled = 1"
-        query += " ORDER BY station_id"
-        return self.fetchall(query)
+        return self.query('stations.all_enabled' if enabled_only else 'stations.all')
+    
+    def get_station_stats_bulk(self) -> Dict[str, Dict]:
+        """Member counts, savings and outstanding loans for every station in one query"""
+        rows = self.query('stations.stats')
+        return {row.pop('station_id'): row for row in rows}
+    
+    def get_station(self, station_id: str) -> Optional[Dict]:
+        """Get station by ID"""
+        return self.query_one('stations.get', (station_id,))
+    
+    def get_last_station_id(self) -> Optional[str]:
+        """Highest station ID in use, if any"""
+        return self.query_one('stations.last_id')['station_id']
+    
+    def get_station_members(self, station_id: str) -> List[Dict]:
+        """All members of a station, in member order"""
+        return self.query('stations.members', (station_id,))
+    
+    def insert_station(self, station_data: Dict):
+        """Add a station with an ID chosen by the user"""
+        with self.transaction():
+            self.run('stations.insert', (
+                station_data['station_id'], station_data['station_name'],
+                station_data['address'], station_data['city']
+            ))
+    
+    def update_station(self, station_id: str, station_data: Dict):
+        """Update a station's name, city and address"""
+        with self.transaction():
+            self.run('stations.update', (
+                station_data['station_name'], station_data['city'],
+                station_data['address'], station_id
+            ))
+    
+    def delete_station(self, station_id: str):
+        """Delete a station"""
+        with self.transaction():
+            self.run('stations.delete', (station_id,))
     
     def add_station(self, city: str) -> str:
         """Add new station"""
-        # Get next station ID
-        next_num = int(self.get_setting('next_station_number'))
-        station_id = f"{next_num:02d}"
-        station_name = f"NFC - {city}"
+        with self.transaction():
+            # Get next station ID
+            next_num = int(self.get_setting('next_station_number'))
+            station_id = f"{next_num:02d}"
+            station_name = f"NFC - {city}"
+            
+            self.run('stations.insert', (station_id, station_name, city, city))
+            
+            # Update next station number
+            self.update_setting('next_station_number', str(next_num + 1))
         
-        query = """
-            INSERT INTO stations (station_id, station_name, address, city, enabled)
-            VALUES (?, ?, ?, ?, 1)
-        """
-        self.execute(query, (station_id, station_name, city, city))
-        
-        # Update next station number
-        self.update_setting('next_station_number', str(next_num + 1))
-        
-        self.commit()
         return station_id
     
     # ========================================================================
@@ -222,101 +550,267 @@ class DatabaseManager:
     
     def get_savings_types(self) -> List[Dict]:
         """Get all savings types"""
-        return self.fetchall("SELECT * FROM savings_types WHERE is_active = 1")
+        return self.query('savings.types')
     
     def get_member_savings_accounts(self, member_id: str) -> List[Dict]:
         """Get member's savings accounts"""
-        query = """
-            SELECT sa.*, st.type_name, st.type_code, st.interest_rate
-            FROM savings_accounts sa
-            JOIN savings_types st ON sa.savings_type_id = st.savings_type_id
-            WHERE sa.member_id = ? AND sa.is_active = 1
-        """
-        return self.fetchall(query, (member_id,))
+        return self.query('savings.member_accounts', (member_id,))
     
     def create_savings_account(self, member_id: str, savings_type_id: int) -> int:
         """Create savings account for member"""
-        # Get type code
-        stype = self.fetchone(
-            "SELECT type_code FROM savings_types WHERE savings_type_id = ?",
-            (savings_type_id,)
-        )
-        
-        account_number = f"{member_id}-{stype['type_code'][:4].upper()}"
+        with self.transaction():
+            # Get type code
+            stype = self.query_one('savings.type_code', (savings_type_id,))
+            
+            account_number = f"{member_id}-{stype['type_code'][:4].upper()}"
+            
+            cursor = self.run('savings.insert_account', (member_id, savings_type_id, account_number))
         
-        query = """
-            INSERT INTO savings_accounts (member_id, savings_type_id, account_number)
-            VALUES (?, ?, ?)
-        """
-        cursor = self.execute(query, (member_id, savings_type_id, account_number))
-        self.commit()
         return cursor.lastrowid
     
     def deposit_to_savings(self, account_id: int, amount: float, 
                           transaction_data: Dict, created_by: str):
         """Deposit to savings account"""
-        # Update account balance
-        query = """
-            UPDATE savings_accounts 
-            SET current_balance = current_balance + ?,
-                total_deposits = total_deposits + ?
-            WHERE account_id = ?
-        """
-        self.execute(query, (amount, amount, account_id))
-        
-        # Record transaction
-        account = self.fetchone(
-            "SELECT member_id FROM savings_accounts WHERE account_id = ?",
-            (account_id,)
-        )
-        
-        self.record_transaction(
-            member_id=account['member_id'],
-            transaction_type="Savings Deposit",
-            account_type="Savings",
-            account_id=str(account_id),
-            amount=amount,
-            is_credit=True,
-            transaction_data=transaction_data,
-            created_by=created_by
-        )
-        
-        self.commit()
+        with self.transaction():
+            # Update account balance
+            self.run('savings.deposit', (amount, amount, account_id))
+            
+            # Record transaction
+            account = self.query_one('savings.account_balance', (account_id,))
+            
+            self.record_transaction(
+                member_id=account['member_id'],
+                transaction_type="Savings Deposit",
+                account_type="Savings",
+                account_id=str(account_id),
+                amount=amount,
+                is_credit=True,
+                transaction_data=transaction_data,
+                created_by=created_by
+            )
+            
+            self.refresh_member_balance(account['member_id'])
     
     def withdraw_from_savings(self, account_id: int, amount: float,
                              transaction_data: Dict, created_by: str):
         """Withdraw from savings account"""
-        # Check balance
-        account = self.fetchone(
-            "SELECT current_balance, member_id FROM savings_accounts WHERE account_id = ?",
-            (account_id,)
-        )
+        with self.transaction():
+            # Check balance
+            account = self.query_one('savings.account_balance', (account_id,))
+            
+            if account['current_balance'] < amount:
+                raise ValueError("Insufficient balance")
+            
+            # Update account balance
+            self.run('savings.withdraw', (amount, amount, account_id))
+            
+            # Record transaction
+            self.record_transaction(
+                member_id=account['member_id'],
+                transaction_type="Savings Withdrawal",
+                account_type="Savings",
+                account_id=str(account_id),
+                amount=amount,
+                is_credit=False,
+                transaction_data=transaction_data,
+                created_by=created_by
+            )
+            
+            self.refresh_member_balance(account['member_id'])
+    
+    def get_interest_posting(self, period: str) -> Optional[Dict]:
+        """The interest posting recorded for a 'YYYY-MM' period, if any"""
+        return self.query_one('interest.posting', (period,))
+    
+    def get_next_interest_period(self) -> str:
+        """The only period post_monthly_interest will accept next, as 'YYYY-MM'
+
+        The month after the last one posted, or last month if interest has
+        never been posted.
+        """
+        last = self.query_one('interest.last_posting')
+        if last:
+            year, month = map(int, last['period'].split('-'))
+            return (datetime(year, month, 1) + relativedelta(months=1)).strftime('%Y-%m')
+        first_of_month = datetime.now().date().replace(day=1)
+        return (first_of_month - timedelta(days=1)).strftime('%Y-%m')
+    
+    def get_due_interest_period(self) -> Optional[str]:
+        """The next period to post if it has already ended, else None"""
+        period = self.get_next_interest_period()
+        if self._interest_posting_date(period) > datetime.now().date().isoformat():
+            return None
+        return period
+    
+    @staticmethod
+    def _interest_posting_date(period: str) -> str:
+        """Last day of a 'YYYY-MM' period, which its interest is dated"""
+        match = re.fullmatch(r'(\d{4})-(\d{2})', period or '')
+        if not match or not 1 <= int(match.group(2)) <= 12:
+            raise ValueError(f"Period must be YYYY-MM: {period}")
+        year, month = int(match.group(1)), int(match.group(2))
+        return f"{period}-{calendar.monthrange(year, month)[1]:02d}"
+    
+    def post_monthly_interest(self, period: str, created_by: str, dry_run: bool = False) -> Dict:
+        """Credit one month's savings interest to every eligible account
+
+        period is 'YYYY-MM' and must have ended (or end today). Months are
+        posted one at a time, in order: period must be
+        get_next_interest_period(). Each active account of an active member
+        earns its savings type's monthly rate on its balance as at the last
+        day of the period, if the type has interest enabled and that balance
+        is at least the type's minimum. The balance is the current one less
+        the savings movements journalled after that day. The accounts are
+        staged in a temp table, then credited with one UPDATE ... FROM,
+        journalled with one INSERT ... SELECT dated the last day of the
+        period, and added to their members' balances, all in one
+        transaction().
+
+        A period can only be posted once; posting it again raises ValueError.
+        With dry_run=True nothing is written. Either way the result has
+        period, posting_date, accounts, members, total_interest, by_type and
+        dry_run.
+        """
+        posting_date = self._interest_posting_date(period)
+        
+        posted = self.get_interest_posting(period)
+        if posted:
+            raise ValueError(f"Interest for {period} was already posted on {posted['posted_date']}")
+        next_period = self.get_next_interest_period()
+        if period != next_period:
+            raise ValueError(
+                f"Interest is posted one month at a time, in order; "
+                f"the next period to post is {next_period}"
+            )
+        if not dry_run and posting_date > datetime.now().date().isoformat():
+            raise ValueError(f"{period} has not ended yet")
         
-        if account['current_balance'] < amount:
-            raise ValueError("Insufficient balance")
+        self.run('interest.drop_run')
+        try:
+            # Staged inside the posting transaction, so no balance moves in between
+            with nullcontext() if dry_run else self.transaction():
+                self.run('interest.stage_run', (posting_date,))
+                totals = self.query_one('interest.run_totals')
+                result = {
+                    'period': period,
+                    'posting_date': posting_date,
+                    'accounts': totals['accounts'],
+                    'members': totals['members'],
+                    'total_interest': round(totals['total_interest'], 2),
+                    'by_type': self.query('interest.run_by_type'),
+                    'dry_run': dry_run,
+                }
+                
+                if not dry_run:
+                    # The period's primary key also stops a concurrent second run
+                    self.run('interest.record_posting', (
+                        period, posting_date, result['accounts'], result['total_interest'], created_by
+                    ))
+                    self.run('interest.credit_accounts')
+                    self.run('interest.insert_transactions', (
+                        posting_date, f"Interest for {period}", created_by
+                    ))
+                    self.run('interest.credit_balances')
+                    self.run('interest.refresh_missing_balances')
+        finally:
+            self.run('interest.drop_run')
         
-        # Update account balance
-        query = """
-            UPDATE savings_accounts 
-            SET current_balance = current_balance - ?,
-                total_withdrawals = total_withdrawals + ?
-            WHERE account_id = ?
+        return result
+    
+    # ========================================================================
+    # DEATH BENEFITS
+    # ========================================================================
+    
+    def get_death_benefit(self, deceased_member_id: str) -> Optional[Dict]:
+        """The death benefit processed for a member, if any"""
+        return self.query_one('death_benefit.by_member', (deceased_member_id,))
+    
+    def process_death_benefit(self, deceased_member_id: str, created_by: str) -> Dict:
+        """Charge the death benefit levy to every active member
+
+        The member must already be marked deceased. Each other active member
+        pays death_benefit_amount from their premium savings account; members
+        whose premium balance does not cover it are skipped and counted. The
+        accounts are staged in a temp table, then debited with one
+        UPDATE ... FROM, journalled with one INSERT ... SELECT, recorded in
+        death_benefit_charges with another, and the total is credited to the
+        deceased member, all in one transaction().
+
+        A member's death is processed once; processing it again raises
+        ValueError. Returns benefit_id, per_member_charge, members_charged,
+        members_skipped and total_benefit_amount.
         """
-        self.execute(query, (amount, amount, account_id))
+        if self.get_setting('death_benefit_enabled') != '1':
+            raise ValueError("Death benefit system is disabled")
+        charge = round(float(self.get_setting('death_benefit_amount') or 0), 2)
+        if charge <= 0:
+            raise ValueError("Death benefit amount must be greater than zero")
         
-        # Record transaction
-        self.record_transaction(
-            member_id=account['member_id'],
-            transaction_type="Savings Withdrawal",
-            account_type="Savings",
-            account_id=str(account_id),
-            amount=amount,
-            is_credit=False,
-            transaction_data=transaction_data,
-            created_by=created_by
-        )
+        member = self.get_member(deceased_member_id)
+        if not member or not member['is_deceased']:
+            raise ValueError(f"Member {deceased_member_id} is not marked as deceased")
+        processed = self.get_death_benefit(deceased_member_id)
+        if processed:
+            raise ValueError(
+                f"Death benefit for {deceased_member_id} was already processed on "
+                f"{processed['created_date']}"
+            )
         
-        self.commit()
+        today = datetime.now().date().isoformat()
+        full_name = f"{member['first_name']} {member['last_name']}"
+        
+        self.run('death_benefit.drop_levy')
+        try:
+            with self.transaction():
+                # The unique index on deceased_member_id also stops a concurrent second run
+                benefit_id = self.run('death_benefit.insert', (
+                    deceased_member_id, member['deceased_date'] or today, charge, created_by
+                )).lastrowid
+                
+                self.run('death_benefit.stage_levy', (deceased_member_id, charge))
+                totals = self.query_one('death_benefit.levy_totals', (deceased_member_id,))
+                charged = totals['charged']
+                total = round(charge * charged, 2)
+                
+                last_transaction = self.query_one('transactions.last_id')['transaction_id']
+                self.run('death_benefit.debit_accounts', (charge, charge))
+                self.run('death_benefit.insert_transactions', (
+                    today, f"Death benefit levy - {full_name} ({deceased_member_id})",
+                    charge, created_by
+                ))
+                self.run('death_benefit.insert_charges', (
+                    benefit_id, deceased_member_id, last_transaction
+                ))
+                self.run('death_benefit.debit_balances', (charge, charge))
+                self.run('death_benefit.refresh_missing_balances')
+                
+                # The beneficiary's payout, held on the deceased member's record
+                beneficiary = member['nok1_name'] or 'next of kin'
+                self.record_transaction(
+                    member_id=deceased_member_id,
+                    transaction_type="Death Benefit",
+                    account_type="Benefit",
+                    account_id=str(benefit_id),
+                    amount=total,
+                    is_credit=True,
+                    transaction_data={
+                        'transaction_date': today,
+                        'description': f"Death benefit payable to {beneficiary}"
+                    },
+                    created_by=created_by
+                )
+                
+                self.run('death_benefit.complete', (total, charged, benefit_id))
+        finally:
+            self.run('death_benefit.drop_levy')
+        
+        return {
+            'benefit_id': benefit_id,
+            'per_member_charge': charge,
+            'members_charged': charged,
+            'members_skipped': totals['active_members'] - charged,
+            'total_benefit_amount': total,
+        }
     
     # ========================================================================
     # LOANS
@@ -324,140 +818,379 @@ class DatabaseManager:
     
     def get_loan_types(self) -> List[Dict]:
         """Get all loan types"""
-        return self.fetchall("SELECT * FROM loan_types WHERE is_active = 1")
+        return self.query('loans.types')
     
     def get_member_loans(self, member_id: str, active_only: bool = True) -> List[Dict]:
         """Get member's loans"""
-        query = """
-            SELECT l.*, lt.type_name, lt.type_code
-            FROM loans l
-            JOIN loan_types lt ON l.loan_type_id = lt.loan_type_id
-            WHERE l.member_id = ?
-        """
-        if active_only:
-            query += " AND l.status = 'Active'"
-        query += " ORDER BY l.created_date DESC"
-        return self.fetchall(query, (member_id,))
+        return self.query('loans.member_active' if active_only else 'loans.member', (member_id,))
+    
+    def iter_loan_portfolio(self) -> Iterator[Dict]:
+        """Stream every loan with its type name, in loan order"""
+        return self.iter_query('loans.portfolio')
+    
+    def get_loan_portfolio_summary(self) -> Dict:
+        """Portfolio counts and totals, with the longest value of each exported column"""
+        return self.query_one('loans.portfolio_summary')
+    
+    def get_loan_portfolio_breakdown(self, by: str) -> List[Dict]:
+        """Loan counts and totals per 'type' or per 'station'"""
+        return self.query(f'loans.portfolio_by_{by}')
     
     def disburse_loan(self, loan_data: Dict, created_by: str) -> int:
         """Disburse a new loan"""
-        member_id = loan_data['member_id']
-        
-        # Calculate loan details
-        principal = loan_data['principal_amount']
-        interest_rate = loan_data['interest_rate']
-        duration = loan_data['duration_months']
-        
-        interest_amount = principal * (interest_rate / 100)
-        total_amount = principal + interest_amount
-        monthly_installment = total_amount / duration
-        
-        # Generate loan number
-        loan_number = f"L-{member_id}-{datetime.now().strftime('%Y%m%d%H%M%S')}"
-        
-        # Create loan
-        query = """
-            INSERT INTO loans (
-                member_id, station_id, loan_type_id, loan_number,
-                principal_amount, interest_rate, interest_amount, total_amount,
-                monthly_installment, duration_months, balance_outstanding,
-                disbursement_date, start_date, end_date,
-                cheque_number, bank_name, status, created_by
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, 'Active', ?)
-        """
-        
-        cursor = self.execute(query, (
-            member_id, loan_data['station_id'], loan_data['loan_type_id'],
-            loan_number, principal, interest_rate, interest_amount, total_amount,
-            monthly_installment, duration, total_amount,
-            loan_data.get('disbursement_date', datetime.now().date().isoformat()),
-            loan_data['start_date'], loan_data['end_date'],
-            loan_data.get('cheque_number'), loan_data.get('bank_name'),
-            created_by
-        ))
-        
-        loan_id = cursor.lastrowid
-        
-        # Record transaction
-        self.record_transaction(
-            member_id=member_id,
-            transaction_type="Loan Disbursement",
-            account_type="Loan",
-            account_id=str(loan_id),
-            amount=principal,
-            is_credit=True,
-            transaction_data={
-                'description': f"Loan Disbursement - {loan_number}",
-                'cheque_number': loan_data.get('cheque_number'),
-                'payment_method': loan_data.get('payment_method', 'Cheque')
-            },
-            created_by=created_by
-        )
+        with self.transaction():
+            member_id = loan_data['member_id']
+            
+            # Calculate loan details
+            principal = loan_data['principal_amount']
+            interest_rate = loan_data['interest_rate']
+            duration = loan_data['duration_months']
+            
+            interest_amount = principal * (interest_rate / 100)
+            total_amount = principal + interest_amount
+            monthly_installment = total_amount / duration
+            
+            # Generate loan number
+            loan_number = f"L-{member_id}-{datetime.now().strftime('%Y%m%d%H%M%S')}"
+            
+            # Create loan
+            cursor = self.run('loans.insert', (
+                member_id, loan_data['station_id'], loan_data['loan_type_id'],
+                loan_number, principal, interest_rate, interest_amount, total_amount,
+                monthly_installment, duration, total_amount,
+                loan_data.get('disbursement_date', datetime.now().date().isoformat()),
+                loan_data['start_date'], loan_data['end_date'],
+                loan_data.get('cheque_number'), loan_data.get('bank_name'),
+                created_by
+            ))
+            
+            loan_id = cursor.lastrowid
+            
+            self.run_many('loan_schedule.insert', loan_schedule_rows(
+                loan_id, loan_data['start_date'], duration, total_amount
+            ))
+            
+            # Record transaction
+            self.record_transaction(
+                member_id=member_id,
+                transaction_type="Loan Disbursement",
+                account_type="Loan",
+                account_id=str(loan_id),
+                amount=principal,
+                is_credit=True,
+                transaction_data={
+                    'description': f"Loan Disbursement - {loan_number}",
+                    'cheque_number': loan_data.get('cheque_number'),
+                    'payment_method': loan_data.get('payment_method', 'Cheque')
+                },
+                created_by=created_by
+            )
+            
+            self.refresh_member_balance(member_id)
         
-        self.commit()
         return loan_id
     
     def record_loan_repayment(self, loan_id: int, amount: float,
                              payment_data: Dict, created_by: str):
         """Record loan repayment"""
-        # Get loan details
-        loan = self.fetchone(
-            "SELECT * FROM loans WHERE loan_id = ?",
-            (loan_id,)
-        )
-        
-        if not loan:
-            raise ValueError("Loan not found")
-        
-        balance_before = loan['balance_outstanding']
-        balance_after = max(0, balance_before - amount)
-        
-        # Record repayment
-        query = """
-            INSERT INTO loan_repayments (
-                loan_id, member_id, payment_date,
-                expected_amount, actual_amount, balance_before, balance_after,
-                payment_method, cheque_number, receipt_number, notes,
+        with self.transaction():
+            # Get loan details
+            loan = self.query_one('loans.get', (loan_id,))
+            
+            if not loan:
+                raise ValueError("Loan not found")
+            
+            balance_before = loan['balance_outstanding']
+            balance_after = max(0, balance_before - amount)
+            payment_date = payment_data.get('payment_date', datetime.now().date().isoformat())
+            expected = self.get_expected_repayments([loan_id], payment_date).get(loan_id, 0)
+            
+            # Record repayment
+            self.run('loans.insert_repayment', (
+                loan_id, loan['member_id'], payment_date,
+                expected, amount, balance_before, balance_after,
+                payment_data.get('payment_method'), payment_data.get('cheque_number'),
+                payment_data.get('receipt_number'), payment_data.get('notes'),
                 created_by
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ))
+            
+            # Update loan
+            new_amount_paid = loan['amount_paid'] + amount
+            # A defaulted loan stays defaulted until the arrears job clears it
+            new_status = 'Completed' if balance_after <= 0 else loan['status']
+            
+            self.run('loans.set_repayment', (new_amount_paid, balance_after, new_status, loan_id))
+            self.run('loan_schedule.allocate', (payment_date, loan_id))
+            
+            # Record transaction
+            self.record_transaction(
+                member_id=loan['member_id'],
+                transaction_type="Loan Repayment",
+                account_type="Loan",
+                account_id=str(loan_id),
+                amount=amount,
+                is_credit=False,
+                transaction_data=payment_data,
+                created_by=created_by
+            )
+            
+            self.refresh_member_balance(loan['member_id'])
+    
+    def get_loan_schedule(self, loan_id: int) -> List[Dict]:
+        """A loan's installments in order"""
+        return self.query('loan_schedule.for_loan', (loan_id,))
+    
+    def get_expected_repayments(self, loan_ids, as_of: str) -> Dict[int, float]:
+        """Amount each loan is expected to pay on as_of (see loan_schedule.expected)
+
+        Loans with every installment paid are left out.
         """
+        rows = self.query('loan_schedule.expected', (as_of, json.dumps(list(loan_ids))))
+        return {row['loan_id']: row['due'] or row['next_installment'] for row in rows}
+    
+    def get_installments_due(self, start_date: str, end_date: str) -> List[Dict]:
+        """Unpaid installments of active loans falling due between two dates"""
+        return self.query('loan_schedule.due_between', (start_date, end_date))
+    
+    # ========================================================================
+    # LOAN ARREARS
+    # ========================================================================
+    
+    def run_arrears_job(self, as_of: Optional[str] = None,
+                        created_by: Optional[str] = None, dry_run: bool = False) -> Dict:
+        """Rebuild the loan_arrears snapshot and flip loan statuses against it
+
+        One INSERT ... SELECT over open loans and their overdue installments
+        as at as_of (default today) gives each loan's days past due and
+        arrears. Active loans more than loan_default_days past due are then
+        marked Defaulted, and Defaulted loans that have caught up go back to
+        Active, with one UPDATE each. Balances are unaffected: a defaulted
+        loan still counts as outstanding.
+
+        Each step is timed; the run and its timings are kept in arrears_runs
+        and returned (see arrears_run_report). With dry_run=True the same
+        steps run but are rolled back, so the result previews how many loans
+        would change status; run_id is then None.
+        """
+        as_of = as_of or datetime.now().date().isoformat()
+        default_days = int(self.get_setting('loan_default_days') or 90)
+        timings = {}
         
-        self.execute(query, (
-            loan_id, loan['member_id'], payment_data.get('payment_date', datetime.now().date().isoformat()),
-            loan['monthly_installment'], amount, balance_before, balance_after,
-            payment_data.get('payment_method'), payment_data.get('cheque_number'),
-            payment_data.get('receipt_number'), payment_data.get('notes'),
-            created_by
-        ))
-        
-        # Update loan
-        new_amount_paid = loan['amount_paid'] + amount
-        new_status = 'Completed' if balance_after <= 0 else 'Active'
-        
-        self.execute("""
-            UPDATE loans 
-            SET amount_paid = ?, balance_outstanding = ?, status = ?
-            WHERE loan_id = ?
-        """, (new_amount_paid, balance_after, new_status, loan_id))
+        def step(label: str, name: str, params: tuple = ()) -> sqlite3.Cursor:
+            start = time.perf_counter()
+            cursor = self.run(name, params)
+            timings[label] = time.perf_counter() - start
+            return cursor
         
-        # Record transaction
-        self.record_transaction(
-            member_id=loan['member_id'],
-            transaction_type="Loan Repayment",
-            account_type="Loan",
-            account_id=str(loan_id),
-            amount=amount,
-            is_credit=False,
-            transaction_data=payment_data,
-            created_by=created_by
-        )
+        started = time.perf_counter()
+        run_id = None
+        try:
+            with self.transaction():
+                step('clear', 'arrears.clear')
+                step('snapshot', 'arrears.snapshot', (as_of,))
+                totals = dict(step('totals', 'arrears.totals').fetchone())
+                defaulted = step('flag defaults', 'arrears.flag_defaults', (default_days,)).rowcount
+                cured = step('cure defaults', 'arrears.cure_defaults', (default_days,)).rowcount
+                total_seconds = time.perf_counter() - started
+                
+                if dry_run:
+                    raise _DryRunComplete
+                run_id = self.run('arrears.record_run', (
+                    as_of, default_days, totals['loans_checked'], totals['loans_in_arrears'],
+                    round(totals['total_arrears'], 2), defaulted, cured,
+                    json.dumps(timings), total_seconds, created_by
+                )).lastrowid
+        except _DryRunComplete:
+            pass
         
-        self.commit()
+        return {
+            'run_id': run_id,
+            'as_of': as_of,
+            'default_days': default_days,
+            'loans_checked': totals['loans_checked'],
+            'loans_in_arrears': totals['loans_in_arrears'],
+            'total_arrears': round(totals['total_arrears'], 2),
+            'loans_defaulted': defaulted,
+            'loans_cured': cured,
+            'timings': timings,
+            'total_seconds': total_seconds,
+            'dry_run': dry_run,
+        }
+    
+    def get_last_arrears_run(self) -> Optional[Dict]:
+        """The most recent arrears run, with its timings decoded"""
+        run = self.query_one('arrears.last_run')
+        if run:
+            run['timings'] = json.loads(run['timings'] or '{}')
+        return run
     
+    def get_loans_in_arrears(self, min_days: int = 1) -> List[Dict]:
+        """Loans at least min_days past due in the last snapshot, worst first"""
+        return self.query('arrears.list', (min_days,))
+    
+    # ========================================================================
+    # BATCH POSTING
+    # ========================================================================
+
+    def post_batch(self, entries: List[Dict], created_by: str) -> Dict:
+        """Post a batch of savings deposits and loan repayments atomically
+
+        Each entry has entry_type ('Savings' or 'Loan'), reference (the
+        account_number or loan_number) and amount, plus optional
+        transaction_date, description, payment_method, cheque_number,
+        receipt_number and line (used in error messages). Amounts must be
+        finite and positive and are rounded to kobo; transaction_date must be
+        YYYY-MM-DD and not in the future. The whole batch is validated first;
+        if any line is bad a BatchPostingError listing every problem is raised
+        and nothing is written. Otherwise all updates and ledger rows go in
+        with executemany inside one transaction().
+        """
+        savings_refs = {e.get('reference') for e in entries if e.get('entry_type') == 'Savings'}
+        loan_refs = {e.get('reference') for e in entries if e.get('entry_type') == 'Loan'}
+
+        accounts = self._fetch_by_references('savings.accounts_by_number', savings_refs)
+        loans = self._fetch_by_references('loans.by_number', loan_refs)
+
+        today = datetime.now().date().isoformat()
+
+        # Validate every line before touching anything
+        errors = []
+        amounts = []           # per entry, rounded to kobo
+        dates = []             # per entry, as YYYY-MM-DD
+        for index, entry in enumerate(entries, start=1):
+            line = entry.get('line', index)
+            entry_type = entry.get('entry_type')
+            reference = entry.get('reference')
+            amount = entry.get('amount')
+            txn_date = entry.get('transaction_date') or today
+
+            # inf and nan would poison every balance they are added to
+            if (isinstance(amount, (int, float)) and not isinstance(amount, bool)
+                    and math.isfinite(amount)):
+                amount = round(float(amount), 2)
+            amounts.append(amount)
+
+            if entry_type not in ('Savings', 'Loan'):
+                errors.append((line, f"Unknown entry type: {entry_type}"))
+            elif not isinstance(amount, float) or not math.isfinite(amount) or amount <= 0:
+                errors.append((line, f"Amount must be a finite number greater than zero: {amount}"))
+            elif entry_type == 'Savings':
+                account = accounts.get(reference)
+                if not account:
+                    errors.append((line, f"Savings account not found: {reference}"))
+                elif not account['is_active']:
+                    errors.append((line, f"Savings account is closed: {reference}"))
+            else:
+                loan = loans.get(reference)
+                if not loan:
+                    errors.append((line, f"Loan not found: {reference}"))
+                elif loan['status'] not in ('Active', 'Defaulted'):
+                    errors.append((line, f"Loan is not active: {reference} ({loan['status']})"))
+
+            # Dates are compared as text everywhere, so only ISO dates will do
+            try:
+                txn_date = date.fromisoformat(txn_date).isoformat()
+            except (TypeError, ValueError):
+                errors.append((line, f"Invalid transaction date (use YYYY-MM-DD): {txn_date}"))
+            else:
+                if txn_date > today:
+                    errors.append((line, f"Transaction date is in the future: {txn_date}"))
+            dates.append(txn_date)
+
+        if errors:
+            raise BatchPostingError(errors)
+
+        savings_totals = {}    # account_id -> amount
+        loan_state = {}        # loan_id -> [amount_paid, balance_outstanding]
+        paid_dates = {}        # loan_id -> date of its last line
+        loan_status = {loan['loan_id']: loan['status'] for loan in loans.values()}
+        expected = self.get_expected_repayments(
+            [loan['loan_id'] for loan in loans.values()], today
+        )
+        repayment_rows = []
+        transaction_rows = []
+        member_ids = set()
+
+        for entry, amount, txn_date in zip(entries, amounts, dates):
+            if entry['entry_type'] == 'Savings':
+                account = accounts[entry['reference']]
+                account_id = account['account_id']
+                savings_totals[account_id] = savings_totals.get(account_id, 0) + amount
+                transaction_rows.append((
+                    txn_date, account['member_id'], account['station_id'],
+                    "Savings Deposit", "Savings", str(account_id),
+                    entry.get('description') or '', amount, 1,
+                    entry.get('payment_method'), entry.get('cheque_number'),
+                    entry.get('receipt_number'), created_by
+                ))
+                member_ids.add(account['member_id'])
+            else:
+                # Several lines may hit the same loan, so carry the balance forward
+                loan = loans[entry['reference']]
+                loan_id = loan['loan_id']
+                state = loan_state.setdefault(
+                    loan_id, [loan['amount_paid'], loan['balance_outstanding']]
+                )
+                balance_before = state[1]
+                balance_after = round(max(0, balance_before - amount), 2)
+                state[0] = round(state[0] + amount, 2)
+                state[1] = balance_after
+                paid_dates[loan_id] = txn_date
+                expected_amount = expected.get(loan_id, 0)
+                expected[loan_id] = max(0, expected_amount - amount)
+
+                repayment_rows.append((
+                    loan_id, loan['member_id'], txn_date,
+                    expected_amount, amount, balance_before, balance_after,
+                    entry.get('payment_method'), entry.get('cheque_number'),
+                    entry.get('receipt_number'), entry.get('description'),
+                    created_by
+                ))
+                transaction_rows.append((
+                    txn_date, loan['member_id'], loan['station_id'],
+                    "Loan Repayment", "Loan", str(loan_id),
+                    entry.get('description') or '', amount, 0,
+                    entry.get('payment_method'), entry.get('cheque_number'),
+                    entry.get('receipt_number'), created_by
+                ))
+                member_ids.add(loan['member_id'])
+
+        with self.transaction():
+            self.run_many('savings.deposit', [
+                (round(total, 2), round(total, 2), account_id)
+                for account_id, total in savings_totals.items()
+            ])
+            self.run_many('loans.insert_repayment', repayment_rows)
+            self.run_many('loans.set_repayment', [
+                (paid, balance, 'Completed' if balance <= 0 else loan_status[loan_id], loan_id)
+                for loan_id, (paid, balance) in loan_state.items()
+            ])
+            self.run_many('loan_schedule.allocate', [
+                (paid_date, loan_id) for loan_id, paid_date in paid_dates.items()
+            ])
+            self.run_many('transactions.insert', transaction_rows)
+            self.run_many('member_balances.refresh_member', [
+                (member_id,) for member_id in member_ids
+            ])
+
+        return {
+            'entries': len(entries),
+            'savings_entries': sum(1 for e in entries if e['entry_type'] == 'Savings'),
+            'loan_entries': len(repayment_rows),
+            'total_amount': round(sum(amounts), 2),
+            'members': len(member_ids),
+            'loans_completed': sum(1 for _, balance in loan_state.values() if balance <= 0),
+        }
+
+    def _fetch_by_references(self, name: str, references) -> Dict[str, Dict]:
+        """Run a lookup taking a JSON array of references; rows keyed by 'reference'"""
+        references = json.dumps([r for r in references if r])
+        return {row['reference']: row for row in self.query(name, (references,))}
+
     # ========================================================================
     # TRANSACTIONS
     # ========================================================================
-    
+
     def record_transaction(self, member_id: str, transaction_type: str,
                           account_type: str, account_id: str, amount: float,
                           is_credit: bool, transaction_data: Dict, created_by: str):
@@ -465,17 +1198,7 @@ class DatabaseManager:
         # Get station from member
         member = self.get_member(member_id)
         
-        query = """
-            INSERT INTO transactions (
-                transaction_date, member_id, station_id,
-                transaction_type, account_type, account_id,
-                description, amount, is_credit,
-                payment_method, cheque_number, receipt_number,
-                created_by
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """
-        
-        self.execute(query, (
+        self.run('transactions.insert', (
             transaction_data.get('transaction_date', datetime.now().date().isoformat()),
             member_id, member['station_id'],
             transaction_type, account_type, account_id,
@@ -491,24 +1214,45 @@ class DatabaseManager:
                         start_date: Optional[str] = None,
                         end_date: Optional[str] = None) -> List[Dict]:
         """Get transactions"""
-        query = "SELECT * FROM transactions WHERE 1=1"
+        name = 'transactions.list'
         params = []
-        
-        if member_id:
-            query += " AND member_id = ?"
-            params.append(member_id)
-        
-        if start_date:
-            query += " AND transaction_date >= ?"
-            params.append(start_date)
-        
-        if end_date:
-            query += " AND transaction_date <= ?"
-            params.append(end_date)
-        
-        query += " ORDER BY transaction_date DESC, transaction_id DESC"
-        
-        return self.fetchall(query, tuple(params))
+        for key, value in (('member', member_id), ('from', start_date), ('to', end_date)):
+            if value:
+                name += f'_{key}'
+                params.append(value)
+        return self.query(name, tuple(params))
+    
+    def get_member_statement_data(self, start_date: str, end_date: str,
+                                  member_ids: Optional[List[str]] = None) -> List[Dict]:
+        """Member, summary and period transactions for many statements at once
+
+        Three set-based queries instead of three per member. Returns one
+        {'member', 'summary', 'transactions'} dict per active member, optionally
+        limited to member_ids, in member order.
+        """
+        wanted = set(member_ids) if member_ids else None
+        statements = {
+            member['member_id']: {'member': member, 'summary': None, 'transactions': []}
+            for member in self.get_all_members()
+            if wanted is None or member['member_id'] in wanted
+        }
+        for summary in self.query('members.summary'):
+            if summary['member_id'] in statements:
+                statements[summary['member_id']]['summary'] = summary
+        # Newest first, as in a single statement
+        for txn in self.iter_query('transactions.list_from_to', (start_date, end_date)):
+            if txn['member_id'] in statements:
+                statements[txn['member_id']]['transactions'].append(txn)
+        return [statements[member_id] for member_id in sorted(statements)]
+    
+    def iter_cashbook(self, start_date: str, end_date: str,
+                      payment_method: str = 'Cash') -> Iterator[Dict]:
+        """Stream one payment method's transactions for a period, oldest first"""
+        return self.iter_query('transactions.cashbook', (payment_method, start_date, end_date))
+    
+    def get_cashbook_opening_balance(self, start_date: str, payment_method: str = 'Cash') -> float:
+        """Receipts less payments for a payment method before start_date"""
+        return self.query_one('transactions.cashbook_opening', (payment_method, start_date))['balance']
     
     # ========================================================================
     # SYSTEM SETTINGS
@@ -516,20 +1260,17 @@ class DatabaseManager:
     
     def get_setting(self, key: str) -> Optional[str]:
         """Get system setting"""
-        result = self.fetchone(
-            "SELECT setting_value FROM system_settings WHERE setting_key = ?",
-            (key,)
-        )
+        result = self.query_one('settings.get', (key,))
         return result['setting_value'] if result else None
     
     def update_setting(self, key: str, value: str, modified_by: Optional[str] = None):
         """Update system setting"""
-        self.execute("""
-            UPDATE system_settings 
-            SET setting_value = ?, modified_by = ?
-            WHERE setting_key = ?
-        """, (value, modified_by, key))
-        self.commit()
+        with self.transaction():
+            self.run('settings.update', (value, modified_by, key))
+    
+    def get_report_fingerprint(self) -> Dict:
+        """Persistent marker of the data reports are built from (see reports.fingerprint)"""
+        return self.query_one('reports.fingerprint')
     
     def get_next_member_number(self) -> int:
         """Get next member number"""
@@ -541,5 +1282,7 @@ class DatabaseManager:
     
     def close(self):
         """Close database connection"""
+        if self.read_pool:
+            self.read_pool.close()
         if self.conn:
             self.conn.close()
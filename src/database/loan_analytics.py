@@ -0,0 +1,238 @@
+"""
+Loan Analytics - Portfolio at risk, aging and collection trends
+===============================================================
+Days past due and amounts due come from loan_schedule, exactly as the
+arrears job reads them (see queries.DAYS_PAST_DUE). They are loaded into
+NumPy arrays with one query each, and every figure is then a vectorized
+pass over those arrays: buckets by np.searchsorted, and totals per bucket,
+loan type, station and month by np.bincount.
+"""
+
+import threading
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Dict, List, Optional
+
+import numpy as np
+
+
+# Aging buckets by days past due; each edge is the first day of the next bucket
+AGING_LABELS = ('Current', '1-30 days', '31-60 days', '61-90 days',
+                '91-180 days', 'Over 180 days')
+AGING_EDGES = np.array([1, 31, 61, 91, 181])
+
+# Portfolio at risk: balance of loans more than this many days past due.
+# Each threshold falls on a bucket edge, so PAR is a sum of bucket columns.
+PAR_DAYS = (30, 60, 90)
+
+TREND_MONTHS = 12
+
+
+@dataclass
+class LoanColumns:
+    """One array per open loan column, index-aligned"""
+
+    loan_type: np.ndarray
+    station: np.ndarray
+    days_past_due: np.ndarray
+    balance: np.ndarray
+
+
+@dataclass
+class AgingTable:
+    """Open loans and their balance per aging bucket, one row per group"""
+
+    names: List[str]
+    loans: np.ndarray        # groups x buckets
+    outstanding: np.ndarray  # groups x buckets
+
+    def par(self, days: int) -> np.ndarray:
+        """Balance more than days past due, per group"""
+        first = int(np.searchsorted(AGING_EDGES, days, side='right')) + 1
+        return self.outstanding[:, first:].sum(axis=1)
+
+    def rows(self) -> List[Dict]:
+        """One dict per group for tables: totals, bucket balances and PAR"""
+        rows = []
+        outstanding = self.outstanding.sum(axis=1)
+        par = {days: self.par(days) for days in PAR_DAYS}
+        for i, name in enumerate(self.names):
+            row = {'name': name, 'loans': int(self.loans[i].sum()),
+                   'outstanding': float(outstanding[i])}
+            for bucket, amount in enumerate(self.outstanding[i]):
+                row[f'bucket_{bucket}'] = float(amount)
+            for days in PAR_DAYS:
+                row[f'par{days}'] = float(par[days][i])
+                row[f'par{days}_ratio'] = float(par[days][i] / outstanding[i]) if outstanding[i] else 0.0
+            rows.append(row)
+        return rows
+
+
+@dataclass
+class PortfolioAnalytics:
+    """Risk and collection figures for the loan portfolio as at one day"""
+
+    as_of: date
+    aging: AgingTable                 # one row: the whole portfolio
+    aging_by_type: AgingTable
+    aging_by_station: AgingTable
+    # Per month, oldest first: label, amount due, amount collected, rate
+    collections: List[Dict] = field(default_factory=list)
+
+    @property
+    def open_loans(self) -> int:
+        """Active and defaulted loans"""
+        return int(self.aging.loans.sum())
+
+    @property
+    def outstanding(self) -> float:
+        """Balance of the open loans"""
+        return float(self.aging.outstanding.sum())
+
+    def par(self, days: int) -> float:
+        """Balance more than days past due"""
+        return float(self.aging.par(days)[0])
+
+    def par_ratio(self, days: int) -> float:
+        """PAR as a share of the open balance"""
+        return self.par(days) / self.outstanding if self.outstanding else 0.0
+
+    def aging_rows(self) -> List[Dict]:
+        """Loans, balance and share of the open balance per bucket"""
+        outstanding = self.outstanding
+        return [
+            {'bucket': label, 'loans': int(self.aging.loans[0, i]),
+             'outstanding': float(self.aging.outstanding[0, i]),
+             'share': float(self.aging.outstanding[0, i]) / outstanding if outstanding else 0.0}
+            for i, label in enumerate(AGING_LABELS)
+        ]
+
+
+# Row layout of analytics.loans
+LOAN_ROW = np.dtype([
+    ('loan_type', np.int64), ('station', np.int64),
+    ('days_past_due', np.int64), ('balance', np.float64),
+])
+
+
+def loan_columns(rows) -> LoanColumns:
+    """Split analytics.loans rows into typed arrays"""
+    data = np.fromiter(rows, dtype=LOAN_ROW, count=len(rows))
+    return LoanColumns(
+        loan_type=data['loan_type'],
+        station=data['station'],
+        days_past_due=data['days_past_due'],
+        balance=data['balance'],
+    )
+
+
+def day_columns(rows):
+    """Split (days since 1970-01-01, amount) rows into datetime64[D] and amount arrays"""
+    data = np.array(rows, dtype=np.float64).reshape(-1, 2)
+    return data[:, 0].astype(np.int64).astype('datetime64[D]'), data[:, 1]
+
+
+def aging_table(codes: np.ndarray, buckets: np.ndarray, balance: np.ndarray,
+                groups: List[Dict]) -> AgingTable:
+    """Loans and balance per (group, bucket) with one bincount each
+
+    groups are {'code', 'name'} dicts; codes outside them are dropped.
+    """
+    width = len(AGING_LABELS)
+    size = max([int(codes.max(initial=0))] + [g['code'] for g in groups]) + 1
+    cells = codes * width + buckets
+    loans = np.bincount(cells, minlength=size * width).reshape(size, width)
+    outstanding = np.bincount(cells, weights=balance, minlength=size * width).reshape(size, width)
+    picked = [g['code'] for g in groups]
+    return AgingTable([g['name'] for g in groups], loans[picked], outstanding[picked])
+
+
+def monthly_totals(day: np.ndarray, amount: np.ndarray, first_month: np.datetime64,
+                   months: int) -> np.ndarray:
+    """amount summed per calendar month from first_month, for months months"""
+    month = day.astype('datetime64[M]').astype(np.int64) - first_month.astype(np.int64)
+    in_window = (month >= 0) & (month < months)
+    return np.bincount(month[in_window], weights=amount[in_window], minlength=months)
+
+
+def collection_trend(due_day: np.ndarray, due_amount: np.ndarray,
+                     paid_day: np.ndarray, paid_amount: np.ndarray,
+                     as_of: np.datetime64, months: int = TREND_MONTHS) -> List[Dict]:
+    """Installments due and repayments collected per month, ending with as_of's month"""
+    last_month = as_of.astype('datetime64[M]')
+    first_month = last_month - (months - 1)
+    due = monthly_totals(due_day, due_amount, first_month, months)
+    collected = monthly_totals(paid_day, paid_amount, first_month, months)
+
+    labels = np.arange(first_month, last_month + 1).astype(str)
+    return [
+        {'month': str(label), 'due': float(due[i]), 'collected': float(collected[i]),
+         'rate': float(collected[i] / due[i]) if due[i] else 0.0}
+        for i, label in enumerate(labels)
+    ]
+
+
+def compute(loans: LoanColumns, due_day: np.ndarray, due_amount: np.ndarray,
+            paid_day: np.ndarray, paid_amount: np.ndarray, as_of: date,
+            loan_types: List[Dict], stations: List[Dict]) -> PortfolioAnalytics:
+    """All portfolio figures from loaded columns"""
+    buckets = np.searchsorted(AGING_EDGES, loans.days_past_due, side='right')
+
+    return PortfolioAnalytics(
+        as_of=as_of,
+        aging=aging_table(np.zeros_like(buckets), buckets, loans.balance,
+                          [{'code': 0, 'name': 'Portfolio'}]),
+        aging_by_type=aging_table(loans.loan_type, buckets, loans.balance, loan_types),
+        aging_by_station=aging_table(loans.station, buckets, loans.balance, stations),
+        collections=collection_trend(due_day, due_amount, paid_day, paid_amount,
+                                     np.datetime64(as_of, 'D')),
+    )
+
+
+class LoanAnalyticsService:
+    """Loads loan, installment and repayment columns and computes portfolio analytics
+
+    Loading is most of the cost, so the arrays are kept and reused until
+    the database's data_version() moves or the as-of day changes. One
+    instance is shared per database (DatabaseManager.loan_analytics), so
+    the dashboard and the loan portfolio report reuse the same arrays.
+    Background callers pass the pooled reader to load through; the cache
+    is still keyed on the owning manager's data_version().
+    """
+
+    def __init__(self, db_manager):
+        self.db = db_manager
+        self.lock = threading.Lock()
+        self._loaded_key = None
+        self._loaded = None
+
+    def load(self, as_of: date, db=None, version=None):
+        """Open loans, installments due and repayments, one query each
+
+        Loans carry their days past due as at as_of. Installments and
+        repayments cover the trend window: the TREND_MONTHS months ending
+        with as_of's month. version defaults to self.db.data_version().
+        """
+        db = db or self.db
+        key = (version or self.db.data_version(), as_of)
+        with self.lock:
+            if key != self._loaded_key:
+                month = np.datetime64(as_of, 'M')
+                since = (month - (TREND_MONTHS - 1)).astype('datetime64[D]').item().isoformat()
+                until = (month + 1).astype('datetime64[D]').item().isoformat()
+                loans = loan_columns(db.query_rows('analytics.loans', (as_of.isoformat(),)))
+                due = day_columns(db.query_rows('analytics.installments', (since, until)))
+                paid = day_columns(db.query_rows('analytics.repayments', (since,)))
+                self._loaded = (loans, due, paid)
+                self._loaded_key = key
+            return self._loaded
+
+    def analytics(self, as_of: Optional[date] = None, db=None,
+                  version=None) -> PortfolioAnalytics:
+        """Portfolio at risk, aging by type and station, and the collection trend"""
+        as_of = as_of or date.today()
+        db = db or self.db
+        loans, (due_day, due_amount), (paid_day, paid_amount) = self.load(as_of, db, version)
+        return compute(loans, due_day, due_amount, paid_day, paid_amount, as_of,
+                       db.query('analytics.loan_types'),
+                       db.query('analytics.stations'))
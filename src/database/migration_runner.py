@@ -0,0 +1,202 @@
+"""
+Migration Runner - Versioned schema upgrades
+============================================
+Applies the SQL scripts in migrations/ in order and records each one in
+schema_migrations, so every database knows which upgrades it has had.
+
+Each migration runs in its own transaction: if any statement fails the
+whole script is rolled back and the version stays pending. Every statement
+is timed and kept in schema_migration_steps, so the cost of a large
+upgrade (index builds, summary-table backfills) is known before it is run
+on the next, bigger database. In WAL mode readers keep working while a
+migration builds its indexes and tables; only other writers wait.
+"""
+
+import os
+import re
+import sqlite3
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional
+
+MIGRATIONS_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+    'migrations'
+)
+
+
+@dataclass(frozen=True)
+class Migration:
+    """One schema upgrade script"""
+
+    version: int
+    filename: str
+
+
+# In the order they must be applied. Add new scripts at the end with the
+# next version number; never renumber a released one.
+MIGRATIONS = [
+    Migration(1, 'add_enhancements.sql'),
+    Migration(2, 'add_member_balances.sql'),
+    Migration(3, 'add_member_search.sql'),
+    Migration(4, 'add_composite_indexes.sql'),
+    Migration(5, 'add_cashbook_index.sql'),
+    Migration(6, 'add_interest_postings.sql'),
+    Migration(7, 'add_death_benefit_indexes.sql'),
+    Migration(8, 'add_loan_schedule.sql'),
+    Migration(9, 'add_loan_arrears.sql'),
+    Migration(10, 'add_report_fingerprint.sql'),
+]
+
+_ADD_COLUMN = re.compile(r"^\s*ALTER\s+TABLE\s+(\w+)\s+ADD\s+COLUMN\s+(\w+)", re.IGNORECASE)
+
+
+class MigrationError(Exception):
+    """A migration statement failed; the migration was rolled back"""
+
+    def __init__(self, migration: Migration, step: int, statement: str, error: Exception):
+        self.migration = migration
+        self.step = step
+        self.statement = statement
+        super().__init__(
+            f"Migration {migration.version} ({migration.filename}) failed at step {step}: "
+            f"{error}\n{statement}"
+        )
+
+
+def split_statements(script: str) -> List[str]:
+    """Split a SQL script into complete statements (trigger bodies stay whole)"""
+    statements = []
+    buffer = ''
+    for line in script.splitlines(keepends=True):
+        buffer += line
+        if sqlite3.complete_statement(buffer):
+            statement = buffer.strip()
+            if _strip_comments(statement):
+                statements.append(statement)
+            buffer = ''
+    if _strip_comments(buffer.strip()):
+        statements.append(buffer.strip())
+    return statements
+
+
+def _strip_comments(sql: str) -> str:
+    """SQL without -- comment lines"""
+    return '\n'.join(line for line in sql.splitlines()
+                     if not line.strip().startswith('--')).strip()
+
+
+class MigrationRunner:
+    """Applies pending migrations to one database file"""
+
+    def __init__(self, db_path: str, migrations: List[Migration] = MIGRATIONS,
+                 migrations_dir: str = MIGRATIONS_DIR,
+                 progress: Optional[Callable[[str], None]] = None):
+        self.db_path = db_path
+        self.migrations = migrations
+        self.migrations_dir = migrations_dir
+        self.progress = progress or (lambda message: None)
+
+        # Autocommit mode: transactions are opened explicitly per migration
+        self.conn = sqlite3.connect(db_path, isolation_level=None)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA busy_timeout = 5000")
+        self.ensure_tables()
+
+    def ensure_tables(self):
+        """Create the bookkeeping tables"""
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS schema_migrations (
+                version INTEGER PRIMARY KEY,
+                filename TEXT NOT NULL,
+                applied_date TEXT DEFAULT (datetime('now')),
+                duration_ms REAL NOT NULL
+            )
+        """)
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS schema_migration_steps (
+                version INTEGER NOT NULL,
+                step INTEGER NOT NULL,
+                statement TEXT NOT NULL,
+                duration_ms REAL NOT NULL,
+                rows_changed INTEGER,
+                PRIMARY KEY (version, step)
+            )
+        """)
+
+    def applied(self) -> List[Dict]:
+        """Applied migrations, oldest first"""
+        rows = self.conn.execute("SELECT * FROM schema_migrations ORDER BY version").fetchall()
+        return [dict(row) for row in rows]
+
+    def pending(self, filenames: Optional[List[str]] = None) -> List[Migration]:
+        """Migrations not yet applied, optionally limited to some filenames"""
+        done = {row['version'] for row in self.applied()}
+        return [m for m in self.migrations
+                if m.version not in done and (filenames is None or m.filename in filenames)]
+
+    def apply_pending(self, filenames: Optional[List[str]] = None) -> List[Dict]:
+        """Apply every pending migration in order; returns their timings"""
+        results = []
+        for migration in self.pending(filenames):
+            results.append(self.apply(migration))
+        return results
+
+    def apply(self, migration: Migration) -> Dict:
+        """Run one migration in a transaction and record it"""
+        path = os.path.join(self.migrations_dir, migration.filename)
+        with open(path, encoding='utf-8') as f:
+            statements = split_statements(f.read())
+
+        self.progress(f"Applying {migration.version}: {migration.filename} "
+                      f"({len(statements)} statements)")
+        steps = []
+        started = time.perf_counter()
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            for step, statement in enumerate(statements, start=1):
+                step_start = time.perf_counter()
+                if self._column_exists(statement):
+                    # Re-running an ALTER TABLE ... ADD COLUMN would fail
+                    rows = None
+                else:
+                    rows = self.conn.execute(statement).rowcount
+                elapsed = (time.perf_counter() - step_start) * 1000
+                steps.append((migration.version, step, _strip_comments(statement), elapsed,
+                              rows if rows is not None and rows >= 0 else None))
+                self.progress(f"  step {step}: {elapsed:,.1f} ms  "
+                              f"{_strip_comments(statement).splitlines()[0][:70]}")
+
+            duration = (time.perf_counter() - started) * 1000
+            self.conn.executemany("""
+                INSERT OR REPLACE INTO schema_migration_steps
+                    (version, step, statement, duration_ms, rows_changed)
+                VALUES (?, ?, ?, ?, ?)
+            """, steps)
+            self.conn.execute("""
+                INSERT INTO schema_migrations (version, filename, duration_ms)
+                VALUES (?, ?, ?)
+            """, (migration.version, migration.filename, duration))
+            self.conn.execute("COMMIT")
+        except Exception as e:
+            self.conn.execute("ROLLBACK")
+            raise MigrationError(migration, len(steps) + 1,
+                                 statements[len(steps)] if len(steps) < len(statements) else '',
+                                 e) from e
+
+        self.progress(f"Applied {migration.version} in {duration:,.1f} ms")
+        return {'version': migration.version, 'filename': migration.filename,
+                'duration_ms': duration, 'steps': len(steps)}
+
+    def _column_exists(self, statement: str) -> bool:
+        """Whether statement adds a column that is already there"""
+        match = _ADD_COLUMN.match(_strip_comments(statement))
+        if not match:
+            return False
+        table, column = match.groups()
+        columns = self.conn.execute(f"PRAGMA table_info({table})").fetchall()
+        return any(row['name'] == column for row in columns)
+
+    def close(self):
+        """Close the runner's connection"""
+        self.conn.close()
@@ -0,0 +1,189 @@
+"""
+Query Profiler - Opt-in latency tracking for database calls
+===========================================================
+When enabled, every statement run through DatabaseManager is timed and
+grouped by its normalized SQL (literals replaced by ?). Each group keeps a
+latency histogram. Statements slower than the threshold have their
+EXPLAIN QUERY PLAN captured and are written to a rotating log file.
+
+Enable from Settings > Query Profiler, or in code:
+
+    from database import profiler
+    profiler.enable(slow_ms=50, log_path='data/logs/slow_queries.log')
+    ...
+    print(profiler.current.report())
+"""
+
+import logging
+import os
+import re
+import threading
+from dataclasses import dataclass, field
+from logging.handlers import RotatingFileHandler
+from typing import Dict, List, Optional
+
+# Histogram bucket upper bounds in milliseconds; one more bucket holds the rest
+BUCKET_BOUNDS_MS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500)
+
+# Only these statements have a query plan worth capturing
+EXPLAINABLE = ('SELECT', 'WITH', 'INSERT', 'UPDATE', 'DELETE', 'REPLACE')
+
+LOG_MAX_BYTES = 1_000_000
+LOG_BACKUPS = 5
+
+slow_log = logging.getLogger('nfc.slow_queries')
+slow_log.propagate = False
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"\b\d+(?:\.\d+)?\b")
+_PARAM_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+
+
+def normalize_sql(sql: str) -> str:
+    """Collapse whitespace and replace literals so similar statements group together"""
+    sql = _STRING_LITERAL.sub('?', sql)
+    sql = _NUMBER_LITERAL.sub('?', sql)
+    sql = _PARAM_LIST.sub('(?, ...)', sql)
+    return ' '.join(sql.split())
+
+
+@dataclass
+class QueryProfile:
+    """Latency figures for one normalized statement"""
+
+    sql: str
+    calls: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+    slow_calls: int = 0
+    buckets: List[int] = field(default_factory=lambda: [0] * (len(BUCKET_BOUNDS_MS) + 1))
+    plan: Optional[str] = None
+
+    @property
+    def mean_ms(self) -> float:
+        """Average time per call"""
+        return self.total_ms / self.calls if self.calls else 0.0
+
+    def percentile_ms(self, pct: float) -> float:
+        """Upper bound of the bucket holding the given percentile"""
+        target = self.calls * pct / 100
+        seen = 0
+        for bound, count in zip(BUCKET_BOUNDS_MS, self.buckets):
+            seen += count
+            if seen >= target:
+                return float(bound)
+        return self.max_ms
+
+
+class QueryProfiler:
+    """Collects per-statement timings; shared by every connection in the process"""
+
+    def __init__(self, slow_ms: float = 100.0, log_path: Optional[str] = None):
+        self.slow_ms = slow_ms
+        self.log_path = log_path
+        self.profiles: Dict[str, QueryProfile] = {}
+        self.lock = threading.Lock()
+
+    def record(self, conn, sql: str, params, elapsed: float):
+        """Add one execution; conn is used to explain slow statements"""
+        elapsed_ms = elapsed * 1000
+        key = normalize_sql(sql)
+        slow = elapsed_ms >= self.slow_ms
+
+        with self.lock:
+            profile = self.profiles.get(key)
+            if profile is None:
+                profile = self.profiles[key] = QueryProfile(key)
+            profile.calls += 1
+            profile.total_ms += elapsed_ms
+            profile.max_ms = max(profile.max_ms, elapsed_ms)
+            profile.buckets[self._bucket(elapsed_ms)] += 1
+            if slow:
+                profile.slow_calls += 1
+            need_plan = slow and profile.plan is None
+
+        if not slow:
+            return
+
+        if need_plan:
+            plan = self.explain(conn, sql, params)
+            with self.lock:
+                profile.plan = plan
+        if slow_log.handlers:
+            slow_log.warning("%.1f ms  %s\n%s", elapsed_ms, key, profile.plan or '(no plan)')
+
+    @staticmethod
+    def _bucket(elapsed_ms: float) -> int:
+        """Histogram slot for a latency"""
+        for i, bound in enumerate(BUCKET_BOUNDS_MS):
+            if elapsed_ms <= bound:
+                return i
+        return len(BUCKET_BOUNDS_MS)
+
+    @staticmethod
+    def explain(conn, sql: str, params) -> Optional[str]:
+        """EXPLAIN QUERY PLAN output as indented text, or None"""
+        if params is None or not sql.lstrip().upper().startswith(EXPLAINABLE):
+            return None
+        try:
+            rows = conn.execute("EXPLAIN QUERY PLAN " + sql, params).fetchall()
+        except Exception as e:
+            return f"(plan unavailable: {e})"
+
+        depth = {0: -1}
+        lines = []
+        for row in rows:
+            node_id, parent, detail = row[0], row[1], row[3]
+            depth[node_id] = depth.get(parent, -1) + 1
+            lines.append("  " * depth[node_id] + detail)
+        return "\n".join(lines)
+
+    def top(self, limit: int = 20) -> List[QueryProfile]:
+        """Profiles with the most total time first"""
+        with self.lock:
+            profiles = list(self.profiles.values())
+        profiles.sort(key=lambda p: p.total_ms, reverse=True)
+        return profiles[:limit]
+
+    def reset(self):
+        """Forget everything collected so far"""
+        with self.lock:
+            self.profiles.clear()
+
+    def report(self, limit: int = 20) -> str:
+        """Plain-text table of the top statements, for logs and consoles"""
+        lines = [f"{'calls':>7} {'total ms':>10} {'mean ms':>8} {'p95 ms':>7} {'max ms':>8} {'slow':>5}  sql"]
+        for p in self.top(limit):
+            lines.append(
+                f"{p.calls:>7} {p.total_ms:10.1f} {p.mean_ms:8.2f} {p.percentile_ms(95):7.0f} "
+                f"{p.max_ms:8.1f} {p.slow_calls:>5}  {p.sql[:120]}"
+            )
+        return "\n".join(lines)
+
+
+# The active profiler, or None when profiling is off
+current: Optional[QueryProfiler] = None
+
+
+def enable(slow_ms: float = 100.0, log_path: Optional[str] = None) -> QueryProfiler:
+    """Start profiling (or update the threshold if already on)"""
+    global current
+    if current is None:
+        current = QueryProfiler(slow_ms, log_path)
+    current.slow_ms = slow_ms
+
+    if log_path and not slow_log.handlers:
+        os.makedirs(os.path.dirname(os.path.abspath(log_path)), exist_ok=True)
+        handler = RotatingFileHandler(log_path, maxBytes=LOG_MAX_BYTES,
+                                      backupCount=LOG_BACKUPS, encoding='utf-8')
+        handler.setFormatter(logging.Formatter('%(asctime)s %(message)s'))
+        slow_log.addHandler(handler)
+        slow_log.setLevel(logging.WARNING)
+        current.log_path = log_path
+    return current
+
+
+def disable():
+    """Stop profiling; collected figures are discarded"""
+    global current
+    current = None
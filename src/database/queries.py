@@ -0,0 +1,920 @@
+"""
+Queries - Named SQL for DatabaseManager
+=======================================
+Every statement DatabaseManager runs lives here under a name. The text is
+built once at import, so the same string reaches sqlite3 on every call and
+its statement cache can keep all of them prepared. Calls made by name are
+counted (calls, total time, rows) so the hot queries are easy to spot.
+
+Optional filters are registered as one fixed variant per combination
+rather than concatenated at call time.
+"""
+
+import threading
+from dataclasses import dataclass
+from typing import Dict, List, Tuple
+
+
+# ============================================================================
+# USERS
+# ============================================================================
+
+QUERIES: Dict[str, str] = {
+    'users.authenticate': """
+        SELECT * FROM users
+        WHERE username = ? AND password_hash = ? AND is_active = 1
+    """,
+    'users.get': "SELECT * FROM users WHERE user_id = ?",
+    'users.set_last_login': "UPDATE users SET last_login = ? WHERE user_id = ?",
+}
+
+# ============================================================================
+# MEMBERS
+# ============================================================================
+
+QUERIES.update({
+    'members.all': "SELECT * FROM members ORDER BY member_id",
+    'members.all_active': "SELECT * FROM members WHERE is_active = 1 ORDER BY member_id",
+    'members.get': "SELECT * FROM members WHERE member_id = ?",
+    'members.insert': """
+        INSERT INTO members (
+            member_id, station_id, registration_number,
+            first_name, middle_name, last_name, gender,
+            date_of_birth, date_joined, address, phone_number, email,
+            employee_id, grade_level,
+            nok1_name, nok1_relationship, nok1_address, nok1_phone,
+            nok2_name, nok2_relationship, nok2_address, nok2_phone,
+            created_by
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """,
+    'members.update': """
+        UPDATE members SET
+            station_id = ?, first_name = ?, middle_name = ?, last_name = ?,
+            gender = ?, date_of_birth = ?, address = ?, phone_number = ?,
+            email = ?, employee_id = ?, grade_level = ?,
+            nok1_name = ?, nok1_relationship = ?, nok1_address = ?, nok1_phone = ?,
+            nok2_name = ?, nok2_relationship = ?, nok2_address = ?, nok2_phone = ?,
+            modified_by = ?
+        WHERE member_id = ?
+    """,
+    'members.set_status': """
+        UPDATE members
+        SET is_active = ?, is_deceased = ?, deceased_date = ?,
+            modified_date = datetime('now'), modified_by = ?
+        WHERE member_id = ?
+    """,
+    'members.summary': "SELECT * FROM vw_member_summary ORDER BY member_id",
+    'members.summary_one': "SELECT * FROM vw_member_summary WHERE member_id = ?",
+
+    # Full-text search (members_fts)
+    'members.search_count': """
+        SELECT COUNT(*) AS n
+        FROM (SELECT 1 FROM members_fts WHERE members_fts MATCH ? LIMIT ?)
+    """,
+    'members.rebuild_search_index': "INSERT INTO members_fts(members_fts) VALUES ('rebuild')",
+})
+
+for _order, _name in (('f.rank', 'members.search_ranked'), ('f.rowid', 'members.search_unranked')):
+    QUERIES[_name] = f"""
+        SELECT m.*
+        FROM members_fts f
+        JOIN members m ON m.rowid = f.rowid
+        WHERE members_fts MATCH ?
+        ORDER BY {_order}
+        LIMIT ?
+    """
+
+MEMBER_SEARCH_CONDITION = "m.rowid IN (SELECT rowid FROM members_fts WHERE members_fts MATCH ?)"
+
+# Member grid pages: [search] [after a member ID]
+for _search in (False, True):
+    for _after in (False, True):
+        _conditions = ([MEMBER_SEARCH_CONDITION] if _search else []) + \
+                      (["m.member_id > ?"] if _after else [])
+        _where = f"WHERE {' AND '.join(_conditions)}" if _conditions else ""
+        QUERIES['members.page' + ('_search' if _search else '') + ('_after' if _after else '')] = f"""
+            SELECT m.*, s.station_name
+            FROM members m
+            LEFT JOIN stations s ON m.station_id = s.station_id
+            {_where}
+            ORDER BY m.member_id
+            LIMIT ?
+        """
+
+for _search in (False, True):
+    QUERIES['members.status_counts' + ('_search' if _search else '')] = f"""
+        SELECT
+            COUNT(*) AS total,
+            COALESCE(SUM(CASE WHEN m.is_active THEN 1 ELSE 0 END), 0) AS active,
+            COALESCE(SUM(CASE WHEN NOT COALESCE(m.is_active, 0) AND NOT COALESCE(m.is_deceased, 0) THEN 1 ELSE 0 END), 0) AS inactive,
+            COALESCE(SUM(CASE WHEN m.is_deceased THEN 1 ELSE 0 END), 0) AS deceased
+        FROM members m
+        {'WHERE ' + MEMBER_SEARCH_CONDITION if _search else ''}
+    """
+
+# ============================================================================
+# MEMBER BALANCES
+# ============================================================================
+
+# Loans still owed: a defaulted loan keeps its balance until it is repaid
+OPEN_LOAN_STATUSES = "('Active', 'Defaulted')"
+
+# Savings and loans are aggregated in separate correlated subqueries so a
+# member's accounts and loans never multiply each other's rows
+MEMBER_BALANCE_REFRESH = f"""
+    INSERT OR REPLACE INTO member_balances (
+        member_id, premium_savings, fixed_target_deposits, shares_investment,
+        total_savings, total_loans_outstanding, modified_date
+    )
+    SELECT
+        m.member_id,
+        COALESCE((
+            SELECT SUM(sa.current_balance) FROM savings_accounts sa
+            JOIN savings_types st ON sa.savings_type_id = st.savings_type_id
+            WHERE sa.member_id = m.member_id AND sa.is_active = 1
+              AND st.type_code = 'PREMIUM'
+        ), 0),
+        COALESCE((
+            SELECT SUM(sa.current_balance) FROM savings_accounts sa
+            JOIN savings_types st ON sa.savings_type_id = st.savings_type_id
+            WHERE sa.member_id = m.member_id AND sa.is_active = 1
+              AND st.type_code IN ('TARGET', 'FIXED_DEPOSIT')
+        ), 0),
+        COALESCE((
+            SELECT SUM(sa.current_balance) FROM savings_accounts sa
+            JOIN savings_types st ON sa.savings_type_id = st.savings_type_id
+            WHERE sa.member_id = m.member_id AND sa.is_active = 1
+              AND st.type_code = 'SHARES'
+        ), 0),
+        COALESCE((
+            SELECT SUM(sa.current_balance) FROM savings_accounts sa
+            WHERE sa.member_id = m.member_id AND sa.is_active = 1
+        ), 0),
+        COALESCE((
+            -- unary + keeps the planner on the member index rather than
+            -- scanning every active loan through idx_loans_status
+            SELECT SUM(l.balance_outstanding) FROM loans l
+            WHERE l.member_id = m.member_id AND +l.status IN {OPEN_LOAN_STATUSES}
+        ), 0),
+        datetime('now')
+    FROM members m
+"""
+
+QUERIES.update({
+    'member_balances.refresh_all': MEMBER_BALANCE_REFRESH,
+    'member_balances.refresh_member': MEMBER_BALANCE_REFRESH + " WHERE m.member_id = ?",
+})
+
+# ============================================================================
+# STATIONS
+# ============================================================================
+
+QUERIES.update({
+    'stations.all': "SELECT * FROM stations ORDER BY station_id",
+    'stations.all_enabled': "SELECT * FROM stations WHERE enabled = 1 ORDER BY station_id",
+    'stations.stats': """
+        SELECT
+            s.station_id,
+            COUNT(m.member_id) AS total_members,
+            COALESCE(SUM(CASE WHEN m.is_active THEN 1 ELSE 0 END), 0) AS active_members,
+            COALESCE(SUM(mb.total_savings), 0) AS total_savings,
+            COALESCE(SUM(mb.total_loans_outstanding), 0) AS total_loans_amount
+        FROM stations s
+        LEFT JOIN members m ON m.station_id = s.station_id
+        LEFT JOIN member_balances mb ON mb.member_id = m.member_id
+        GROUP BY s.station_id
+    """,
+    'stations.get': "SELECT * FROM stations WHERE station_id = ?",
+    'stations.last_id': "SELECT MAX(station_id) AS station_id FROM stations",
+    'stations.insert': """
+        INSERT INTO stations (station_id, station_name, address, city, enabled)
+        VALUES (?, ?, ?, ?, 1)
+    """,
+    'stations.update': """
+        UPDATE stations
+        SET station_name = ?, city = ?, address = ?
+        WHERE station_id = ?
+    """,
+    'stations.delete': "DELETE FROM stations WHERE station_id = ?",
+    'stations.members': "SELECT * FROM members WHERE station_id = ? ORDER BY member_id",
+})
+
+# ============================================================================
+# SAVINGS
+# ============================================================================
+
+QUERIES.update({
+    'savings.types': "SELECT * FROM savings_types WHERE is_active = 1",
+    'savings.type_code': "SELECT type_code FROM savings_types WHERE savings_type_id = ?",
+    'savings.member_accounts': """
+        SELECT sa.*, st.type_name, st.type_code, st.interest_rate
+        FROM savings_accounts sa
+        JOIN savings_types st ON sa.savings_type_id = st.savings_type_id
+        WHERE sa.member_id = ? AND sa.is_active = 1
+    """,
+    'savings.account_balance': """
+        SELECT current_balance, member_id FROM savings_accounts WHERE account_id = ?
+    """,
+    'savings.insert_account': """
+        INSERT INTO savings_accounts (member_id, savings_type_id, account_number)
+        VALUES (?, ?, ?)
+    """,
+    'savings.deposit': """
+        UPDATE savings_accounts
+        SET current_balance = current_balance + ?,
+            total_deposits = total_deposits + ?
+        WHERE account_id = ?
+    """,
+    'savings.withdraw': """
+        UPDATE savings_accounts
+        SET current_balance = current_balance - ?,
+            total_withdrawals = total_withdrawals + ?
+        WHERE account_id = ?
+    """,
+    # Batch lookup by account number; the numbers are bound as one JSON array
+    'savings.accounts_by_number': """
+        SELECT sa.account_id, sa.account_number AS reference, sa.member_id,
+               sa.is_active, m.station_id
+        FROM savings_accounts sa
+        JOIN members m ON sa.member_id = m.member_id
+        WHERE sa.account_number IN (SELECT value FROM json_each(?))
+    """,
+})
+
+# ============================================================================
+# LOANS
+# ============================================================================
+
+QUERIES.update({
+    'loans.types': "SELECT * FROM loan_types WHERE is_active = 1",
+    'loans.get': "SELECT * FROM loans WHERE loan_id = ?",
+    'loans.insert': """
+        INSERT INTO loans (
+            member_id, station_id, loan_type_id, loan_number,
+            principal_amount, interest_rate, interest_amount, total_amount,
+            monthly_installment, duration_months, balance_outstanding,
+            disbursement_date, start_date, end_date,
+            cheque_number, bank_name, status, created_by
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, 'Active', ?)
+    """,
+    'loans.set_repayment': """
+        UPDATE loans
+        SET amount_paid = ?, balance_outstanding = ?, status = ?
+        WHERE loan_id = ?
+    """,
+    'loans.insert_repayment': """
+        INSERT INTO loan_repayments (
+            loan_id, member_id, payment_date,
+            expected_amount, actual_amount, balance_before, balance_after,
+            payment_method, cheque_number, receipt_number, notes,
+            created_by
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """,
+    'loans.by_number': """
+        SELECT loan_id, loan_number AS reference, member_id, station_id, status,
+               monthly_installment, amount_paid, balance_outstanding
+        FROM loans
+        WHERE loan_number IN (SELECT value FROM json_each(?))
+    """,
+    # Loan Details sheet: every loan with its type name, in loan order
+    'loans.portfolio': """
+        SELECT l.loan_number, l.member_id, lt.type_name,
+               l.principal_amount, l.interest_amount, l.total_amount,
+               l.amount_paid, l.balance_outstanding, l.status, l.start_date
+        FROM loans l
+        LEFT JOIN loan_types lt ON lt.loan_type_id = l.loan_type_id
+        ORDER BY l.loan_id
+    """,
+    # Portfolio totals, plus the longest value per exported column so the
+    # streamed Excel sheet can be sized before any row is written
+    'loans.portfolio_summary': f"""
+        SELECT COUNT(*) AS total_loans,
+               COALESCE(SUM(status = 'Active'), 0) AS active_loans,
+               COALESCE(SUM(status = 'Completed'), 0) AS completed_loans,
+               COALESCE(SUM(principal_amount), 0) AS total_disbursed,
+               COALESCE(SUM(CASE WHEN status IN {OPEN_LOAN_STATUSES} THEN balance_outstanding END), 0)
+                   AS total_outstanding,
+               COALESCE(SUM(amount_paid), 0) AS total_collected,
+               MAX(LENGTH(loan_number)) AS loan_number_len,
+               MAX(LENGTH(member_id)) AS member_id_len,
+               (SELECT MAX(LENGTH(type_name)) FROM loan_types) AS type_name_len,
+               MAX(principal_amount) AS principal_max,
+               MAX(interest_amount) AS interest_max,
+               MAX(total_amount) AS total_max,
+               MAX(amount_paid) AS paid_max,
+               MAX(balance_outstanding) AS balance_max,
+               MAX(LENGTH(status)) AS status_len,
+               MAX(LENGTH(start_date)) AS start_date_len
+        FROM loans
+    """,
+})
+
+# Portfolio breakdowns, one row per loan type / station
+PORTFOLIO_TOTALS = f"""
+    COUNT(l.loan_id) AS loans,
+    COALESCE(SUM(l.status = 'Active'), 0) AS active_loans,
+    COALESCE(SUM(l.principal_amount), 0) AS disbursed,
+    COALESCE(SUM(CASE WHEN l.status IN {OPEN_LOAN_STATUSES} THEN l.balance_outstanding END), 0) AS outstanding,
+    COALESCE(SUM(l.amount_paid), 0) AS collected
+"""
+
+QUERIES.update({
+    'loans.portfolio_by_type': f"""
+        SELECT lt.type_name AS name, {PORTFOLIO_TOTALS}
+        FROM loan_types lt
+        LEFT JOIN loans l ON l.loan_type_id = lt.loan_type_id
+        GROUP BY lt.loan_type_id
+        ORDER BY lt.type_name
+    """,
+    'loans.portfolio_by_station': f"""
+        SELECT s.station_name AS name, {PORTFOLIO_TOTALS}
+        FROM stations s
+        JOIN loans l ON l.station_id = s.station_id
+        GROUP BY s.station_id
+        ORDER BY s.station_name
+    """,
+})
+
+for _active in (False, True):
+    QUERIES['loans.member' + ('_active' if _active else '')] = f"""
+        SELECT l.*, lt.type_name, lt.type_code
+        FROM loans l
+        JOIN loan_types lt ON l.loan_type_id = lt.loan_type_id
+        WHERE l.member_id = ? {"AND l.status IN " + OPEN_LOAN_STATUSES if _active else ''}
+        ORDER BY l.created_date DESC
+    """
+
+# ============================================================================
+# LOAN SCHEDULE
+# ============================================================================
+
+# Installments for loans that have none yet, matching
+# db_manager.loan_schedule_rows: the first falls on start_date, each
+# later one a calendar month on with the day clamped to the month's end
+# (relativedelta stepping), and the last takes the rounding remainder
+LOAN_SCHEDULE_BACKFILL = """
+    INSERT INTO loan_schedule (loan_id, installment_number, due_date, amount_due)
+    WITH RECURSIVE seq(loan_id, n, duration) AS (
+        SELECT loan_id, 1, duration_months FROM loans
+        WHERE duration_months > 0
+          AND loan_id NOT IN (SELECT loan_id FROM loan_schedule)
+        UNION ALL
+        SELECT loan_id, n + 1, duration FROM seq WHERE n < duration
+    )
+    SELECT s.loan_id, s.n,
+           MIN(
+               date(l.start_date, 'start of month', '+' || (s.n - 1) || ' months',
+                    '+' || (CAST(strftime('%d', l.start_date) AS INTEGER) - 1) || ' days'),
+               date(l.start_date, 'start of month', '+' || s.n || ' months', '-1 day')
+           ),
+           CASE WHEN s.n < s.duration THEN ROUND(l.total_amount * 1.0 / s.duration, 2)
+                ELSE ROUND(l.total_amount - ROUND(l.total_amount * 1.0 / s.duration, 2) * (s.duration - 1), 2)
+           END
+    FROM seq s
+    JOIN loans l ON l.loan_id = s.loan_id
+"""
+
+# Spreads each loan's amount_paid over its installments, oldest first, and
+# rewrites only the installments whose share changed. An installment that
+# becomes fully paid keeps the first paid_date it was given.
+LOAN_SCHEDULE_ALLOCATE = """
+    UPDATE loan_schedule
+    SET amount_paid = a.allocated,
+        status = CASE WHEN a.allocated >= loan_schedule.amount_due THEN 'Paid'
+                      WHEN a.allocated > 0 THEN 'Partial'
+                      ELSE 'Pending' END,
+        paid_date = CASE WHEN a.allocated >= loan_schedule.amount_due
+                         THEN COALESCE(loan_schedule.paid_date, a.paid_date) END
+    FROM (
+        SELECT s.loan_id, s.installment_number, {paid_date} AS paid_date,
+               ROUND(MIN(s.amount_due, MAX(0,
+                   l.amount_paid - (SUM(s.amount_due) OVER w - s.amount_due)
+               )), 2) AS allocated
+        FROM loan_schedule s
+        JOIN loans l ON l.loan_id = s.loan_id
+        {where}
+        WINDOW w AS (PARTITION BY s.loan_id ORDER BY s.installment_number)
+    ) a
+    WHERE loan_schedule.loan_id = a.loan_id
+      AND loan_schedule.installment_number = a.installment_number
+      AND loan_schedule.amount_paid IS NOT a.allocated
+"""
+
+QUERIES.update({
+    'loan_schedule.insert': """
+        INSERT INTO loan_schedule (loan_id, installment_number, due_date, amount_due)
+        VALUES (?, ?, ?, ?)
+    """,
+    'loan_schedule.for_loan': """
+        SELECT * FROM loan_schedule WHERE loan_id = ? ORDER BY installment_number
+    """,
+    'loan_schedule.allocate': LOAN_SCHEDULE_ALLOCATE.format(
+        paid_date='?', where='WHERE s.loan_id = ?'
+    ),
+    # Existing loans: installments are taken as paid on the last repayment
+    'loan_schedule.allocate_all': LOAN_SCHEDULE_ALLOCATE.format(
+        paid_date="""(SELECT MAX(r.payment_date) FROM loan_repayments r
+                      WHERE r.loan_id = s.loan_id)""",
+        where=''
+    ),
+    # What a repayment on ? is expected to cover: the unpaid part of every
+    # installment due by then, or else of the next one (loan IDs as JSON)
+    'loan_schedule.expected': """
+        SELECT s.loan_id,
+               ROUND(COALESCE(SUM(s.amount_due - s.amount_paid) FILTER (WHERE s.due_date <= ?), 0), 2)
+                   AS due,
+               (SELECT n.amount_due - n.amount_paid FROM loan_schedule n
+                WHERE n.loan_id = s.loan_id AND n.status <> 'Paid'
+                ORDER BY n.installment_number LIMIT 1) AS next_installment
+        FROM loan_schedule s
+        WHERE s.loan_id IN (SELECT value FROM json_each(?)) AND s.status <> 'Paid'
+        GROUP BY s.loan_id
+    """,
+    # Unpaid installments of open loans falling due between two dates
+    # (idx_loan_schedule_due)
+    'loan_schedule.due_between': f"""
+        SELECT s.loan_id, l.loan_number, l.member_id, s.installment_number, s.due_date,
+               s.amount_due, s.amount_paid, s.amount_due - s.amount_paid AS amount_outstanding
+        FROM loan_schedule s
+        JOIN loans l ON l.loan_id = s.loan_id
+        WHERE s.due_date BETWEEN ? AND ? AND s.status <> 'Paid' AND l.status IN {OPEN_LOAN_STATUSES}
+        ORDER BY s.due_date, s.loan_id, s.installment_number
+    """,
+})
+
+# ============================================================================
+# LOAN ARREARS
+# ============================================================================
+# The arrears job rebuilds loan_arrears from loans and loan_schedule in one
+# pass, then flips loan statuses against it in bulk.
+
+# An open loan l's installments due before run.as_of and not fully paid (the
+# schedule already carries the repayments) ...
+OVERDUE_INSTALLMENTS = """
+    LEFT JOIN loan_schedule s
+           ON s.loan_id = l.loan_id AND s.status <> 'Paid' AND s.due_date < run.as_of
+"""
+# ... and the days since the oldest of them fell due, per loan (GROUP BY
+# l.loan_id). Shared with analytics.loans so PAR and the arrears list agree.
+DAYS_PAST_DUE = "COALESCE(CAST(julianday(run.as_of) - julianday(MIN(s.due_date)) AS INTEGER), 0)"
+
+QUERIES.update({
+    'arrears.clear': "DELETE FROM loan_arrears",
+    # Every open loan as at ?, with its overdue installments
+    'arrears.snapshot': f"""
+        INSERT INTO loan_arrears (
+            loan_id, member_id, station_id, as_of, oldest_due_date,
+            days_past_due, installments_overdue, arrears_amount, balance_outstanding
+        )
+        WITH run(as_of) AS (SELECT ?)
+        SELECT l.loan_id, l.member_id, l.station_id, run.as_of, MIN(s.due_date),
+               {DAYS_PAST_DUE},
+               COUNT(s.installment_number),
+               ROUND(COALESCE(SUM(s.amount_due - s.amount_paid), 0), 2),
+               l.balance_outstanding
+        FROM run
+        JOIN loans l ON l.status IN {OPEN_LOAN_STATUSES}
+        {OVERDUE_INSTALLMENTS}
+        GROUP BY l.loan_id
+    """,
+    'arrears.totals': """
+        SELECT COUNT(*) AS loans_checked,
+               COALESCE(SUM(days_past_due > 0), 0) AS loans_in_arrears,
+               COALESCE(SUM(arrears_amount), 0) AS total_arrears
+        FROM loan_arrears
+    """,
+    # Default after more than ? days past due, as PAR counts them
+    'arrears.flag_defaults': """
+        UPDATE loans SET status = 'Defaulted'
+        WHERE status = 'Active'
+          AND loan_id IN (SELECT loan_id FROM loan_arrears WHERE days_past_due > ?)
+    """,
+    'arrears.cure_defaults': """
+        UPDATE loans SET status = 'Active'
+        WHERE status = 'Defaulted'
+          AND loan_id IN (SELECT loan_id FROM loan_arrears WHERE days_past_due <= ?)
+    """,
+    'arrears.record_run': """
+        INSERT INTO arrears_runs (
+            as_of, default_days, loans_checked, loans_in_arrears, total_arrears,
+            loans_defaulted, loans_cured, timings, total_seconds, created_by
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """,
+    'arrears.last_run': "SELECT * FROM arrears_runs ORDER BY run_id DESC LIMIT 1",
+    # Loans at least ? days past due, worst first (idx_loan_arrears_days)
+    'arrears.list': """
+        SELECT a.*, l.loan_number, l.status
+        FROM loan_arrears a
+        JOIN loans l ON l.loan_id = a.loan_id
+        WHERE a.days_past_due >= ?
+        ORDER BY a.days_past_due DESC, a.loan_id
+    """,
+})
+
+# ============================================================================
+# LOAN ANALYTICS
+# ============================================================================
+# Column loads for database/loan_analytics.py: numbers only, one row per loan,
+# installment or repayment, so each result converts straight into NumPy
+# arrays. Dates come back as days since 1970-01-01 (datetime64[D]).
+
+QUERIES.update({
+    # Open loans that still owe something, with their days past due as at ?
+    # read from the schedule as the arrears job reads them. Stations are
+    # coded by rowid; 0 is none.
+    'analytics.loans': f"""
+        WITH run(as_of) AS (SELECT ?)
+        SELECT l.loan_type_id, COALESCE(st.rowid, 0), {DAYS_PAST_DUE}, l.balance_outstanding
+        FROM run
+        JOIN loans l ON l.status IN {OPEN_LOAN_STATUSES} AND l.balance_outstanding > 0
+        LEFT JOIN stations st ON st.station_id = l.station_id
+        {OVERDUE_INSTALLMENTS}
+        GROUP BY l.loan_id
+    """,
+    # Installments falling due on or after ? and before ? (idx_loan_schedule_due)
+    'analytics.installments': """
+        SELECT CAST(julianday(due_date) - 2440587.5 AS INTEGER), amount_due
+        FROM loan_schedule
+        WHERE due_date >= ? AND due_date < ?
+    """,
+    # Repayments on or after ?
+    'analytics.repayments': """
+        SELECT CAST(julianday(payment_date) - 2440587.5 AS INTEGER), actual_amount
+        FROM loan_repayments
+        WHERE payment_date >= ?
+    """,
+    'analytics.loan_types': "SELECT loan_type_id AS code, type_name AS name FROM loan_types",
+    'analytics.stations': "SELECT rowid AS code, station_name AS name FROM stations",
+})
+
+# ============================================================================
+# DASHBOARD
+# ============================================================================
+# Aggregates for database/dashboard_stats.py, one GROUP BY pass each
+
+# Both the legacy and the current ledger spellings count as cash in/out
+DEPOSIT_TYPES = ('Deposit', 'Savings Deposit')
+WITHDRAWAL_TYPES = ('Withdrawal', 'Savings Withdrawal')
+
+
+def _sql_list(values: Tuple[str, ...]) -> str:
+    """A tuple of constant strings as an SQL IN list"""
+    return "(" + ", ".join(f"'{value}'" for value in values) + ")"
+
+
+QUERIES.update({
+    'dashboard.member_counts': """
+        SELECT
+            COUNT(*) AS total_members,
+            COALESCE(SUM(CASE WHEN is_active = 1 AND COALESCE(is_deceased, 0) = 0 THEN 1 ELSE 0 END), 0) AS active_members,
+            COALESCE(SUM(CASE WHEN COALESCE(is_active, 0) = 0 AND COALESCE(is_deceased, 0) = 0 THEN 1 ELSE 0 END), 0) AS inactive_members,
+            COALESCE(SUM(CASE WHEN is_deceased = 1 THEN 1 ELSE 0 END), 0) AS deceased_members
+        FROM members
+    """,
+    'dashboard.savings_by_type': """
+        SELECT st.type_name, COUNT(*) AS accounts, SUM(sa.current_balance) AS balance
+        FROM savings_accounts sa
+        JOIN savings_types st ON sa.savings_type_id = st.savings_type_id
+        GROUP BY st.type_name
+        ORDER BY MIN(st.savings_type_id)
+    """,
+    'dashboard.loan_totals': f"""
+        SELECT
+            COUNT(*) AS total_loans,
+            COALESCE(SUM(CASE WHEN status = 'Active' THEN 1 ELSE 0 END), 0) AS active_loans,
+            COALESCE(SUM(CASE WHEN status = 'Completed' THEN 1 ELSE 0 END), 0) AS completed_loans,
+            SUM(principal_amount) AS loans_disbursed,
+            SUM(CASE WHEN status IN {OPEN_LOAN_STATUSES} THEN balance_outstanding ELSE 0 END)
+                AS loans_outstanding,
+            SUM(amount_paid) AS loans_collected
+        FROM loans
+    """,
+    # Count, deposits and withdrawals per day since ?
+    'dashboard.transactions_by_day': f"""
+        SELECT
+            substr(transaction_date, 1, 10) AS day,
+            COUNT(*) AS count,
+            SUM(CASE WHEN transaction_type IN {_sql_list(DEPOSIT_TYPES)} THEN amount ELSE 0 END) AS deposits,
+            SUM(CASE WHEN transaction_type IN {_sql_list(WITHDRAWAL_TYPES)} THEN amount ELSE 0 END) AS withdrawals
+        FROM transactions
+        WHERE transaction_date >= ?
+        GROUP BY day
+    """,
+    # Transactions since ? (second) grouped by the first ? (first) characters of the date
+    'dashboard.transactions_by_prefix': """
+        SELECT substr(transaction_date, 1, ?) AS bucket, COUNT(*) AS count
+        FROM transactions
+        WHERE transaction_date >= ?
+        GROUP BY bucket
+    """,
+})
+
+# ============================================================================
+# TRANSACTIONS
+# ============================================================================
+
+QUERIES['transactions.insert'] = """
+    INSERT INTO transactions (
+        transaction_date, member_id, station_id,
+        transaction_type, account_type, account_id,
+        description, amount, is_credit,
+        payment_method, cheque_number, receipt_number,
+        created_by
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+# Ledger listing: [member] [from date] [to date]
+TRANSACTION_FILTERS = (
+    ('member', "member_id = ?"),
+    ('from', "transaction_date >= ?"),
+    ('to', "transaction_date <= ?"),
+)
+
+for _mask in range(2 ** len(TRANSACTION_FILTERS)):
+    _used = [f for i, f in enumerate(TRANSACTION_FILTERS) if _mask & (1 << i)]
+    _where = f"WHERE {' AND '.join(sql for _, sql in _used)}" if _used else ""
+    QUERIES['transactions.list' + ''.join(f'_{key}' for key, _ in _used)] = f"""
+        SELECT * FROM transactions
+        {_where}
+        ORDER BY transaction_date DESC, transaction_id DESC
+    """
+
+QUERIES.update({
+    # One payment method's ledger for a period, oldest first, for the cashbook
+    'transactions.cashbook': """
+        SELECT transaction_id, transaction_date, member_id, transaction_type,
+               description, amount, is_credit
+        FROM transactions
+        WHERE payment_method = ? AND transaction_date >= ? AND transaction_date <= ?
+        ORDER BY transaction_date, transaction_id
+    """,
+    # Balance of that payment method before the period starts
+    'transactions.cashbook_opening': """
+        SELECT COALESCE(SUM(CASE WHEN is_credit THEN amount ELSE -amount END), 0) AS balance
+        FROM transactions
+        WHERE payment_method = ? AND transaction_date < ?
+    """,
+    'transactions.last_id': "SELECT COALESCE(MAX(transaction_id), 0) AS transaction_id FROM transactions",
+})
+
+# ============================================================================
+# SYSTEM SETTINGS
+# ============================================================================
+
+QUERIES.update({
+    'settings.get': "SELECT setting_value FROM system_settings WHERE setting_key = ?",
+    'settings.update': """
+        UPDATE system_settings
+        SET setting_value = ?, modified_by = ?
+        WHERE setting_key = ?
+    """,
+})
+
+# ============================================================================
+# SAVINGS INTEREST
+# ============================================================================
+# A posting run stages the eligible accounts in temp.interest_run, then
+# credits, journals and re-totals them with one statement each.
+
+QUERIES.update({
+    'interest.posting': "SELECT * FROM interest_postings WHERE period = ?",
+    'interest.last_posting': "SELECT * FROM interest_postings ORDER BY period DESC LIMIT 1",
+    'interest.drop_run': "DROP TABLE IF EXISTS temp.interest_run",
+    # Monthly rate on the balance as at the posting date (?), rounded to kobo,
+    # for active accounts of active members at or above their type's minimum
+    # balance. That balance is the current one less every savings movement
+    # journalled after the posting date (idx_transactions_date).
+    'interest.stage_run': """
+        CREATE TEMP TABLE interest_run AS
+        SELECT account_id, member_id, station_id, type_code, type_name,
+               ROUND(balance * interest_rate / 100.0, 2) AS interest
+        FROM (
+            SELECT sa.account_id, sa.member_id, m.station_id, st.type_code, st.type_name,
+                   st.interest_rate, st.minimum_balance,
+                   sa.current_balance - COALESCE(later.net, 0) AS balance
+            FROM savings_accounts sa
+            JOIN savings_types st ON st.savings_type_id = sa.savings_type_id
+            JOIN members m ON m.member_id = sa.member_id
+            LEFT JOIN (
+                SELECT CAST(account_id AS INTEGER) AS account_id,
+                       SUM(CASE WHEN is_credit THEN amount ELSE -amount END) AS net
+                FROM transactions
+                WHERE transaction_date > ? AND account_type = 'Savings'
+                GROUP BY CAST(account_id AS INTEGER)
+            ) later ON later.account_id = sa.account_id
+            WHERE sa.is_active = 1 AND m.is_active = 1
+              AND st.is_active = 1 AND st.interest_enabled = 1 AND st.interest_rate > 0
+        )
+        WHERE balance > 0 AND balance >= minimum_balance
+          AND ROUND(balance * interest_rate / 100.0, 2) > 0
+    """,
+    'interest.run_by_type': """
+        SELECT type_name, COUNT(*) AS accounts, ROUND(SUM(interest), 2) AS interest
+        FROM temp.interest_run
+        GROUP BY type_name
+        ORDER BY type_name
+    """,
+    'interest.run_totals': """
+        SELECT COUNT(*) AS accounts, COUNT(DISTINCT member_id) AS members,
+               COALESCE(SUM(interest), 0) AS total_interest
+        FROM temp.interest_run
+    """,
+    'interest.credit_accounts': """
+        UPDATE savings_accounts
+        SET current_balance = current_balance + r.interest,
+            total_interest_earned = total_interest_earned + r.interest
+        FROM temp.interest_run r
+        WHERE savings_accounts.account_id = r.account_id
+    """,
+    'interest.insert_transactions': """
+        INSERT INTO transactions (
+            transaction_date, member_id, station_id,
+            transaction_type, account_type, account_id,
+            description, amount, is_credit, created_by
+        )
+        SELECT ?, member_id, station_id, 'Interest', 'Savings', account_id, ?, interest, 1, ?
+        FROM temp.interest_run
+        ORDER BY account_id
+    """,
+    # Interest only adds to savings, so member_balances takes it as a delta
+    # (same type_code grouping as MEMBER_BALANCE_REFRESH) ...
+    'interest.credit_balances': """
+        UPDATE member_balances
+        SET premium_savings = premium_savings + r.premium,
+            fixed_target_deposits = fixed_target_deposits + r.fixed_target,
+            shares_investment = shares_investment + r.shares,
+            total_savings = total_savings + r.total,
+            modified_date = datetime('now')
+        FROM (
+            SELECT member_id,
+                   SUM(CASE WHEN type_code = 'PREMIUM' THEN interest ELSE 0 END) AS premium,
+                   SUM(CASE WHEN type_code IN ('TARGET', 'FIXED_DEPOSIT') THEN interest ELSE 0 END)
+                       AS fixed_target,
+                   SUM(CASE WHEN type_code = 'SHARES' THEN interest ELSE 0 END) AS shares,
+                   SUM(interest) AS total
+            FROM temp.interest_run
+            GROUP BY member_id
+        ) r
+        WHERE member_balances.member_id = r.member_id
+    """,
+    # ... and members with no balance row yet are totalled from scratch
+    'interest.refresh_missing_balances': MEMBER_BALANCE_REFRESH + """
+        WHERE m.member_id IN (SELECT member_id FROM temp.interest_run)
+          AND m.member_id NOT IN (SELECT member_id FROM member_balances)
+    """,
+    'interest.record_posting': """
+        INSERT INTO interest_postings (period, posting_date, accounts, total_interest, created_by)
+        VALUES (?, ?, ?, ?, ?)
+    """,
+})
+
+# ============================================================================
+# DEATH BENEFITS
+# ============================================================================
+# A levy stages the member accounts to charge in temp.death_levy, then
+# debits, journals and records the charges with one statement each.
+
+QUERIES.update({
+    'death_benefit.by_member': "SELECT * FROM death_benefits WHERE deceased_member_id = ?",
+    'death_benefit.insert': """
+        INSERT INTO death_benefits (deceased_member_id, deceased_date, per_member_charge, created_by)
+        VALUES (?, ?, ?, ?)
+    """,
+    'death_benefit.complete': """
+        UPDATE death_benefits
+        SET total_benefit_amount = ?, total_members_charged = ?, status = 'Completed'
+        WHERE benefit_id = ?
+    """,
+    'death_benefit.drop_levy': "DROP TABLE IF EXISTS temp.death_levy",
+    # Each active member other than the deceased is charged from their
+    # largest active premium savings account, if it covers the charge.
+    # account_id is taken from the MAX() row (SQLite bare-column rule).
+    'death_benefit.stage_levy': """
+        CREATE TEMP TABLE death_levy AS
+        SELECT sa.member_id, m.station_id, sa.account_id, MAX(sa.current_balance) AS balance
+        FROM savings_accounts sa
+        JOIN savings_types st ON st.savings_type_id = sa.savings_type_id
+        JOIN members m ON m.member_id = sa.member_id
+        WHERE st.type_code = 'PREMIUM' AND sa.is_active = 1
+          AND m.is_active = 1 AND m.is_deceased = 0 AND m.member_id <> ?
+        GROUP BY sa.member_id
+        HAVING MAX(sa.current_balance) >= ?
+    """,
+    'death_benefit.levy_totals': """
+        SELECT (SELECT COUNT(*) FROM temp.death_levy) AS charged,
+               (SELECT COUNT(*) FROM members
+                WHERE is_active = 1 AND is_deceased = 0 AND member_id <> ?) AS active_members
+    """,
+    'death_benefit.debit_accounts': """
+        UPDATE savings_accounts
+        SET current_balance = current_balance - ?,
+            total_withdrawals = total_withdrawals + ?
+        FROM temp.death_levy l
+        WHERE savings_accounts.account_id = l.account_id
+    """,
+    'death_benefit.insert_transactions': """
+        INSERT INTO transactions (
+            transaction_date, member_id, station_id,
+            transaction_type, account_type, account_id,
+            description, amount, is_credit, created_by
+        )
+        SELECT ?, member_id, station_id, 'Death Benefit Levy', 'Savings', account_id, ?, ?, 0, ?
+        FROM temp.death_levy
+        ORDER BY member_id
+    """,
+    # Links each charge to its ledger row: the levy rows are the only ones
+    # written after last_transaction inside the levy's write transaction
+    'death_benefit.insert_charges': """
+        INSERT INTO death_benefit_charges (
+            benefit_id, member_id, deceased_member_id, charge_amount, charge_date, transaction_id
+        )
+        SELECT ?, member_id, ?, amount, transaction_date, transaction_id
+        FROM transactions
+        WHERE transaction_id > ? AND transaction_type = 'Death Benefit Levy'
+    """,
+    # The levy only comes out of premium savings, so member_balances takes
+    # it as a delta ...
+    'death_benefit.debit_balances': """
+        UPDATE member_balances
+        SET premium_savings = premium_savings - ?,
+            total_savings = total_savings - ?,
+            modified_date = datetime('now')
+        FROM temp.death_levy l
+        WHERE member_balances.member_id = l.member_id
+    """,
+    # ... and members with no balance row yet are totalled from scratch
+    'death_benefit.refresh_missing_balances': MEMBER_BALANCE_REFRESH + """
+        WHERE m.member_id IN (SELECT member_id FROM temp.death_levy)
+          AND m.member_id NOT IN (SELECT member_id FROM member_balances)
+    """,
+})
+
+# ============================================================================
+# REPORTS
+# ============================================================================
+
+QUERIES.update({
+    # Changes whenever data a report shows may have changed, and survives
+    # restarts. Money only moves with a new transaction; edits to members,
+    # stations and savings/loan types bump reference_data_version (triggers
+    # in add_report_fingerprint.sql); settings are few enough to include
+    # whole. Arrears runs change loan statuses without a transaction.
+    'reports.fingerprint': """
+        SELECT (SELECT MAX(transaction_id) FROM transactions) AS last_transaction,
+               (SELECT MAX(loan_id) FROM loans) AS last_loan,
+               (SELECT MAX(run_id) FROM arrears_runs) AS last_arrears_run,
+               (SELECT version FROM reference_data_version) AS reference_data,
+               (SELECT group_concat(setting_key || '=' || setting_value, ';')
+                FROM system_settings) AS settings
+    """,
+})
+
+# Every registered statement plus headroom for ad-hoc SQL from the GUI
+STATEMENT_CACHE_SIZE = len(QUERIES) + 64
+
+
+# ============================================================================
+# STATISTICS
+# ============================================================================
+
+@dataclass
+class QueryStats:
+    """Counters for one named query"""
+
+    calls: int = 0
+    total_time: float = 0.0   # seconds
+    rows: int = 0
+
+    @property
+    def mean_ms(self) -> float:
+        """Average time per call in milliseconds"""
+        return self.total_time * 1000 / self.calls if self.calls else 0.0
+
+
+# Shared by every DatabaseManager in the process, including pooled readers
+_stats: Dict[str, QueryStats] = {}
+_stats_lock = threading.Lock()
+
+
+def record(name: str, elapsed: float, rows: int):
+    """Add one call to a query's counters"""
+    with _stats_lock:
+        stats = _stats.get(name)
+        if stats is None:
+            stats = _stats[name] = QueryStats()
+        stats.calls += 1
+        stats.total_time += elapsed
+        stats.rows += max(rows, 0)
+
+
+def query_stats() -> List[Tuple[str, QueryStats]]:
+    """Snapshot of the counters, most total time first"""
+    with _stats_lock:
+        snapshot = [(name, QueryStats(s.calls, s.total_time, s.rows)) for name, s in _stats.items()]
+    return sorted(snapshot, key=lambda item: item[1].total_time, reverse=True)
+
+
+def reset_stats():
+    """Clear all counters"""
+    with _stats_lock:
+        _stats.clear()
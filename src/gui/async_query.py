@@ -0,0 +1,108 @@
+"""
+Async Queries - Run database reads off the GUI thread
+=====================================================
+Work is submitted as a function taking a read-only DatabaseManager. It runs
+on the global QThreadPool and its result is delivered back on the GUI thread.
+Workers borrow their connection from the manager's read pool (db.reader()).
+"""
+
+import traceback
+
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal, pyqtSlot
+
+
+class QuerySignals(QObject):
+    """Signals emitted by a QueryWorker"""
+
+    finished = pyqtSignal(str, int, object)   # key, generation, result
+    failed = pyqtSignal(str, int, str)        # key, generation, error message
+
+
+class QueryWorker(QRunnable):
+    """Runs one query function on a pool thread"""
+
+    def __init__(self, db, fn, key, generation):
+        super().__init__()
+        self.db = db
+        self.fn = fn
+        self.key = key
+        self.generation = generation
+        self.signals = QuerySignals()
+        self.cancelled = False
+
+    def run(self):
+        """Execute the query function and report back"""
+        # Cancelled before a thread picked it up - skip the work entirely
+        if self.cancelled:
+            return
+
+        try:
+            with self.db.reader() as reader:
+                result = self.fn(reader)
+        except Exception as e:
+            traceback.print_exc()
+            self.signals.failed.emit(self.key, self.generation, str(e))
+        else:
+            self.signals.finished.emit(self.key, self.generation, result)
+
+
+class AsyncQueryRunner(QObject):
+    """Submits query functions for a module and drops stale results
+
+    Every submit under a key supersedes the previous one for that key, and
+    cancel_pending() supersedes all of them; results from superseded
+    workers are discarded instead of being delivered.
+    """
+
+    def __init__(self, db_manager, parent=None):
+        super().__init__(parent)
+        self.db = db_manager
+        self.pool = QThreadPool.globalInstance()
+        self.generation = 0
+        self.pending = {}   # key -> (worker, on_result, on_error)
+
+    def submit(self, fn, on_result, on_error=None, key='default'):
+        """Run fn(reader) in the background and pass its result to on_result"""
+        self.cancel_pending(key)
+
+        self.generation += 1
+        worker = QueryWorker(self.db, fn, key, self.generation)
+        worker.signals.finished.connect(self._deliver_result)
+        worker.signals.failed.connect(self._deliver_error)
+        self.pending[key] = (worker, on_result, on_error)
+
+        self.pool.start(worker)
+        return self.generation
+
+    def cancel_pending(self, key=None):
+        """Discard in-flight results for one key, or for all keys"""
+        keys = [key] if key is not None else list(self.pending)
+        for k in keys:
+            entry = self.pending.pop(k, None)
+            if entry:
+                entry[0].cancelled = True
+
+    def is_pending(self, key='default'):
+        """Whether a query for key is still running"""
+        return key in self.pending
+
+    def _take_current(self, key, generation):
+        """Pop the callbacks for key if the result is not stale"""
+        entry = self.pending.get(key)
+        if entry is None or entry[0].generation != generation:
+            return None
+        return self.pending.pop(key)
+
+    @pyqtSlot(str, int, object)
+    def _deliver_result(self, key, generation, result):
+        """Pass a finished result to its callback on the GUI thread"""
+        entry = self._take_current(key, generation)
+        if entry:
+            entry[1](result)
+
+    @pyqtSlot(str, int, str)
+    def _deliver_error(self, key, generation, message):
+        """Pass a query error to its error callback on the GUI thread"""
+        entry = self._take_current(key, generation)
+        if entry and entry[2]:
+            entry[2](message)
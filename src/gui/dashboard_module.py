@@ -15,8 +15,10 @@ from PyQt6.QtCharts import (
     QChart, QChartView, QPieSeries, QBarSet, QBarSeries,
     QBarCategoryAxis, QValueAxis, QLineSeries
 )
-from datetime import datetime, timedelta
-from decimal import Decimal
+from datetime import datetime, date
+
+from database.dashboard_stats import DashboardStatsService
+from .async_query import AsyncQueryRunner
 
 
 class DashboardModule(QWidget):
@@ -26,6 +28,8 @@ class DashboardModule(QWidget):
         super().__init__(parent)
         self.app = app
         self.db = app.db_manager
+        self.stats_service = DashboardStatsService(self.db)
+        self.queries = AsyncQueryRunner(self.db, self)
         self.current_user = app.current_user
         
         # View mode: 'numbers', 'charts', 'graphs'
@@ -33,12 +37,23 @@ class DashboardModule(QWidget):
         # Time period for graphs: 'daily', 'weekly', 'monthly', 'yearly'
         self.time_period = 'daily'
         
+        # Widgets currently on screen, reused across refreshes
+        self.rendered_view_mode = None
+        self.metric_cards = []
+        self.charts = {}
+        self.charts_row = None
+        self.last_refresh_key = None
+        
+        # Last loaded snapshot and the (data version, day, period) it is for
+        self.stats = None
+        self.stats_key = None
+        
         self.setup_ui()
         self.refresh_data()
         
-        # Auto-refresh every 30 seconds
+        # Check for changes every 30 seconds; idle ticks cost one PRAGMA
         self.refresh_timer = QTimer(self)
-        self.refresh_timer.timeout.connect(self.refresh_data)
+        self.refresh_timer.timeout.connect(self.refresh_if_changed)
         self.refresh_timer.start(30000)  # 30 seconds
     
     def setup_ui(self):
@@ -196,21 +211,48 @@ class DashboardModule(QWidget):
         layout = QVBoxLayout(card)
         layout.setSpacing(5)
         
-        title_label = QLabel(title)
-        title_label.setStyleSheet(f"color: #BDC3C7; font-size: 11pt; font-weight: 500;")
-        layout.addWidget(title_label)
+        card.title_label = QLabel(title)
+        card.title_label.setStyleSheet(f"color: #BDC3C7; font-size: 11pt; font-weight: 500;")
+        layout.addWidget(card.title_label)
         
-        value_label = QLabel(value)
-        value_label.setStyleSheet(f"color: {color}; font-size: 24pt; font-weight: bold;")
-        layout.addWidget(value_label)
+        card.value_label = QLabel(value)
+        card.value_label.setStyleSheet(f"color: {color}; font-size: 24pt; font-weight: bold;")
+        layout.addWidget(card.value_label)
         
-        if subtitle:
-            subtitle_label = QLabel(subtitle)
-            subtitle_label.setStyleSheet("color: #7F8C8D; font-size: 9pt;")
-            layout.addWidget(subtitle_label)
+        card.subtitle_label = QLabel(subtitle)
+        card.subtitle_label.setStyleSheet("color: #7F8C8D; font-size: 9pt;")
+        card.subtitle_label.setVisible(bool(subtitle))
+        layout.addWidget(card.subtitle_label)
         
+        card.content = (title, value, subtitle, color)
         return card
     
+    def update_metric_card(self, card, title, value, subtitle="", color="#2980B9"):
+        """Update a metric card in place, touching only what changed"""
+        if card.content == (title, value, subtitle, color):
+            return
+        
+        old_color = card.content[3]
+        card.title_label.setText(title)
+        card.value_label.setText(value)
+        card.subtitle_label.setText(subtitle)
+        card.subtitle_label.setVisible(bool(subtitle))
+        if color != old_color:
+            card.setStyleSheet(card.styleSheet().replace(old_color, color))
+            card.value_label.setStyleSheet(f"color: {color}; font-size: 24pt; font-weight: bold;")
+        
+        card.content = (title, value, subtitle, color)
+    
+    def set_metric_cards(self, cards):
+        """Show metric cards four per row, creating them on first use"""
+        for index, card_data in enumerate(cards):
+            if index < len(self.metric_cards):
+                self.update_metric_card(self.metric_cards[index], *card_data)
+            else:
+                card = self.create_metric_card(*card_data)
+                self.metric_cards.append(card)
+                self.metrics_layout.addWidget(card, index // 4, index % 4)
+    
     def change_view_mode(self):
         """Change view mode between numbers, charts, and graphs"""
         self.view_mode = self.view_combo.currentData()
@@ -228,21 +270,67 @@ class DashboardModule(QWidget):
         if self.view_mode == 'graphs':
             self.refresh_data()
     
+    def current_refresh_key(self):
+        """Everything the displayed values depend on"""
+        return (self.db.data_version(), date.today(), self.view_mode, self.time_period)
+    
+    def refresh(self):
+        """Called when the module is shown"""
+        self.refresh_if_changed()
+    
+    def refresh_if_changed(self):
+        """Timer tick - refresh only when data, the day or the view changed"""
+        if self.current_refresh_key() != self.last_refresh_key:
+            self.refresh_data()
+    
     def refresh_data(self):
-        """Refresh dashboard data"""
-        # Update timestamp
+        """Refresh dashboard data (loaded in the background)"""
+        self.last_refresh_key = self.current_refresh_key()
+        version, today, _, time_period = self.last_refresh_key
+        stats_key = (version, today, time_period)
+        
+        # Nothing written since the last load - only the view changed
+        if stats_key == self.stats_key:
+            self.show_statistics(self.stats)
+            return
+        
+        self.last_updated_label.setText("⏳ Updating...")
+        # The service outlives the load, so its caches are reused; they are
+        # keyed on this (writer) connection's version, not the reader's
+        self.queries.submit(
+            lambda db: self.stats_service.snapshot(time_period, today, db, version),
+            lambda stats: self.on_statistics_loaded(stats, stats_key),
+            self.on_load_failed
+        )
+    
+    def cancel_pending(self):
+        """Drop an in-flight refresh when the user leaves the module"""
+        if self.queries.is_pending():
+            self.queries.cancel_pending()
+            # Load again next time the dashboard is shown
+            self.last_refresh_key = None
+            self.last_updated_label.setText("")
+    
+    def on_statistics_loaded(self, stats, stats_key):
+        """Keep and show a loaded snapshot"""
+        self.stats = stats
+        self.stats_key = stats_key
         self.last_updated_label.setText(f"Last updated: {datetime.now().strftime('%H:%M:%S')}")
-        
-        # Get statistics
-        stats = self.get_statistics()
-        
-        # Clear existing metrics
-        while self.metrics_layout.count():
-            item = self.metrics_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
-        
-        # Create metric cards based on view mode
+        self.show_statistics(stats)
+    
+    def on_load_failed(self, message):
+        """Report a failed refresh; the next timer tick tries again"""
+        self.last_refresh_key = None
+        self.last_updated_label.setText(f"Failed to load statistics: {message}")
+    
+    def show_statistics(self, stats):
+        """Render a snapshot in the current view mode"""
+        # Widgets are only rebuilt when the view mode changes
+        if self.view_mode != self.rendered_view_mode:
+            self.clear_view()
+            self.rendered_view_mode = self.view_mode
+        
+        # Create or update metric cards based on view mode
         if self.view_mode == 'numbers':
             self.show_numbers_view(stats)
         elif self.view_mode == 'charts':
@@ -250,420 +338,305 @@ class DashboardModule(QWidget):
         else:  # graphs
             self.show_graphs_view(stats)
     
-    def get_statistics(self):
-        """Get all statistics for dashboard"""
-        stats = {}
-        
-        # Members statistics
-        members = self.db.fetchall("SELECT is_active, is_deceased FROM members")
-        stats['total_members'] = len(members)
-        stats['active_members'] = sum(1 for m in members if m['is_active'] and not m['is_deceased'])
-        stats['inactive_members'] = sum(1 for m in members if not m['is_active'] and not m['is_deceased'])
-        stats['deceased_members'] = sum(1 for m in members if m['is_deceased'])
-        
-        # Savings statistics
-        savings = self.db.fetchall("""
-            SELECT sa.current_balance, st.type_name
-            FROM savings_accounts sa
-            JOIN savings_types st ON sa.savings_type_id = st.savings_type_id
-        """)
-        stats['total_savings'] = sum(Decimal(str(s['current_balance'])) for s in savings)
-        stats['savings_accounts'] = len(savings)
-        
-        # Savings by type
-        stats['savings_by_type'] = {}
-        for saving in savings:
-            type_name = saving['type_name']
-            if type_name not in stats['savings_by_type']:
-                stats['savings_by_type'][type_name] = Decimal('0')
-            stats['savings_by_type'][type_name] += Decimal(str(saving['current_balance']))
-        
-        # Loans statistics
-        loans = self.db.fetchall("""
-            SELECT principal_amount, interest_amount, amount_paid, balance_outstanding, status
-            FROM loans
-        """)
-        stats['total_loans'] = len(loans)
-        stats['active_loans'] = sum(1 for l in loans if l['status'] == 'Active')
-        stats['completed_loans'] = sum(1 for l in loans if l['status'] == 'Completed')
-        
-        total_disbursed = sum(Decimal(str(l['principal_amount'])) for l in loans)
-        total_outstanding = sum(
-            Decimal(str(l['balance_outstanding']))
-            for l in loans if l['status'] == 'Active'
-        )
-        total_paid = sum(Decimal(str(l['amount_paid'])) for l in loans)
-        
-        stats['loans_disbursed'] = total_disbursed
-        stats['loans_outstanding'] = total_outstanding
-        stats['loans_collected'] = total_paid
-        
-        # Transactions (last 30 days)
-        thirty_days_ago = (datetime.now() - timedelta(days=30)).strftime('%Y-%m-%d')
-        transactions = self.db.fetchall("""
-            SELECT transaction_type, amount, transaction_date
-            FROM transactions
-            WHERE transaction_date >= ?
-        """, (thirty_days_ago,))
-        
-        stats['transactions_30days'] = len(transactions)
-        stats['deposits_30days'] = sum(
-            Decimal(str(t['amount'])) for t in transactions 
-            if t['transaction_type'] == 'Deposit'
-        )
-        stats['withdrawals_30days'] = sum(
-            Decimal(str(t['amount'])) for t in transactions 
-            if t['transaction_type'] == 'Withdrawal'
-        )
-        
-        # Transactions for different time periods based on view mode
-        if self.time_period == 'daily':
-            # Last 7 days
-            stats['period_transactions'] = {}
-            for i in range(7):
-                date = (datetime.now() - timedelta(days=i)).strftime('%Y-%m-%d')
-                day_name = (datetime.now() - timedelta(days=i)).strftime('%a')
-                count = sum(1 for t in transactions if t['transaction_date'].startswith(date))
-                stats['period_transactions'][day_name] = count
-            stats['period_label'] = 'Daily (Last 7 Days)'
-            
-        elif self.time_period == 'weekly':
-            # Last 8 weeks
-            stats['period_transactions'] = {}
-            for i in range(8):
-                week_start = datetime.now() - timedelta(days=datetime.now().weekday() + (i * 7))
-                week_end = week_start + timedelta(days=6)
-                week_label = f"Week {8-i}"
-                count = 0
-                for t in transactions:
-                    trans_date = datetime.strptime(t['transaction_date'], '%Y-%m-%d %H:%M:%S' if ' ' in t['transaction_date'] else '%Y-%m-%d')
-                    if week_start.date() <= trans_date.date() <= week_end.date():
-                        count += 1
-                stats['period_transactions'][week_label] = count
-            stats['period_label'] = 'Weekly (Last 8 Weeks)'
-            
-        elif self.time_period == 'monthly':
-            # Last 12 months
-            stats['period_transactions'] = {}
-            for i in range(12):
-                month_date = datetime.now() - timedelta(days=30*i)
-                month_label = month_date.strftime('%b %Y')
-                month_str = month_date.strftime('%Y-%m')
-                count = sum(1 for t in transactions if t['transaction_date'].startswith(month_str))
-                stats['period_transactions'][month_label] = count
-            stats['period_label'] = 'Monthly (Last 12 Months)'
-            # Reverse to show oldest first
-            stats['period_transactions'] = dict(reversed(list(stats['period_transactions'].items())))
-            
-        elif self.time_period == 'yearly':
-            # Last 5 years
-            stats['period_transactions'] = {}
-            current_year = datetime.now().year
-            for i in range(5):
-                year = current_year - i
-                year_str = str(year)
-                # Count all transactions for this year
-                all_transactions = self.db.fetchall("""
-                    SELECT COUNT(*) as count
-                    FROM transactions
-                    WHERE strftime('%Y', transaction_date) = ?
-                """, (year_str,))
-                count = all_transactions[0]['count'] if all_transactions else 0
-                stats['period_transactions'][year_str] = count
-            stats['period_label'] = 'Yearly (Last 5 Years)'
-            # Reverse to show oldest first
-            stats['period_transactions'] = dict(reversed(list(stats['period_transactions'].items())))
-        
-        # Keep daily_transactions for backward compatibility
-        stats['daily_transactions'] = {}
-        for i in range(7):
-            date = (datetime.now() - timedelta(days=i)).strftime('%Y-%m-%d')
-            day_name = (datetime.now() - timedelta(days=i)).strftime('%a')
-            count = sum(1 for t in transactions if t['transaction_date'].startswith(date))
-            stats['daily_transactions'][day_name] = count
-        
-        return stats
+    def clear_view(self):
+        """Remove all metric cards and charts"""
+        for layout in (self.metrics_layout, self.content_layout):
+            while layout.count():
+                item = layout.takeAt(0)
+                if item.widget():
+                    item.widget().deleteLater()
+        
+        self.metric_cards = []
+        self.charts = {}
+        self.charts_row = None
     
     def show_numbers_view(self, stats):
         """Show metrics as numbers"""
-        # Row 0: Member metrics
-        self.metrics_layout.addWidget(
-            self.create_metric_card(
+        net_flow = stats.net_flow_30days
+        recoverable = stats.loans_collected + stats.loans_outstanding
+        
+        self.set_metric_cards([
+            # Row 0: Member metrics
+            (
                 "Total Members",
-                f"{stats['total_members']:,}",
-                f"Active: {stats['active_members']:,} | Inactive: {stats['inactive_members']:,}",
+                f"{stats.total_members:,}",
+                f"Active: {stats.active_members:,} | Inactive: {stats.inactive_members:,}",
                 "#27AE60"
-            ), 0, 0
-        )
-        
-        self.metrics_layout.addWidget(
-            self.create_metric_card(
+            ),
+            (
                 "Active Members",
-                f"{stats['active_members']:,}",
-                f"{(stats['active_members']/max(stats['total_members'],1)*100):.1f}% of total",
+                f"{stats.active_members:,}",
+                f"{(stats.active_members/max(stats.total_members,1)*100):.1f}% of total",
                 "#2ECC71"
-            ), 0, 1
-        )
-        
-        self.metrics_layout.addWidget(
-            self.create_metric_card(
+            ),
+            (
                 "Savings Accounts",
-                f"{stats['savings_accounts']:,}",
-                f"Average: ₦{(stats['total_savings']/max(stats['savings_accounts'],1)):,.0f}",
+                f"{stats.savings_accounts:,}",
+                f"Average: ₦{(stats.total_savings/max(stats.savings_accounts,1)):,.0f}",
                 "#3498DB"
-            ), 0, 2
-        )
-        
-        self.metrics_layout.addWidget(
-            self.create_metric_card(
+            ),
+            (
                 "Total Savings",
-                f"₦{stats['total_savings']:,.2f}",
+                f"₦{stats.total_savings:,.2f}",
                 "All savings types",
                 "#1ABC9C"
-            ), 0, 3
-        )
-        
-        # Row 1: Loan metrics
-        self.metrics_layout.addWidget(
-            self.create_metric_card(
+            ),
+            
+            # Row 1: Loan metrics
+            (
                 "Total Loans",
-                f"{stats['total_loans']:,}",
-                f"Active: {stats['active_loans']:,} | Completed: {stats['completed_loans']:,}",
+                f"{stats.total_loans:,}",
+                f"Active: {stats.active_loans:,} | Completed: {stats.completed_loans:,}",
                 "#E67E22"
-            ), 1, 0
-        )
-        
-        self.metrics_layout.addWidget(
-            self.create_metric_card(
+            ),
+            (
                 "Loans Disbursed",
-                f"₦{stats['loans_disbursed']:,.2f}",
+                f"₦{stats.loans_disbursed:,.2f}",
                 "Total principal amount",
                 "#D35400"
-            ), 1, 1
-        )
-        
-        self.metrics_layout.addWidget(
-            self.create_metric_card(
+            ),
+            (
                 "Outstanding Balance",
-                f"₦{stats['loans_outstanding']:,.2f}",
+                f"₦{stats.loans_outstanding:,.2f}",
                 "Amount to be collected",
                 "#E74C3C"
-            ), 1, 2
-        )
-        
-        self.metrics_layout.addWidget(
-            self.create_metric_card(
+            ),
+            (
                 "Collected Amount",
-                f"₦{stats['loans_collected']:,.2f}",
-                f"{(stats['loans_collected']/(stats['loans_collected']+stats['loans_outstanding'])*100) if (stats['loans_collected']+stats['loans_outstanding']) > 0 else 0:.1f}% recovery rate",
+                f"₦{stats.loans_collected:,.2f}",
+                f"{(stats.loans_collected/recoverable*100) if recoverable > 0 else 0:.1f}% recovery rate",
                 "#16A085"
-            ), 1, 3
-        )
-        
-        # Row 2: Transaction metrics
-        self.metrics_layout.addWidget(
-            self.create_metric_card(
+            ),
+            
+            # Row 2: Transaction metrics
+            (
                 "Transactions (30 days)",
-                f"{stats['transactions_30days']:,}",
-                f"Daily average: {stats['transactions_30days']/30:.0f}",
+                f"{stats.transactions_30days:,}",
+                f"Daily average: {stats.transactions_30days/30:.0f}",
                 "#9B59B6"
-            ), 2, 0
-        )
-        
-        self.metrics_layout.addWidget(
-            self.create_metric_card(
+            ),
+            (
                 "Deposits (30 days)",
-                f"₦{stats['deposits_30days']:,.2f}",
+                f"₦{stats.deposits_30days:,.2f}",
                 "Money in",
                 "#27AE60"
-            ), 2, 1
-        )
-        
-        self.metrics_layout.addWidget(
-            self.create_metric_card(
+            ),
+            (
                 "Withdrawals (30 days)",
-                f"₦{stats['withdrawals_30days']:,.2f}",
+                f"₦{stats.withdrawals_30days:,.2f}",
                 "Money out",
                 "#E74C3C"
-            ), 2, 2
-        )
-        
-        net_flow = stats['deposits_30days'] - stats['withdrawals_30days']
-        self.metrics_layout.addWidget(
-            self.create_metric_card(
+            ),
+            (
                 "Net Flow (30 days)",
                 f"₦{net_flow:,.2f}",
                 "Deposits - Withdrawals",
                 "#27AE60" if net_flow >= 0 else "#E74C3C"
-            ), 2, 3
-        )
-        
-        # Clear content area for numbers view
-        while self.content_layout.count():
-            item = self.content_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
+            ),
+            
+            # Row 3: Portfolio risk
+            (
+                "Portfolio at Risk (30+ days)",
+                f"{stats.par_ratios.get(30, 0):.1%}",
+                f"₦{stats.portfolio_at_risk.get(30, 0):,.2f} in loans over 30 days late",
+                "#F39C12"
+            ),
+            (
+                "Portfolio at Risk (60+ days)",
+                f"{stats.par_ratios.get(60, 0):.1%}",
+                f"₦{stats.portfolio_at_risk.get(60, 0):,.2f} in loans over 60 days late",
+                "#E67E22"
+            ),
+            (
+                "Portfolio at Risk (90+ days)",
+                f"{stats.par_ratios.get(90, 0):.1%}",
+                f"₦{stats.portfolio_at_risk.get(90, 0):,.2f} in loans over 90 days late",
+                "#C0392B"
+            ),
+            (
+                "Collection Rate (last month)",
+                f"{stats.last_month_collection_rate:.1%}",
+                "Repayments / installments due",
+                "#16A085"
+            ),
+        ])
     
     def show_charts_view(self, stats):
         """Show metrics as pie charts"""
         # Show summary numbers in top row
-        self.metrics_layout.addWidget(
-            self.create_metric_card(
+        self.set_metric_cards([
+            (
                 "Total Members",
-                f"{stats['total_members']:,}",
-                f"Active: {stats['active_members']:,}",
+                f"{stats.total_members:,}",
+                f"Active: {stats.active_members:,}",
                 "#27AE60"
-            ), 0, 0
-        )
-        
-        self.metrics_layout.addWidget(
-            self.create_metric_card(
+            ),
+            (
                 "Total Savings",
-                f"₦{stats['total_savings']:,.2f}",
-                f"{stats['savings_accounts']:,} accounts",
+                f"₦{stats.total_savings:,.2f}",
+                f"{stats.savings_accounts:,} accounts",
                 "#3498DB"
-            ), 0, 1
-        )
-        
-        self.metrics_layout.addWidget(
-            self.create_metric_card(
+            ),
+            (
                 "Active Loans",
-                f"{stats['active_loans']:,}",
-                f"₦{stats['loans_outstanding']:,.2f} outstanding",
+                f"{stats.active_loans:,}",
+                f"₦{stats.loans_outstanding:,.2f} outstanding",
                 "#E67E22"
-            ), 0, 2
-        )
-        
-        self.metrics_layout.addWidget(
-            self.create_metric_card(
+            ),
+            (
                 "30-Day Activity",
-                f"{stats['transactions_30days']:,}",
+                f"{stats.transactions_30days:,}",
                 "transactions",
                 "#9B59B6"
-            ), 0, 3
-        )
-        
-        # Clear previous charts
-        while self.content_layout.count():
-            item = self.content_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
-        
-        # Create charts row
-        charts_row = QHBoxLayout()
-        charts_row.setSpacing(15)
+            ),
+        ])
         
         # Members distribution pie chart
-        members_chart = self.create_pie_chart(
+        self.set_pie_chart(
+            'members',
             "Member Status Distribution",
             [
-                ("Active", stats['active_members'], "#27AE60"),
-                ("Inactive", stats['inactive_members'], "#F39C12"),
-                ("Deceased", stats['deceased_members'], "#E74C3C")
+                ("Active", stats.active_members, "#27AE60"),
+                ("Inactive", stats.inactive_members, "#F39C12"),
+                ("Deceased", stats.deceased_members, "#E74C3C")
             ]
         )
-        charts_row.addWidget(members_chart)
         
         # Savings by type pie chart
         savings_data = [
             (name, float(amount), self.get_color_for_index(i))
-            for i, (name, amount) in enumerate(stats['savings_by_type'].items())
+            for i, (name, amount) in enumerate(stats.savings_by_type.items())
         ]
-        savings_chart = self.create_pie_chart(
+        self.set_pie_chart(
+            'savings',
             "Savings Distribution by Type",
             savings_data,
             show_percentage=True
         )
-        charts_row.addWidget(savings_chart)
         
         # Loans status pie chart
-        loans_chart = self.create_pie_chart(
+        self.set_pie_chart(
+            'loans',
             "Loan Status Distribution",
             [
-                ("Active", stats['active_loans'], "#E67E22"),
-                ("Completed", stats['completed_loans'], "#27AE60")
+                ("Active", stats.active_loans, "#E67E22"),
+                ("Completed", stats.completed_loans, "#27AE60")
             ]
         )
-        charts_row.addWidget(loans_chart)
         
-        self.content_layout.addLayout(charts_row)
+        # Open balance by days past due
+        self.set_pie_chart(
+            'aging',
+            "Portfolio Aging",
+            [
+                (row['bucket'], row['outstanding'], self.get_color_for_index(i))
+                for i, row in enumerate(stats.aging)
+            ],
+            show_percentage=True
+        )
     
     def show_graphs_view(self, stats):
         """Show metrics as bar/line graphs"""
+        net_flow = stats.net_flow_30days
+        
         # Show summary numbers
-        self.metrics_layout.addWidget(
-            self.create_metric_card(
+        self.set_metric_cards([
+            (
                 "Total Members",
-                f"{stats['total_members']:,}",
-                f"Active: {stats['active_members']:,}",
+                f"{stats.total_members:,}",
+                f"Active: {stats.active_members:,}",
                 "#27AE60"
-            ), 0, 0
-        )
-        
-        self.metrics_layout.addWidget(
-            self.create_metric_card(
+            ),
+            (
                 "Total Savings",
-                f"₦{stats['total_savings']:,.2f}",
-                f"{stats['savings_accounts']:,} accounts",
+                f"₦{stats.total_savings:,.2f}",
+                f"{stats.savings_accounts:,} accounts",
                 "#3498DB"
-            ), 0, 1
-        )
-        
-        self.metrics_layout.addWidget(
-            self.create_metric_card(
+            ),
+            (
                 "Loans Outstanding",
-                f"₦{stats['loans_outstanding']:,.2f}",
-                f"{stats['active_loans']:,} active loans",
+                f"₦{stats.loans_outstanding:,.2f}",
+                f"{stats.active_loans:,} active loans",
                 "#E67E22"
-            ), 0, 2
-        )
-        
-        self.metrics_layout.addWidget(
-            self.create_metric_card(
+            ),
+            (
                 "Net Flow (30d)",
-                f"₦{stats['deposits_30days'] - stats['withdrawals_30days']:,.2f}",
+                f"₦{net_flow:,.2f}",
                 "Deposits - Withdrawals",
-                "#27AE60" if (stats['deposits_30days'] - stats['withdrawals_30days']) >= 0 else "#E74C3C"
-            ), 0, 3
-        )
-        
-        # Clear previous graphs
-        while self.content_layout.count():
-            item = self.content_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
-        
-        # Create graphs row
-        graphs_row = QHBoxLayout()
-        graphs_row.setSpacing(15)
+                "#27AE60" if net_flow >= 0 else "#E74C3C"
+            ),
+        ])
         
         # Period transactions bar chart (based on selected time period)
-        period_chart = self.create_bar_chart(
-            f"Transactions - {stats.get('period_label', 'Daily')}",
-            list(reversed(list(stats['period_transactions'].keys()))),
-            [list(reversed(list(stats['period_transactions'].values())))],
+        self.set_bar_chart(
+            'period',
+            f"Transactions - {stats.period_label}",
+            list(reversed(list(stats.period_transactions.keys()))),
+            [list(reversed(list(stats.period_transactions.values())))],
             ["Transactions"],
             ["#3498DB"]
         )
-        graphs_row.addWidget(period_chart)
         
         # Savings vs Loans comparison
-        comparison_chart = self.create_bar_chart(
+        self.set_bar_chart(
+            'overview',
             "Financial Overview",
             ["Savings", "Loans Out", "Collected"],
             [
-                [float(stats['total_savings']), float(stats['loans_outstanding']), float(stats['loans_collected'])]
+                [float(stats.total_savings), float(stats.loans_outstanding), float(stats.loans_collected)]
             ],
             ["Amount (₦)"],
             ["#3498DB"]
         )
-        graphs_row.addWidget(comparison_chart)
         
-        self.content_layout.addLayout(graphs_row)
+        # Collections against installments due, per month
+        self.set_bar_chart(
+            'collections',
+            "Collection Rate % - Last 12 Months",
+            [datetime.strptime(row['month'], '%Y-%m').strftime('%b %y') for row in stats.collections],
+            [[round(row['rate'] * 100, 1) for row in stats.collections]],
+            ["Collected / Due"],
+            ["#16A085"]
+        )
     
-    def create_pie_chart(self, title, data, show_percentage=False):
-        """Create a pie chart"""
-        series = QPieSeries()
+    def add_chart_view(self, name, chart_view):
+        """Add a chart to the charts row, creating the row on first use"""
+        if self.charts_row is None:
+            row_widget = QWidget()
+            self.charts_row = QHBoxLayout(row_widget)
+            self.charts_row.setContentsMargins(0, 0, 0, 0)
+            self.charts_row.setSpacing(15)
+            self.content_layout.addWidget(row_widget)
+        
+        self.charts_row.addWidget(chart_view)
+        self.charts[name] = chart_view
+    
+    def set_pie_chart(self, name, title, data, show_percentage=False):
+        """Show a pie chart, refilling its series only when the data changed"""
+        chart_view = self.charts.get(name)
+        if chart_view is None:
+            self.add_chart_view(name, self.create_pie_chart(title, data, show_percentage))
+        elif chart_view.chart_data != data:
+            self.populate_pie_series(chart_view.series, data, show_percentage)
+            chart_view.chart_data = data
+    
+    def set_bar_chart(self, name, title, categories, data_sets, set_names, colors):
+        """Show a bar chart, refilling its series only when the data changed"""
+        chart_data = {'categories': categories, 'data_sets': data_sets, 'set_names': set_names, 'colors': colors}
+        chart_view = self.charts.get(name)
+        if chart_view is None:
+            self.add_chart_view(name, self.create_bar_chart(title, categories, data_sets, set_names, colors))
+            return
+        
+        if chart_view.chart().title() != title:
+            chart_view.chart().setTitle(title)
+        if chart_view.chart_data != chart_data:
+            self.populate_bar_series(chart_view.series, chart_view.axis_x, chart_view.axis_y, chart_data)
+            chart_view.chart_data = chart_data
+    
+    def populate_pie_series(self, series, data, show_percentage=False):
+        """Fill a pie series with (label, value, color) slices"""
+        series.clear()
         
         total = sum(value for _, value, _ in data)
         
@@ -677,6 +650,29 @@ class DashboardModule(QWidget):
                     slice.setLabel(f"{label}\n{percentage:.1f}%")
                 else:
                     slice.setLabel(f"{label}\n{int(value)}")
+    
+    def populate_bar_series(self, series, axis_x, axis_y, chart_data):
+        """Fill a bar series and its axes from chart data"""
+        series.clear()
+        
+        for data, name, color in zip(chart_data['data_sets'], chart_data['set_names'], chart_data['colors']):
+            bar_set = QBarSet(name)
+            bar_set.setColor(QColor(color))
+            for value in data:
+                bar_set.append(value)
+            series.append(bar_set)
+        
+        axis_x.clear()
+        axis_x.append(chart_data['categories'])
+        
+        highest = max((value for data in chart_data['data_sets'] for value in data), default=0)
+        axis_y.setRange(0, highest if highest > 0 else 1)
+        axis_y.applyNiceNumbers()
+    
+    def create_pie_chart(self, title, data, show_percentage=False):
+        """Create a pie chart"""
+        series = QPieSeries()
+        self.populate_pie_series(series, data, show_percentage)
         
         chart = QChart()
         chart.addSeries(series)
@@ -690,26 +686,19 @@ class DashboardModule(QWidget):
         chart_view.setRenderHint(QPainter.RenderHint.Antialiasing)
         chart_view.setMinimumHeight(400)  # Increased from 350
         chart_view.setCursor(Qt.CursorShape.PointingHandCursor)
+        chart_view.series = series
+        chart_view.chart_data = data
         
-        # Make chart clickable - expand on click
-        chart_view.mousePressEvent = lambda event: self.expand_chart(chart, title, data, 'pie', show_percentage)
+        # Make chart clickable - expand on click (uses the latest data)
+        chart_view.mousePressEvent = lambda event: self.expand_chart(
+            chart, chart.title(), chart_view.chart_data, 'pie', show_percentage
+        )
         
         return chart_view
     
     def create_bar_chart(self, title, categories, data_sets, set_names, colors):
         """Create a bar chart"""
-        series_list = []
-        
-        for i, (data, name, color) in enumerate(zip(data_sets, set_names, colors)):
-            bar_set = QBarSet(name)
-            bar_set.setColor(QColor(color))
-            for value in data:
-                bar_set.append(value)
-            series_list.append(bar_set)
-        
         series = QBarSeries()
-        for bar_set in series_list:
-            series.append(bar_set)
         
         chart = QChart()
         chart.addSeries(series)
@@ -721,7 +710,6 @@ class DashboardModule(QWidget):
         
         # X Axis
         axis_x = QBarCategoryAxis()
-        axis_x.append(categories)
         axis_x.setLabelsColor(QColor("#E6E6EB"))
         chart.addAxis(axis_x, Qt.AlignmentFlag.AlignBottom)
         series.attachAxis(axis_x)
@@ -732,14 +720,22 @@ class DashboardModule(QWidget):
         chart.addAxis(axis_y, Qt.AlignmentFlag.AlignLeft)
         series.attachAxis(axis_y)
         
+        chart_data = {'categories': categories, 'data_sets': data_sets, 'set_names': set_names, 'colors': colors}
+        self.populate_bar_series(series, axis_x, axis_y, chart_data)
+        
         chart_view = QChartView(chart)
         chart_view.setRenderHint(QPainter.RenderHint.Antialiasing)
         chart_view.setMinimumHeight(400)  # Increased from 350
         chart_view.setCursor(Qt.CursorShape.PointingHandCursor)
-        
-        # Make chart clickable - expand on click
-        chart_data = {'categories': categories, 'data_sets': data_sets, 'set_names': set_names, 'colors': colors}
-        chart_view.mousePressEvent = lambda event: self.expand_chart(chart, title, chart_data, 'bar')
+        chart_view.series = series
+        chart_view.axis_x = axis_x
+        chart_view.axis_y = axis_y
+        chart_view.chart_data = chart_data
+        
+        # Make chart clickable - expand on click (uses the latest data)
+        chart_view.mousePressEvent = lambda event: self.expand_chart(
+            chart, chart.title(), chart_view.chart_data, 'bar'
+        )
         
         return chart_view
     
@@ -754,18 +750,7 @@ class DashboardModule(QWidget):
         # Recreate the chart at larger size
         if chart_type == 'pie':
             series = QPieSeries()
-            total = sum(value for _, value, _ in data)
-            
-            for label, value, color in data:
-                if value > 0:
-                    slice = series.append(label, value)
-                    slice.setColor(QColor(color))
-                    slice.setLabelVisible(True)
-                    if show_percentage:
-                        percentage = (value / total * 100) if total > 0 else 0
-                        slice.setLabel(f"{label}\n{percentage:.1f}%")
-                    else:
-                        slice.setLabel(f"{label}\n{int(value)}")
+            self.populate_pie_series(series, data, show_percentage)
             
             chart = QChart()
             chart.addSeries(series)
@@ -780,22 +765,7 @@ class DashboardModule(QWidget):
             chart_view.setRenderHint(QPainter.RenderHint.Antialiasing)
             
         elif chart_type == 'bar':
-            categories = data['categories']
-            data_sets = data['data_sets']
-            set_names = data['set_names']
-            colors = data['colors']
-            
-            series_list = []
-            for i, (dataset, name, color) in enumerate(zip(data_sets, set_names, colors)):
-                bar_set = QBarSet(name)
-                bar_set.setColor(QColor(color))
-                for value in dataset:
-                    bar_set.append(value)
-                series_list.append(bar_set)
-            
             series = QBarSeries()
-            for bar_set in series_list:
-                series.append(bar_set)
             
             chart = QChart()
             chart.addSeries(series)
@@ -808,7 +778,6 @@ class DashboardModule(QWidget):
             
             # X Axis
             axis_x = QBarCategoryAxis()
-            axis_x.append(categories)
             axis_x.setLabelsColor(QColor("#E6E6EB"))
             axis_x.setLabelsFont(QFont("Segoe UI", 10))
             chart.addAxis(axis_x, Qt.AlignmentFlag.AlignBottom)
@@ -821,6 +790,8 @@ class DashboardModule(QWidget):
             chart.addAxis(axis_y, Qt.AlignmentFlag.AlignLeft)
             series.attachAxis(axis_y)
             
+            self.populate_bar_series(series, axis_x, axis_y, data)
+            
             chart_view = QChartView(chart)
             chart_view.setRenderHint(QPainter.RenderHint.Antialiasing)
         
@@ -14,6 +14,10 @@ from PyQt6.QtGui import QFont
 from datetime import datetime, timedelta
 from dateutil.relativedelta import relativedelta
 
+from database.db_manager import arrears_run_report
+
+from .member_search import MemberSearchBox
+
 
 class LoansModule(QWidget):
     """Complete loans management module"""
@@ -56,6 +60,12 @@ class LoansModule(QWidget):
         self.repay_btn.clicked.connect(self.show_repayment_dialog)
         header_layout.addWidget(self.repay_btn)
         
+        arrears_btn = QPushButton("⚠️ Check Arrears")
+        arrears_btn.setFixedHeight(35)
+        arrears_btn.setCursor(Qt.CursorShape.PointingHandCursor)
+        arrears_btn.clicked.connect(self.run_arrears_check)
+        header_layout.addWidget(arrears_btn)
+        
         layout.addLayout(header_layout)
         
         # Search section
@@ -65,16 +75,14 @@ class LoansModule(QWidget):
         search_label = QLabel("Member ID:")
         search_layout.addWidget(search_label)
         
-        self.search_input = QLineEdit()
-        self.search_input.setPlaceholderText("Search by Member ID, Name, or Partial Name (use + or & for multiple)")
-        self.search_input.setMinimumHeight(35)  # Taller for better usability
-        self.search_input.returnPressed.connect(self.search_member)
-        search_layout.addWidget(self.search_input)
+        self.member_search = MemberSearchBox(self.db, self)
+        self.member_search.member_selected.connect(self.select_member)
+        search_layout.addWidget(self.member_search)
         
         search_btn = QPushButton("🔍 Search")
         search_btn.setMinimumHeight(35)
         search_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        search_btn.clicked.connect(self.search_member)
+        search_btn.clicked.connect(self.member_search.select_best_match)
         search_layout.addWidget(search_btn)
         
         clear_btn = QPushButton("Clear")
@@ -132,98 +140,12 @@ class LoansModule(QWidget):
         if self.current_member:
             self.load_member_loans(self.current_member)
     
-    def search_member(self):
-        """Search for member"""
-        search_text = self.search_input.text().strip()
-        
-        if not search_text:
-            QMessageBox.warning(self, "Search", "Please enter a Member ID or Name")
-            return
-        
-        # Check if searching by multiple terms (using + or &)
-        search_terms = []
-        if '+' in search_text or '&' in search_text:
-            # Split by both + and &
-            import re
-            search_terms = [term.strip() for term in re.split('[+&]', search_text) if term.strip()]
-        else:
-            search_terms = [search_text]
-        
-        # Try to find member(s) matching the search
-        member = None
-        
-        # First, try direct member ID match
-        if len(search_terms) == 1:
-            potential_id = search_terms[0].upper()
-            member = self.db.get_member(potential_id)
-        
-        # If not found by ID, search by name
-        if not member:
-            # Build SQL query for name search
-            query_parts = []
-            params = []
-            
-            for term in search_terms:
-                term_lower = term.lower()
-                # Search in first name, middle name, or last name
-                query_parts.append("""
-                    (LOWER(first_name) LIKE ? OR 
-                     LOWER(middle_name) LIKE ? OR 
-                     LOWER(last_name) LIKE ?)
-                """)
-                params.extend([f'%{term_lower}%', f'%{term_lower}%', f'%{term_lower}%'])
-            
-            # Join with AND if multiple terms (all must match)
-            where_clause = ' AND '.join(query_parts)
-            
-            sql = f"""
-                SELECT member_id, first_name, middle_name, last_name
-                FROM members
-                WHERE {where_clause}
-                LIMIT 10
-            """
-            
-            results = self.db.fetchall(sql, tuple(params))
-            
-            if not results:
-                QMessageBox.warning(
-                    self, 
-                    "Not Found", 
-                    f"No member found matching: {search_text}"
-                )
-                return
-            elif len(results) == 1:
-                # Found exactly one match
-                member = self.db.get_member(results[0]['member_id'])
-            else:
-                # Multiple matches - let user choose
-                from PyQt6.QtWidgets import QInputDialog
-                names = [
-                    f"{r['member_id']}: {r['first_name']} {r.get('middle_name', '')} {r['last_name']}".replace('  ', ' ')
-                    for r in results
-                ]
-                choice, ok = QInputDialog.getItem(
-                    self,
-                    "Multiple Matches",
-                    "Select member:",
-                    names,
-                    0,
-                    False
-                )
-                if ok and choice:
-                    selected_id = choice.split(':')[0]
-                    member = self.db.get_member(selected_id)
-                else:
-                    return
-        
-        if not member:
-            QMessageBox.warning(
-                self,
-                "Not Found",
-                f"Member not found: {search_text}"
-            )
-            return
-        
+    def cancel_pending(self):
+        """Drop pending member suggestions when the user leaves the module"""
+        self.member_search.cancel_pending()
+    
+    def select_member(self, member):
+        """Show the loans of the member picked in the search box"""
         self.current_member = member
         self.load_member_loans(member)
         
@@ -241,7 +163,7 @@ class LoansModule(QWidget):
         loans = self.db.get_member_loans(member['member_id'], active_only=False)
         
         # Calculate totals
-        total_outstanding = sum(l['balance_outstanding'] for l in loans if l['status'] == 'Active')
+        total_outstanding = sum(l['balance_outstanding'] for l in loans if l['status'] in ('Active', 'Defaulted'))
         
         self.member_info_label.setText(
             f"<b>Member:</b> {full_name} &nbsp;&nbsp;|&nbsp;&nbsp; "
@@ -287,18 +209,71 @@ class LoansModule(QWidget):
                 status_item.setForeground(Qt.GlobalColor.yellow)
             elif loan['status'] == 'Completed':
                 status_item.setForeground(Qt.GlobalColor.green)
+            elif loan['status'] == 'Defaulted':
+                status_item.setForeground(Qt.GlobalColor.red)
             self.loans_table.setItem(row, 8, status_item)
         
         # Update summary
         active_loans = sum(1 for l in loans if l['status'] == 'Active')
+        defaulted_loans = sum(1 for l in loans if l['status'] == 'Defaulted')
         self.summary_label.setText(
-            f"Total Loans: {len(loans)} | Active: {active_loans} | "
+            f"Total Loans: {len(loans)} | Active: {active_loans} | Defaulted: {defaulted_loans} | "
             f"Total Outstanding: ₦{total_outstanding:,.2f}"
         )
     
+    def run_arrears_check(self):
+        """Preview the arrears check, then flag defaults once the operator confirms"""
+        try:
+            preview = self.db.run_arrears_job(created_by=self.current_user['username'], dry_run=True)
+        except Exception as e:
+            QMessageBox.critical(
+                self,
+                "Error",
+                f"Failed to check arrears:\n{str(e)}"
+            )
+            return
+        
+        reply = QMessageBox.question(
+            self,
+            "Loan Arrears",
+            f"{preview['loans_in_arrears']:,} of {preview['loans_checked']:,} open loans are in "
+            f"arrears (₦{preview['total_arrears']:,.2f}).\n\n"
+            f"Loans to mark as defaulted ({preview['default_days']}+ days past due): "
+            f"{preview['loans_defaulted']:,}\n"
+            f"Defaulted loans to bring back to active: {preview['loans_cured']:,}\n\n"
+            f"Apply these status changes?",
+            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+            QMessageBox.StandardButton.No
+        )
+        if reply != QMessageBox.StandardButton.Yes:
+            return
+        
+        try:
+            run = self.db.run_arrears_job(created_by=self.current_user['username'])
+        except Exception as e:
+            QMessageBox.critical(
+                self,
+                "Error",
+                f"Failed to check arrears:\n{str(e)}"
+            )
+            return
+        
+        box = QMessageBox(self)
+        box.setWindowTitle("Loan Arrears")
+        box.setText(
+            f"{run['loans_in_arrears']:,} of {run['loans_checked']:,} open loans are in arrears "
+            f"(₦{run['total_arrears']:,.2f}).\n"
+            f"Newly defaulted: {run['loans_defaulted']:,} | Cured: {run['loans_cured']:,}"
+        )
+        box.setDetailedText(arrears_run_report(run))
+        box.exec()
+        
+        if self.current_member:
+            self.load_member_loans(self.current_member)
+    
     def clear_search(self):
         """Clear search"""
-        self.search_input.clear()
+        self.member_search.clear()
         self.current_member = None
         self.loans_table.setRowCount(0)
         self.member_info_label.setText("No member selected")
@@ -569,6 +544,9 @@ class RepaymentDialog(QDialog):
         self.db = db
         self.member = member
         self.loans = loans
+        self.expected = db.get_expected_repayments(
+            [loan['loan_id'] for loan in loans], datetime.now().date().isoformat()
+        )
         
         self.setWindowTitle(f"Loan Repayment - {member['member_id']}")
         self.setMinimumWidth(500)
@@ -652,15 +630,17 @@ class RepaymentDialog(QDialog):
         if not loan:
             return
         
-        # Set suggested amount
-        self.amount_input.setValue(loan['monthly_installment'])
+        # Set suggested amount: what the schedule has due now
+        due_now = self.expected.get(loan['loan_id'], 0)
+        self.amount_input.setValue(due_now)
         
         # Display loan info
         self.loan_info_label.setText(
             f"<b>Total Amount:</b> ₦{loan['total_amount']:,.2f}<br>"
             f"<b>Amount Paid:</b> ₦{loan['amount_paid']:,.2f}<br>"
             f"<b>Balance Outstanding:</b> ₦{loan['balance_outstanding']:,.2f}<br>"
-            f"<b>Expected Monthly:</b> ₦{loan['monthly_installment']:,.2f}"
+            f"<b>Expected Monthly:</b> ₦{loan['monthly_installment']:,.2f}<br>"
+            f"<b>Due Now:</b> ₦{due_now:,.2f}"
         )
     
     def get_payment_data(self):
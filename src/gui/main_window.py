@@ -343,6 +343,13 @@ class MainWindow(QMainWindow):
     
     def switch_module(self, index):
         """Switch to a different module"""
+        # Discard background queries of the module being left
+        previous = self.content_stack.currentIndex()
+        if previous != index and 0 <= previous < len(self.modules):
+            module = self.modules[previous]
+            if hasattr(module, 'cancel_pending'):
+                module.cancel_pending()
+        
         # Uncheck all other buttons
         for i, btn in enumerate(self.nav_buttons):
             if i != index:
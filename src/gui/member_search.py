@@ -0,0 +1,186 @@
+"""
+Member Search - Type-ahead member lookup widget
+===============================================
+Shared by the Loans and Savings modules. Suggestions come from the
+members_fts index through DatabaseManager.search_members, run in the
+background a short pause after the user stops typing.
+"""
+
+from collections import OrderedDict
+
+from PyQt6.QtWidgets import QWidget, QHBoxLayout, QLineEdit, QCompleter, QMessageBox
+from PyQt6.QtCore import Qt, QTimer, QModelIndex, pyqtSignal
+from PyQt6.QtGui import QStandardItemModel, QStandardItem
+
+from .async_query import AsyncQueryRunner
+
+
+class MemberSearchBox(QWidget):
+    """Member search field with debounced, cached type-ahead suggestions"""
+
+    member_selected = pyqtSignal(dict)
+
+    DEBOUNCE_MS = 150
+    MAX_SUGGESTIONS = 10
+    CACHE_SIZE = 64
+
+    def __init__(self, db, parent=None):
+        super().__init__(parent)
+        self.db = db
+        self.queries = AsyncQueryRunner(db, self)
+
+        # Recent results, least recently used first; dropped when data changes
+        self.cache = OrderedDict()
+        self.cache_version = None
+
+        self.setup_ui()
+
+    def setup_ui(self):
+        """Setup the input field and suggestion popup"""
+        layout = QHBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+
+        self.input = QLineEdit()
+        self.input.setPlaceholderText("Type the start of a Member ID, name, phone or employee ID...")
+        self.input.setToolTip(
+            "Matches the start of each word, e.g. \"NFC00\" or \"Ade\".\n"
+            "Type a Member ID from the beginning: \"0012\" will not find NFC0012."
+        )
+        self.input.setMinimumHeight(35)  # Taller for better usability
+        self.input.textEdited.connect(self.on_text_edited)
+        self.input.returnPressed.connect(self.select_best_match)
+        layout.addWidget(self.input)
+
+        # Suggestions are already ranked by the database, so show them unfiltered
+        self.model = QStandardItemModel(self)
+        self.completer = QCompleter(self.model, self)
+        self.completer.setWidget(self.input)
+        self.completer.setCompletionMode(QCompleter.CompletionMode.UnfilteredPopupCompletion)
+        self.completer.setMaxVisibleItems(self.MAX_SUGGESTIONS)
+        self.completer.activated[QModelIndex].connect(self.on_suggestion_activated)
+
+        # Debounce - only search once typing pauses
+        self.debounce = QTimer(self)
+        self.debounce.setSingleShot(True)
+        self.debounce.setInterval(self.DEBOUNCE_MS)
+        self.debounce.timeout.connect(self.run_search)
+
+    def text(self):
+        """Current search text"""
+        return self.input.text().strip()
+
+    def clear(self):
+        """Clear the field and any pending search"""
+        self.cancel_pending()
+        self.input.clear()
+        self.model.clear()
+
+    def cancel_pending(self):
+        """Stop a scheduled or in-flight search"""
+        self.debounce.stop()
+        self.queries.cancel_pending()
+        self.completer.popup().hide()
+
+    def on_text_edited(self, text):
+        """Restart the debounce timer on every keystroke"""
+        if text.strip():
+            self.debounce.start()
+        else:
+            self.cancel_pending()
+
+    def run_search(self):
+        """Show suggestions for the current text, from cache or the database"""
+        text = self.text()
+        if not text:
+            return
+
+        cached = self.cached_results(text)
+        if cached is not None:
+            self.show_suggestions(cached)
+            return
+
+        # A newer search replaces this one in the runner, so superseded
+        # results never reach on_results
+        self.queries.submit(
+            lambda db: db.search_members(text, self.MAX_SUGGESTIONS),
+            lambda results: self.on_results(text, results),
+            key='search'
+        )
+
+    def on_results(self, text, results):
+        """Cache background results and show them if still relevant"""
+        self.store_results(text, results)
+        if text == self.text():
+            self.show_suggestions(results)
+
+    def cached_results(self, text):
+        """Cached results for text, or None"""
+        version = self.db.data_version()
+        if version != self.cache_version:
+            self.cache.clear()
+            self.cache_version = version
+
+        key = text.lower()
+        if key in self.cache:
+            self.cache.move_to_end(key)
+            return self.cache[key]
+        return None
+
+    def store_results(self, text, results):
+        """Remember results, evicting the least recently used entry"""
+        self.cache[text.lower()] = results
+        self.cache.move_to_end(text.lower())
+        while len(self.cache) > self.CACHE_SIZE:
+            self.cache.popitem(last=False)
+
+    def show_suggestions(self, members):
+        """Fill and open the suggestion popup"""
+        self.model.clear()
+        for member in members:
+            item = QStandardItem(self.member_label(member))
+            item.setData(member, Qt.ItemDataRole.UserRole)
+            self.model.appendRow(item)
+
+        if members:
+            self.completer.complete()
+        else:
+            self.completer.popup().hide()
+
+    def on_suggestion_activated(self, index):
+        """Pick the member chosen from the popup"""
+        member = index.data(Qt.ItemDataRole.UserRole)
+        if member:
+            self.select_member(member)
+
+    def select_best_match(self):
+        """Enter pressed - pick an exact ID match or a single result, else list matches"""
+        self.debounce.stop()
+        text = self.text()
+        if not text:
+            QMessageBox.warning(self, "Search", "Please enter a Member ID or Name")
+            return
+
+        results = self.cached_results(text)
+        if results is None:
+            results = self.db.search_members(text, self.MAX_SUGGESTIONS)
+            self.store_results(text, results)
+
+        exact = next((m for m in results if m['member_id'].upper() == text.upper()), None)
+        if exact or len(results) == 1:
+            self.select_member(exact or results[0])
+        elif results:
+            self.show_suggestions(results)
+        else:
+            QMessageBox.warning(self, "Not Found", f"No member found matching: {text}")
+
+    def select_member(self, member):
+        """Show the chosen member in the field and announce it"""
+        self.cancel_pending()
+        self.input.setText(self.member_label(member))
+        self.member_selected.emit(member)
+
+    @staticmethod
+    def member_label(member):
+        """Suggestion text for a member"""
+        names = [member['first_name'], member.get('middle_name'), member['last_name']]
+        return f"{member['member_id']} - {' '.join(n for n in names if n)}"
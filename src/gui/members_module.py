@@ -5,14 +5,151 @@ Members Module - Member management interface
 
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
-    QLineEdit, QTableWidget, QTableWidgetItem, QHeaderView,
+    QLineEdit, QTableView, QHeaderView, QMenu,
     QDialog, QFormLayout, QComboBox, QDateEdit, QMessageBox,
     QGroupBox, QTextEdit, QDialogButtonBox, QScrollArea
 )
-from PyQt6.QtCore import Qt, QDate
-from PyQt6.QtGui import QFont
+from PyQt6.QtCore import Qt, QDate, QAbstractTableModel, QModelIndex, pyqtSignal
+from PyQt6.QtGui import QFont, QColor
 from datetime import datetime
 
+from .async_query import AsyncQueryRunner
+
+
+class MembersTableModel(QAbstractTableModel):
+    """Members grid model - loads rows a page at a time as the view scrolls
+
+    Later pages are fetched in the background; only one is in flight at a
+    time, and the view cannot ask for more until it has arrived.
+    """
+    
+    COLUMNS = ["Member ID", "Name", "Gender", "Phone", "Station", "Date Joined", "Status"]
+    PAGE_SIZE = 200
+    
+    page_failed = pyqtSignal(str)   # error message
+    
+    def __init__(self, db, queries, parent=None):
+        super().__init__(parent)
+        self.db = db
+        self.queries = queries
+        self.rows = []
+        self.search_term = None
+        self.exhausted = True
+        self.fetching = False
+        self.font = QFont("Segoe UI", 10)
+        self.status_font = QFont("Segoe UI", 10, QFont.Weight.Bold)
+    
+    def reset_rows(self, rows, search_term=None):
+        """Replace the loaded rows with a fresh first page"""
+        self.cancel_fetch()
+        self.beginResetModel()
+        self.rows = list(rows)
+        self.search_term = search_term
+        self.exhausted = len(self.rows) < self.PAGE_SIZE
+        self.endResetModel()
+    
+    def member_at(self, row):
+        """Member dict for a row, or None"""
+        return self.rows[row] if 0 <= row < len(self.rows) else None
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.rows)
+    
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.COLUMNS)
+    
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and not self.exhausted and not self.fetching
+    
+    def fetchMore(self, parent=QModelIndex()):
+        """Load the next page in the background, seeking past the last loaded member ID"""
+        if not self.canFetchMore(parent):
+            return
+        
+        after = self.rows[-1]['member_id'] if self.rows else None
+        search_term = self.search_term
+        self.fetching = True
+        self.queries.submit(
+            lambda db: db.get_members_page(after, self.PAGE_SIZE, search_term),
+            self.on_page_loaded, self.on_page_failed, key='page'
+        )
+    
+    def cancel_fetch(self):
+        """Drop an in-flight page"""
+        if self.fetching:
+            self.queries.cancel_pending('page')
+            self.fetching = False
+    
+    def on_page_failed(self, message):
+        """Stop paging until the next refresh"""
+        self.fetching = False
+        self.exhausted = True
+        self.page_failed.emit(message)
+    
+    def on_page_loaded(self, page):
+        """Append a page fetched by fetchMore"""
+        self.fetching = False
+        self.exhausted = len(page) < self.PAGE_SIZE
+        
+        if page:
+            first = len(self.rows)
+            self.beginInsertRows(QModelIndex(), first, first + len(page) - 1)
+            self.rows.extend(page)
+            self.endInsertRows()
+    
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self.COLUMNS[section]
+        return None
+    
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        
+        member = self.rows[index.row()]
+        column = index.column()
+        
+        if role == Qt.ItemDataRole.DisplayRole:
+            if column == 0:
+                return member['member_id']
+            if column == 1:
+                full_name = f"{member['first_name']}"
+                if member['middle_name']:
+                    full_name += f" {member['middle_name']}"
+                full_name += f" {member['last_name']}"
+                return full_name
+            if column == 2:
+                return member['gender'] or ''
+            if column == 3:
+                return member['phone_number'] or ''
+            if column == 4:
+                return member['station_name'] or ''
+            if column == 5:
+                return member['date_joined']
+            if column == 6:
+                return self.member_status(member)
+        
+        elif role == Qt.ItemDataRole.FontRole:
+            return self.status_font if column == 6 else self.font
+        
+        elif column == 6 and role == Qt.ItemDataRole.ForegroundRole:
+            return QColor(Qt.GlobalColor.white)
+        
+        elif column == 6 and role == Qt.ItemDataRole.BackgroundRole:
+            status = self.member_status(member)
+            return QColor(Qt.GlobalColor.darkGray if status == "Inactive" else (Qt.GlobalColor.red if status == "Deceased" else Qt.GlobalColor.darkGreen))
+        
+        return None
+    
+    @staticmethod
+    def member_status(member):
+        """Status text for a member"""
+        if member['is_deceased']:
+            return "Deceased"
+        if member['is_active']:
+            return "Active"
+        return "Inactive"
+
 
 class MembersModule(QWidget):
     """Members management module"""
@@ -22,6 +159,8 @@ class MembersModule(QWidget):
         self.app = app
         self.db = app.db_manager
         self.current_user = app.current_user
+        self.queries = AsyncQueryRunner(self.db, self)
+        self.summary_before_load = ""
         self.setup_ui()
         self.refresh()
     
@@ -42,7 +181,11 @@ class MembersModule(QWidget):
         
         # Search
         self.search_input = QLineEdit()
-        self.search_input.setPlaceholderText("Search by ID or name...")
+        self.search_input.setPlaceholderText("Search by start of ID, name or phone...")
+        self.search_input.setToolTip(
+            "Matches the start of each word, e.g. \"NFC00\" or \"Ade\".\n"
+            "Type a Member ID from the beginning: \"0012\" will not find NFC0012."
+        )
         self.search_input.setFixedWidth(300)
         self.search_input.setMinimumHeight(40)  # Taller input
         self.search_input.textChanged.connect(self.search_members)
@@ -58,17 +201,15 @@ class MembersModule(QWidget):
         
         layout.addLayout(header_layout)
         
-        # Members table
-        self.table = QTableWidget()
-        self.table.setColumnCount(8)
-        self.table.setHorizontalHeaderLabels([
-            "Member ID", "Name", "Gender", "Phone", 
-            "Station", "Date Joined", "Status", "Actions"
-        ])
+        # Members table - rows come from the model page by page
+        self.model = MembersTableModel(self.db, self.queries, self)
+        self.model.page_failed.connect(self.on_load_failed)
+        self.table = QTableView()
+        self.table.setModel(self.model)
         
         # Table settings
-        self.table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
-        self.table.setSelectionMode(QTableWidget.SelectionMode.SingleSelection)
+        self.table.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
+        self.table.setSelectionMode(QTableView.SelectionMode.SingleSelection)
         self.table.setAlternatingRowColors(True)
         self.table.verticalHeader().setVisible(False)
         
@@ -76,10 +217,11 @@ class MembersModule(QWidget):
         self.table.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOn)
         self.table.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
         
-        # Set row height to be taller (readable) - increased for better button visibility
-        self.table.verticalHeader().setDefaultSectionSize(60)
+        # Fixed row height so the view never measures rows
+        self.table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        self.table.verticalHeader().setDefaultSectionSize(40)
         
-        # Column widths - FIXED: Give Actions column enough space
+        # Column widths
         self.table.setColumnWidth(0, 120)  # Member ID
         self.table.setColumnWidth(1, 250)  # Name
         self.table.setColumnWidth(2, 80)   # Gender
@@ -87,130 +229,121 @@ class MembersModule(QWidget):
         self.table.setColumnWidth(4, 180)  # Station
         self.table.setColumnWidth(5, 120)  # Date Joined
         self.table.setColumnWidth(6, 100)  # Status
-        self.table.setColumnWidth(7, 260)  # Actions - FIXED: Enough space for 3 buttons
         
-        # Don't stretch last column - use fixed width instead
-        self.table.horizontalHeader().setStretchLastSection(False)
+        self.table.horizontalHeader().setStretchLastSection(True)
         # Allow horizontal scrolling when needed
         self.table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
         
+        # Row actions - one context menu and double-click instead of per-row buttons
+        self.table.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
+        self.table.customContextMenuRequested.connect(self.show_context_menu)
+        self.table.doubleClicked.connect(lambda index: self.view_member(self.model.member_at(index.row())))
+        self.table.selectionModel().selectionChanged.connect(self.update_action_buttons)
+        
         layout.addWidget(self.table)
         
+        # Actions for the selected member
+        actions_layout = QHBoxLayout()
+        
+        self.view_btn = QPushButton("View")
+        self.edit_btn = QPushButton("Edit")
+        self.status_btn = QPushButton("Status")
+        for btn, handler in (
+            (self.view_btn, self.view_member),
+            (self.edit_btn, self.edit_member),
+            (self.status_btn, self.change_status)
+        ):
+            btn.setMinimumHeight(40)
+            btn.setMinimumWidth(100)
+            btn.setCursor(Qt.CursorShape.PointingHandCursor)
+            btn.setEnabled(False)
+            btn.clicked.connect(lambda checked, h=handler: self.with_selected_member(h))
+            actions_layout.addWidget(btn)
+        
         # Summary
         self.summary_label = QLabel()
         self.summary_label.setStyleSheet("color: #7F8C8D; font-size: 11pt; padding: 5px;")
         self.summary_label.setMinimumHeight(30)
-        layout.addWidget(self.summary_label)
+        actions_layout.addWidget(self.summary_label)
+        actions_layout.addStretch()
+        
+        layout.addLayout(actions_layout)
     
     def refresh(self):
-        """Refresh members list"""
-        members = self.db.get_all_members(active_only=False)  # Show ALL members
-        self.populate_table(members)
+        """Refresh members list (loaded in the background)"""
+        self.load_members()  # Show ALL members
     
-    def populate_table(self, members):
-        """Populate table with members"""
-        self.table.setRowCount(0)
-        
-        for member in members:
-            row = self.table.rowCount()
-            self.table.insertRow(row)
-            
-            # Member ID
-            id_item = QTableWidgetItem(member['member_id'])
-            id_item.setFont(QFont("Segoe UI", 10))
-            self.table.setItem(row, 0, id_item)
-            
-            # Full name
-            full_name = f"{member['first_name']}"
-            if member['middle_name']:
-                full_name += f" {member['middle_name']}"
-            full_name += f" {member['last_name']}"
-            name_item = QTableWidgetItem(full_name)
-            name_item.setFont(QFont("Segoe UI", 10))
-            self.table.setItem(row, 1, name_item)
-            
-            # Gender
-            gender_item = QTableWidgetItem(member['gender'] or '')
-            gender_item.setFont(QFont("Segoe UI", 10))
-            self.table.setItem(row, 2, gender_item)
-            
-            # Phone
-            phone_item = QTableWidgetItem(member['phone_number'] or '')
-            phone_item.setFont(QFont("Segoe UI", 10))
-            self.table.setItem(row, 3, phone_item)
-            
-            # Station
-            station = self.db.fetchone(
-                "SELECT station_name FROM stations WHERE station_id = ?",
-                (member['station_id'],)
+    def load_members(self, search_term=None):
+        """Load the first page and status counts in the background"""
+        if not self.queries.is_pending():
+            self.summary_before_load = self.summary_label.text()
+        self.table.setEnabled(False)
+        self.summary_label.setText("⏳ Loading members...")
+        
+        def load(db):
+            return (
+                db.get_members_page(limit=MembersTableModel.PAGE_SIZE, search_term=search_term),
+                db.get_member_status_counts(search_term),
+                search_term
             )
-            station_item = QTableWidgetItem(station['station_name'] if station else '')
-            station_item.setFont(QFont("Segoe UI", 10))
-            self.table.setItem(row, 4, station_item)
-            
-            # Date joined
-            date_item = QTableWidgetItem(member['date_joined'])
-            date_item.setFont(QFont("Segoe UI", 10))
-            self.table.setItem(row, 5, date_item)
-            
-            # Status - FIXED to show actual status
-            if member['is_deceased']:
-                status = "Deceased"
-                color = "#E74C3C"  # Red
-            elif member['is_active']:
-                status = "Active"
-                color = "#27AE60"  # Green
-            else:
-                status = "Inactive"
-                color = "#F39C12"  # Orange
-            
-            status_item = QTableWidgetItem(status)
-            status_item.setFont(QFont("Segoe UI", 10, QFont.Weight.Bold))
-            status_item.setForeground(Qt.GlobalColor.white)
-            status_item.setBackground(Qt.GlobalColor.darkGray if status == "Inactive" else (Qt.GlobalColor.red if status == "Deceased" else Qt.GlobalColor.darkGreen))
-            self.table.setItem(row, 6, status_item)
-            
-            # Actions - Properly sized buttons with vertical centering
-            actions_widget = QWidget()
-            actions_layout = QHBoxLayout(actions_widget)
-            actions_layout.setContentsMargins(5, 5, 5, 5)
-            actions_layout.setSpacing(5)
-            actions_layout.setAlignment(Qt.AlignmentFlag.AlignVCenter)
-            
-            view_btn = QPushButton("View")
-            view_btn.setMinimumHeight(40)
-            view_btn.setMinimumWidth(65)
-            view_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-            view_btn.clicked.connect(lambda checked, m=member: self.view_member(m))
-            actions_layout.addWidget(view_btn)
-            
-            edit_btn = QPushButton("Edit")
-            edit_btn.setMinimumHeight(40)
-            edit_btn.setMinimumWidth(65)
-            edit_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-            edit_btn.clicked.connect(lambda checked, m=member: self.edit_member(m))
-            actions_layout.addWidget(edit_btn)
-            
-            status_btn = QPushButton("Status")
-            status_btn.setMinimumHeight(40)
-            status_btn.setMinimumWidth(65)
-            status_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-            status_btn.clicked.connect(lambda checked, m=member: self.change_status(m))
-            actions_layout.addWidget(status_btn)
-            
-            actions_layout.addStretch()
-            self.table.setCellWidget(row, 7, actions_widget)
         
-        # Update summary
-        total = len(members)
-        active = sum(1 for m in members if m['is_active'])
-        inactive = sum(1 for m in members if not m['is_active'] and not m['is_deceased'])
-        deceased = sum(1 for m in members if m['is_deceased'])
+        self.queries.submit(load, self.on_members_loaded, self.on_load_failed)
+    
+    def cancel_pending(self):
+        """Drop an in-flight refresh, search or page when the user leaves the module"""
+        self.model.cancel_fetch()
+        if self.queries.is_pending():
+            self.queries.cancel_pending()
+            self.table.setEnabled(True)
+            self.summary_label.setText(self.summary_before_load)
+    
+    def on_members_loaded(self, result):
+        """Show the first page of loaded members"""
+        page, counts, search_term = result
+        self.table.setEnabled(True)
+        self.model.reset_rows(page, search_term)
+        self.update_action_buttons()
         
         self.summary_label.setText(
-            f"Total Members: {total} | Active: {active} | Inactive: {inactive} | Deceased: {deceased}"
+            f"Total Members: {counts['total']} | Active: {counts['active']} | "
+            f"Inactive: {counts['inactive']} | Deceased: {counts['deceased']}"
         )
     
+    def on_load_failed(self, message):
+        """Report a failed refresh"""
+        self.table.setEnabled(True)
+        self.summary_label.setText(f"Failed to load members: {message}")
+    
+    def selected_member(self):
+        """Member dict of the selected row, or None"""
+        rows = self.table.selectionModel().selectedRows()
+        return self.model.member_at(rows[0].row()) if rows else None
+    
+    def with_selected_member(self, handler):
+        """Run a row action on the selected member"""
+        member = self.selected_member()
+        if member:
+            handler(member)
+    
+    def update_action_buttons(self):
+        """Enable row actions only while a member is selected"""
+        has_selection = self.selected_member() is not None
+        for btn in (self.view_btn, self.edit_btn, self.status_btn):
+            btn.setEnabled(has_selection)
+    
+    def show_context_menu(self, pos):
+        """Row actions for the member under the cursor"""
+        index = self.table.indexAt(pos)
+        member = self.model.member_at(index.row()) if index.isValid() else None
+        if not member:
+            return
+        
+        menu = QMenu(self)
+        menu.addAction("👁️ View", lambda: self.view_member(member))
+        menu.addAction("✏️ Edit", lambda: self.edit_member(member))
+        menu.addAction("🔄 Change Status", lambda: self.change_status(member))
+        menu.exec(self.table.viewport().mapToGlobal(pos))
+    
     def search_members(self):
         """Search members"""
         search_term = self.search_input.text().strip()
@@ -219,8 +352,7 @@ class MembersModule(QWidget):
             self.refresh()
             return
         
-        members = self.db.search_members(search_term)
-        self.populate_table(members)
+        self.load_members(search_term)
     
     def add_member(self):
         """Show add member dialog"""
@@ -279,30 +411,41 @@ class MembersModule(QWidget):
                 status_data = dialog.get_status_data()
                 
                 # Update member status in database
-                self.db.execute(
-                    """
-                    UPDATE members 
-                    SET is_active = ?, 
-                        is_deceased = ?, 
-                        deceased_date = ?,
-                        modified_date = datetime('now'),
-                        modified_by = ?
-                    WHERE member_id = ?
-                    """,
-                    (
+                with self.db.transaction():
+                    self.db.set_member_status(
+                        member['member_id'],
                         status_data['is_active'],
                         status_data['is_deceased'],
                         status_data['deceased_date'],
-                        self.current_user['username'],
-                        member['member_id']
+                        self.current_user['username']
                     )
-                )
+                    
+                    # Levy the other members in the same transaction as the status change
+                    benefit = None
+                    if (status_data['is_deceased'] and not member['is_deceased']
+                            and self.db.get_setting('death_benefit_enabled') == '1'):
+                        benefit = self.db.process_death_benefit(
+                            member['member_id'],
+                            self.current_user['username']
+                        )
                 
                 status_name = "Deceased" if status_data['is_deceased'] else ("Active" if status_data['is_active'] else "Inactive")
+                message = f"Member status changed to: {status_name}"
+                if benefit:
+                    message += (
+                        f"\n\nDeath benefit of ₦{benefit['total_benefit_amount']:,.2f} raised from "
+                        f"{benefit['members_charged']:,} members "
+                        f"(₦{benefit['per_member_charge']:,.2f} each)"
+                    )
+                    if benefit['members_skipped']:
+                        message += (
+                            f"\n{benefit['members_skipped']:,} members could not be charged "
+                            f"(no premium savings to cover the levy)"
+                        )
                 QMessageBox.information(
                     self,
                     "Success",
-                    f"Member status changed to: {status_name}"
+                    message
                 )
                 self.refresh()
             
@@ -6,17 +6,57 @@ Reports Module - Generate various reports
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
     QGroupBox, QGridLayout, QDateEdit, QMessageBox, QLineEdit,
-    QInputDialog, QFileDialog
+    QInputDialog, QFileDialog, QProgressDialog
 )
-from PyQt6.QtCore import Qt, QDate, QUrl
+from PyQt6.QtCore import Qt, QDate, QUrl, QObject, QRunnable, QThreadPool, pyqtSignal
 from PyQt6.QtGui import QFont, QDesktopServices
 from datetime import datetime
 import os
 import sys
+import threading
+import traceback
 
 # Import report generator
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 from reports.report_generator import ReportGenerator
+from .async_query import AsyncQueryRunner
+
+
+class StatementBatchSignals(QObject):
+    """Signals emitted by a StatementBatchWorker"""
+    
+    progress = pyqtSignal(int, int)    # done, total
+    finished = pyqtSignal(object)      # result dict from generate_member_statements_pdf
+    failed = pyqtSignal(str)
+
+
+class StatementBatchWorker(QRunnable):
+    """Generates all member statements off the GUI thread"""
+    
+    def __init__(self, db, start_date, end_date, merge):
+        super().__init__()
+        self.db = db
+        self.start_date = start_date
+        self.end_date = end_date
+        self.merge = merge
+        self.signals = StatementBatchSignals()
+        self.cancel_event = threading.Event()
+    
+    def run(self):
+        """Fetch on a pooled reader, render in worker processes"""
+        try:
+            with self.db.reader() as reader:
+                result = ReportGenerator(reader).generate_member_statements_pdf(
+                    self.start_date, self.end_date,
+                    merge=self.merge,
+                    progress=self.signals.progress.emit,
+                    cancelled=self.cancel_event.is_set
+                )
+        except Exception as e:
+            traceback.print_exc()
+            self.signals.failed.emit(str(e))
+        else:
+            self.signals.finished.emit(result)
 
 
 class ReportsModule(QWidget):
@@ -27,6 +67,8 @@ class ReportsModule(QWidget):
         self.app = app
         self.db = app.db_manager
         self.report_gen = ReportGenerator(self.db)
+        self.queries = AsyncQueryRunner(self.db, self)
+        self.statement_worker = None
         self.setup_ui()
     
     def setup_ui(self):
@@ -119,6 +161,8 @@ class ReportsModule(QWidget):
             btn.setCursor(Qt.CursorShape.PointingHandCursor)
             btn.clicked.connect(handler)
             loan_layout.addWidget(btn, i // 2, i % 2)
+            if handler == self.generate_loan_portfolio:
+                self.loan_portfolio_btn = btn
         
         loan_group.setLayout(loan_layout)
         layout.addWidget(loan_group)
@@ -245,11 +289,7 @@ class ReportsModule(QWidget):
                 # Open the PDF
                 QDesktopServices.openUrl(QUrl.fromLocalFile(filepath))
             else:
-                QMessageBox.information(
-                    self,
-                    "All Members",
-                    "Generating statements for all members...\nThis may take a few minutes."
-                )
+                self.generate_all_member_statements(start_date, end_date)
         
         except Exception as e:
             QMessageBox.critical(
@@ -258,6 +298,81 @@ class ReportsModule(QWidget):
                 f"Failed to generate report:\n{str(e)}"
             )
     
+    def generate_all_member_statements(self, start_date, end_date):
+        """Generate every active member's statement in the background"""
+        answer = QMessageBox.question(
+            self,
+            "All Members",
+            "Generate statements for all active members.\n\n"
+            "Also combine them into one printable PDF?",
+            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No |
+            QMessageBox.StandardButton.Cancel
+        )
+        if answer == QMessageBox.StandardButton.Cancel:
+            return
+        
+        self.statement_progress = QProgressDialog("Preparing member statements...", "Cancel", 0, 0, self)
+        self.statement_progress.setWindowTitle("Member Statements")
+        self.statement_progress.setWindowModality(Qt.WindowModality.WindowModal)
+        self.statement_progress.setMinimumDuration(0)
+        
+        self.statement_worker = StatementBatchWorker(
+            self.db, start_date, end_date, answer == QMessageBox.StandardButton.Yes
+        )
+        self.statement_worker.signals.progress.connect(self.on_statement_progress)
+        self.statement_worker.signals.finished.connect(self.on_statements_ready)
+        self.statement_worker.signals.failed.connect(self.on_statements_failed)
+        self.statement_progress.canceled.connect(self.statement_worker.cancel_event.set)
+        
+        QThreadPool.globalInstance().start(self.statement_worker)
+    
+    def on_statement_progress(self, done, total):
+        """Update the progress dialog"""
+        if self.statement_worker.cancel_event.is_set():
+            return
+        self.statement_progress.setMaximum(total)
+        self.statement_progress.setValue(done)
+        self.statement_progress.setLabelText(f"Generating member statements... {done:,} of {total:,}")
+    
+    def on_statements_ready(self, result):
+        """Announce finished (or cancelled) batch statements"""
+        self.statement_worker = None
+        self.statement_progress.canceled.disconnect()
+        self.statement_progress.close()
+        
+        count = len(result['files'])
+        if result['cancelled']:
+            QMessageBox.information(
+                self,
+                "Cancelled",
+                f"Statement generation was cancelled after {count:,} statements.\n\n"
+                f"Saved to: {result['folder']}"
+            )
+            return
+        
+        QMessageBox.information(
+            self,
+            "Success",
+            f"{count:,} member statements generated successfully!\n\n"
+            f"Saved to: {result['folder']}"
+            + (f"\n\nCombined PDF: {result['merged']}" if result['merged'] else "")
+        )
+        
+        # Open the combined PDF, or the folder of statements
+        QDesktopServices.openUrl(QUrl.fromLocalFile(result['merged'] or result['folder']))
+    
+    def on_statements_failed(self, message):
+        """Report a failed statement batch"""
+        self.statement_worker = None
+        self.statement_progress.canceled.disconnect()
+        self.statement_progress.close()
+        
+        QMessageBox.critical(
+            self,
+            "Error",
+            f"Failed to generate member statements:\n{message}"
+        )
+    
     def generate_accounts_ledger(self):
         """Generate accounts ledger"""
         QMessageBox.information(
@@ -312,31 +427,58 @@ class ReportsModule(QWidget):
         )
     
     def generate_loan_portfolio(self):
-        """Generate loan portfolio report"""
-        try:
-            filepath = self.report_gen.generate_loan_portfolio_excel()
-            
-            QMessageBox.information(
-                self,
-                "Success",
-                f"Loan Portfolio Analysis generated successfully!\n\n"
-                f"Excel file saved to: {filepath}\n\n"
-                "This report includes:\n"
-                "- Portfolio summary\n"
-                "- Detailed loan list\n"
-                "- Performance metrics\n\n"
-                "Opening file..."
-            )
-            
-            # Open the Excel file
-            QDesktopServices.openUrl(QUrl.fromLocalFile(filepath))
+        """Generate loan portfolio report (built in the background)"""
+        self.loan_portfolio_btn.setEnabled(False)
+        self.loan_portfolio_btn.setText("⏳ Generating Loan Portfolio...")
         
-        except Exception as e:
-            QMessageBox.critical(
-                self,
-                "Error",
-                f"Failed to generate loan portfolio:\n{str(e)}"
-            )
+        self.queries.submit(
+            lambda db: ReportGenerator(db).generate_loan_portfolio_excel(),
+            self.on_loan_portfolio_ready,
+            self.on_loan_portfolio_failed,
+            key='loan_portfolio'
+        )
+    
+    def cancel_pending(self):
+        """Stop background reports when the user leaves the module"""
+        if self.queries.is_pending('loan_portfolio'):
+            self.queries.cancel_pending('loan_portfolio')
+            self.loan_portfolio_btn.setEnabled(True)
+            self.loan_portfolio_btn.setText("📉 Loan Portfolio")
+        
+        # The batch skips statements not yet started and reports what it saved
+        if self.statement_worker is not None:
+            self.statement_worker.cancel_event.set()
+    
+    def on_loan_portfolio_ready(self, filepath):
+        """Announce and open a finished loan portfolio report"""
+        self.loan_portfolio_btn.setEnabled(True)
+        self.loan_portfolio_btn.setText("📉 Loan Portfolio")
+        
+        QMessageBox.information(
+            self,
+            "Success",
+            f"Loan Portfolio Analysis generated successfully!\n\n"
+            f"Excel file saved to: {filepath}\n\n"
+            "This report includes:\n"
+            "- Portfolio summary\n"
+            "- Detailed loan list\n"
+            "- Performance metrics\n\n"
+            "Opening file..."
+        )
+        
+        # Open the Excel file
+        QDesktopServices.openUrl(QUrl.fromLocalFile(filepath))
+    
+    def on_loan_portfolio_failed(self, message):
+        """Report a failed loan portfolio generation"""
+        self.loan_portfolio_btn.setEnabled(True)
+        self.loan_portfolio_btn.setText("📉 Loan Portfolio")
+        
+        QMessageBox.critical(
+            self,
+            "Error",
+            f"Failed to generate loan portfolio:\n{message}"
+        )
     
     def generate_audit_report(self):
         """Generate audit report"""
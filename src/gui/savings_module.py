@@ -5,7 +5,7 @@ Savings Module - Complete savings account management
 
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
-    QTableWidget, QTableWidgetItem, QLineEdit, QMessageBox,
+    QTableWidget, QTableWidgetItem, QMessageBox,
     QDialog, QFormLayout, QComboBox, QDoubleSpinBox, QDateEdit,
     QDialogButtonBox, QGroupBox, QTextEdit, QHeaderView
 )
@@ -13,6 +13,8 @@ from PyQt6.QtCore import Qt, QDate
 from PyQt6.QtGui import QFont
 from datetime import datetime
 
+from .member_search import MemberSearchBox
+
 
 class SavingsModule(QWidget):
     """Complete savings management module"""
@@ -46,19 +48,21 @@ class SavingsModule(QWidget):
         self.withdraw_btn.clicked.connect(self.withdraw)
         header_layout.addWidget(self.withdraw_btn)
         
+        interest_btn = QPushButton("% Post Interest")
+        interest_btn.clicked.connect(self.post_interest)
+        header_layout.addWidget(interest_btn)
+        
         layout.addLayout(header_layout)
         
         # Search
         search_layout = QHBoxLayout()
-        self.search_input = QLineEdit()
-        self.search_input.setPlaceholderText("Search by Member ID, Name, or Partial Name (use + or & for multiple)")
-        self.search_input.setMinimumHeight(35)  # Taller for better usability
-        self.search_input.returnPressed.connect(self.search)
-        search_layout.addWidget(self.search_input)
+        self.member_search = MemberSearchBox(self.db, self)
+        self.member_search.member_selected.connect(self.select_member)
+        search_layout.addWidget(self.member_search)
         
         search_btn = QPushButton("Search")
         search_btn.setMinimumHeight(35)
-        search_btn.clicked.connect(self.search)
+        search_btn.clicked.connect(self.member_search.select_best_match)
         search_layout.addWidget(search_btn)
         
         layout.addLayout(search_layout)
@@ -100,94 +104,14 @@ class SavingsModule(QWidget):
     
     def refresh(self):
         if self.current_member:
-            self.search()
+            self.select_member(self.current_member)
     
-    def search(self):
-        search_text = self.search_input.text().strip()
-        if not search_text:
-            QMessageBox.warning(self, "Search", "Please enter a Member ID or Name")
-            return
-        
-        # Check if searching by multiple terms (using + or &)
-        search_terms = []
-        if '+' in search_text or '&' in search_text:
-            # Split by both + and &
-            import re
-            search_terms = [term.strip() for term in re.split('[+&]', search_text) if term.strip()]
-        else:
-            search_terms = [search_text]
-        
-        # Try to find member(s) matching the search
-        member = None
-        
-        # First, try direct member ID match
-        if len(search_terms) == 1:
-            potential_id = search_terms[0].upper()
-            member = self.db.get_member(potential_id)
-        
-        # If not found by ID, search by name
-        if not member:
-            # Build SQL query for name search
-            query_parts = []
-            params = []
-            
-            for term in search_terms:
-                term_lower = term.lower()
-                # Search in first name, middle name, or last name
-                query_parts.append("""
-                    (LOWER(first_name) LIKE ? OR 
-                     LOWER(middle_name) LIKE ? OR 
-                     LOWER(last_name) LIKE ?)
-                """)
-                params.extend([f'%{term_lower}%', f'%{term_lower}%', f'%{term_lower}%'])
-            
-            # Join with AND if multiple terms (all must match)
-            where_clause = ' AND '.join(query_parts)
-            
-            sql = f"""
-                SELECT member_id, first_name, middle_name, last_name
-                FROM members
-                WHERE {where_clause}
-                LIMIT 10
-            """
-            
-            results = self.db.fetchall(sql, tuple(params))
-            
-            if not results:
-                QMessageBox.warning(
-                    self, 
-                    "Not Found", 
-                    f"No member found matching: {search_text}"
-                )
-                return
-            elif len(results) == 1:
-                # Found exactly one match
-                member = self.db.get_member(results[0]['member_id'])
-            else:
-                # Multiple matches - let user choose
-                from PyQt6.QtWidgets import QInputDialog
-                names = [
-                    f"{r['member_id']}: {r['first_name']} {r.get('middle_name', '')} {r['last_name']}".replace('  ', ' ')
-                    for r in results
-                ]
-                choice, ok = QInputDialog.getItem(
-                    self,
-                    "Multiple Matches",
-                    "Select member:",
-                    names,
-                    0,
-                    False
-                )
-                if ok and choice:
-                    selected_id = choice.split(':')[0]
-                    member = self.db.get_member(selected_id)
-                else:
-                    return
-        
-        if not member:
-            QMessageBox.warning(self, "Not Found", f"Member not found: {search_text}")
-            return
-        
+    def cancel_pending(self):
+        """Drop pending member suggestions when the user leaves the module"""
+        self.member_search.cancel_pending()
+    
+    def select_member(self, member):
+        """Show the savings accounts of the member picked in the search box"""
         member_id = member['member_id']
         self.current_member = member
         accounts = self.db.get_member_savings_accounts(member_id)
@@ -233,4 +157,142 @@ class SavingsModule(QWidget):
         QMessageBox.information(self, "Deposit", "Deposit functionality - Coming soon!")
     
     def withdraw(self):
-        QMessageBox.information(self, "Withdraw", "Withdrawal functionality - Coming soon!")
\ No newline at end of file
+        QMessageBox.information(self, "Withdraw", "Withdrawal functionality - Coming soon!")
+    
+    def post_interest(self):
+        """Preview and post a month's savings interest"""
+        dialog = InterestPostingDialog(self.db, self)
+        if dialog.exec() == QDialog.DialogCode.Accepted:
+            try:
+                result = self.db.post_monthly_interest(
+                    dialog.get_period(),
+                    self.current_user['username']
+                )
+                
+                QMessageBox.information(
+                    self,
+                    "Success",
+                    f"Interest for {result['period']} posted successfully!\n"
+                    f"Accounts credited: {result['accounts']:,}\n"
+                    f"Total interest: ₦{result['total_interest']:,.2f}"
+                )
+                
+                self.refresh()
+            
+            except Exception as e:
+                QMessageBox.critical(
+                    self,
+                    "Error",
+                    f"Failed to post interest:\n{str(e)}"
+                )
+
+
+class InterestPostingDialog(QDialog):
+    """Monthly savings interest posting dialog"""
+    
+    def __init__(self, db, parent=None):
+        super().__init__(parent)
+        self.db = db
+        self.preview = None
+        
+        self.setWindowTitle("Post Savings Interest")
+        self.setMinimumWidth(500)
+        self.setup_ui()
+    
+    def setup_ui(self):
+        layout = QVBoxLayout(self)
+        
+        form_layout = QFormLayout()
+        
+        # Period - defaults to the only month that can be posted next
+        self.period_input = QDateEdit()
+        self.period_input.setDisplayFormat("MMMM yyyy")
+        self.period_input.setCalendarPopup(True)
+        self.period_input.setDate(
+            QDate.fromString(self.db.get_next_interest_period() + '-01', 'yyyy-MM-dd')
+        )
+        self.period_input.dateChanged.connect(self.update_preview)
+        form_layout.addRow("Period:*", self.period_input)
+        
+        # Preview
+        self.preview_label = QLabel()
+        self.preview_label.setStyleSheet("""
+            QLabel {
+                background-color: #2D2D32;
+                border: 1px solid #3D3D42;
+                border-radius: 4px;
+                padding: 10px;
+            }
+        """)
+        form_layout.addRow("", self.preview_label)
+        
+        layout.addLayout(form_layout)
+        
+        # Buttons
+        self.button_box = QDialogButtonBox(
+            QDialogButtonBox.StandardButton.Ok | 
+            QDialogButtonBox.StandardButton.Cancel
+        )
+        self.button_box.button(QDialogButtonBox.StandardButton.Ok).setText("Post")
+        self.button_box.accepted.connect(self.confirm)
+        self.button_box.rejected.connect(self.reject)
+        layout.addWidget(self.button_box)
+        
+        # Initial update
+        self.update_preview()
+    
+    def get_period(self):
+        """Selected period as 'YYYY-MM'"""
+        return self.period_input.date().toString('yyyy-MM')
+    
+    def update_preview(self):
+        """Show what posting the selected period would credit"""
+        post_btn = self.button_box.button(QDialogButtonBox.StandardButton.Ok)
+        period = self.get_period()
+        
+        posting = self.db.get_interest_posting(period)
+        if posting:
+            self.preview = None
+            post_btn.setEnabled(False)
+            self.preview_label.setText(
+                f"<b>Already posted</b> on {posting['posted_date']} by {posting['created_by']}<br>"
+                f"<b>Accounts:</b> {posting['accounts']:,}<br>"
+                f"<b>Total Interest:</b> ₦{posting['total_interest']:,.2f}"
+            )
+            return
+        
+        try:
+            self.preview = self.db.post_monthly_interest(period, None, dry_run=True)
+        except ValueError as e:
+            self.preview = None
+            post_btn.setEnabled(False)
+            self.preview_label.setText(str(e))
+            return
+        
+        by_type = "".join(
+            f"<br>&nbsp;&nbsp;{row['type_name']}: {row['accounts']:,} accounts, "
+            f"₦{row['interest']:,.2f}"
+            for row in self.preview['by_type']
+        )
+        post_btn.setEnabled(self.preview['accounts'] > 0)
+        self.preview_label.setText(
+            f"<b>Posting Date:</b> {self.preview['posting_date']}<br>"
+            f"<b>Accounts:</b> {self.preview['accounts']:,}<br>"
+            f"<b>Members:</b> {self.preview['members']:,}<br>"
+            f"<b>Total Interest:</b> ₦{self.preview['total_interest']:,.2f}"
+            f"{by_type}"
+        )
+    
+    def confirm(self):
+        """Ask once more before crediting the accounts"""
+        if not self.preview:
+            return
+        reply = QMessageBox.question(
+            self,
+            "Confirm Posting",
+            f"Credit ₦{self.preview['total_interest']:,.2f} interest to "
+            f"{self.preview['accounts']:,} accounts for {self.preview['period']}?",
+            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
+        )
+        if reply == QMessageBox.StandardButton.Yes:
+            self.accept()
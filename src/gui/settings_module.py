@@ -3,14 +3,18 @@ Settings Module - System configuration
 ======================================
 """
 
+import os
+
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
     QGroupBox, QFormLayout, QLineEdit, QDoubleSpinBox, QCheckBox,
-    QMessageBox, QSpinBox
+    QMessageBox, QSpinBox, QTableWidget, QTableWidgetItem, QHeaderView
 )
 from PyQt6.QtGui import QFont, QCursor
 from PyQt6.QtCore import Qt
 
+from database import profiler
+
 
 class SettingsModule(QWidget):
     """System settings module"""
@@ -19,8 +23,10 @@ class SettingsModule(QWidget):
         super().__init__(parent)
         self.app = app
         self.db = app.db_manager
+        self.profiles = []
         self.setup_ui()
         self.load_settings()
+        self.load_profile()
     
     def setup_ui(self):
         """Setup UI"""
@@ -82,6 +88,18 @@ class SettingsModule(QWidget):
         death_group.setLayout(death_layout)
         layout.addWidget(death_group)
         
+        # Loan Arrears
+        arrears_group = QGroupBox("Loan Arrears Settings")
+        arrears_layout = QFormLayout()
+        
+        self.default_days_input = QSpinBox()
+        self.default_days_input.setRange(1, 3650)
+        self.default_days_input.setSuffix(" days")
+        arrears_layout.addRow("Mark defaulted after:", self.default_days_input)
+        
+        arrears_group.setLayout(arrears_layout)
+        layout.addWidget(arrears_group)
+        
         # Withdrawal Benefits
         withdrawal_group = QGroupBox("Withdrawal Benefit Settings")
         withdrawal_layout = QFormLayout()
@@ -116,11 +134,76 @@ class SettingsModule(QWidget):
         id_group.setLayout(id_layout)
         layout.addWidget(id_group)
         
+        # Query Profiler (diagnostics, not saved with the settings)
+        profiler_group = QGroupBox("Query Profiler")
+        profiler_layout = QVBoxLayout()
+        
+        profiler_controls = QHBoxLayout()
+        self.profiler_check = QCheckBox("Profile database queries")
+        self.profiler_check.toggled.connect(self.toggle_profiler)
+        profiler_controls.addWidget(self.profiler_check)
+        
+        profiler_controls.addWidget(QLabel("Log queries slower than:"))
+        self.slow_ms_input = QSpinBox()
+        self.slow_ms_input.setRange(1, 60000)
+        self.slow_ms_input.setValue(100)
+        self.slow_ms_input.setSuffix(" ms")
+        self.slow_ms_input.valueChanged.connect(self.update_slow_threshold)
+        profiler_controls.addWidget(self.slow_ms_input)
+        profiler_controls.addStretch()
+        
+        for label, handler in [
+            ("🔄 Refresh", self.load_profile),
+            ("Show Plan", self.show_query_plan),
+            ("Reset", self.reset_profile),
+        ]:
+            btn = QPushButton(label)
+            btn.clicked.connect(handler)
+            profiler_controls.addWidget(btn)
+        profiler_layout.addLayout(profiler_controls)
+        
+        self.profile_table = QTableWidget()
+        self.profile_table.setColumnCount(7)
+        self.profile_table.setHorizontalHeaderLabels([
+            "Calls", "Total (ms)", "Mean (ms)", "p95 (ms)", "Max (ms)", "Slow", "SQL"
+        ])
+        self.profile_table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        self.profile_table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
+        self.profile_table.horizontalHeader().setSectionResizeMode(6, QHeaderView.ResizeMode.Stretch)
+        self.profile_table.setMinimumHeight(180)
+        profiler_layout.addWidget(self.profile_table)
+        
+        self.profile_log_label = QLabel()
+        self.profile_log_label.setStyleSheet("color: #7F8C8D;")
+        profiler_layout.addWidget(self.profile_log_label)
+        
+        profiler_group.setLayout(profiler_layout)
+        layout.addWidget(profiler_group)
+        
+        # Database Maintenance
+        maintenance_group = QGroupBox("Database Maintenance")
+        maintenance_layout = QHBoxLayout()
+        
+        maintenance_layout.addWidget(QLabel(
+            "Rebuild the member search index if searches miss members that exist "
+            "(e.g. after restoring or compacting the database)."
+        ))
+        maintenance_layout.addStretch()
+        
+        rebuild_btn = QPushButton("Rebuild Member Search Index")
+        rebuild_btn.setCursor(Qt.CursorShape.PointingHandCursor)
+        rebuild_btn.clicked.connect(self.rebuild_member_search_index)
+        maintenance_layout.addWidget(rebuild_btn)
+        
+        maintenance_group.setLayout(maintenance_layout)
+        layout.addWidget(maintenance_group)
+        
         layout.addStretch()
     
     def refresh(self):
         """Refresh settings"""
         self.load_settings()
+        self.load_profile()
     
     def load_settings(self):
         """Load settings from database"""
@@ -142,6 +225,10 @@ class SettingsModule(QWidget):
         self.death_enabled_check.setChecked(death_enabled == '1')
         self.death_amount_input.setValue(float(death_amount or 0))
         
+        # Loan arrears
+        default_days = self.db.get_setting('loan_default_days')
+        self.default_days_input.setValue(int(default_days or 90))
+        
         # Withdrawal
         retirement_pct = self.db.get_setting('retirement_benefit_percentage')
         non_retirement_pct = self.db.get_setting('non_retirement_charge_percentage')
@@ -184,6 +271,13 @@ class SettingsModule(QWidget):
                 username
             )
             
+            # Loan arrears
+            self.db.update_setting(
+                'loan_default_days',
+                str(self.default_days_input.value()),
+                username
+            )
+            
             # Withdrawal
             self.db.update_setting(
                 'retirement_benefit_percentage',
@@ -220,3 +314,89 @@ class SettingsModule(QWidget):
                 "Error",
                 f"Failed to save settings:\n{str(e)}"
             )
+    
+    # ========================================================================
+    # QUERY PROFILER
+    # ========================================================================
+    
+    def slow_log_path(self):
+        """Rotating slow-query log, kept next to the database"""
+        return os.path.join(os.path.dirname(os.path.abspath(self.db.db_path)),
+                            'logs', 'slow_queries.log')
+    
+    def toggle_profiler(self, enabled):
+        """Start or stop collecting query timings"""
+        if enabled:
+            profiler.enable(self.slow_ms_input.value(), self.slow_log_path())
+        else:
+            profiler.disable()
+        self.load_profile()
+    
+    def update_slow_threshold(self, value):
+        """Apply a new slow-query threshold"""
+        if profiler.current is not None:
+            profiler.current.slow_ms = value
+    
+    def reset_profile(self):
+        """Clear collected timings"""
+        if profiler.current is not None:
+            profiler.current.reset()
+        self.load_profile()
+    
+    def load_profile(self):
+        """Show the statements with the most total time"""
+        active = profiler.current
+        self.profiler_check.blockSignals(True)
+        self.profiler_check.setChecked(active is not None)
+        self.profiler_check.blockSignals(False)
+        
+        self.profiles = active.top(50) if active else []
+        self.profile_table.setRowCount(len(self.profiles))
+        for row, p in enumerate(self.profiles):
+            values = [f"{p.calls:,}", f"{p.total_ms:,.1f}", f"{p.mean_ms:.2f}",
+                      f"{p.percentile_ms(95):,.0f}", f"{p.max_ms:,.1f}", f"{p.slow_calls:,}"]
+            for col, value in enumerate(values):
+                item = QTableWidgetItem(value)
+                item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
+                self.profile_table.setItem(row, col, item)
+            sql_item = QTableWidgetItem(p.sql)
+            sql_item.setToolTip(p.sql)
+            self.profile_table.setItem(row, 6, sql_item)
+        
+        if active:
+            self.profile_log_label.setText(f"Slow queries are logged to {active.log_path}")
+        else:
+            self.profile_log_label.setText("Profiling is off.")
+    
+    def show_query_plan(self):
+        """Show the captured plan for the selected statement"""
+        row = self.profile_table.currentRow()
+        if row < 0 or row >= len(self.profiles):
+            QMessageBox.information(self, "Query Plan", "Select a query first.")
+            return
+        
+        p = self.profiles[row]
+        plan = p.plan or "No plan captured - plans are recorded the first time a query is slow."
+        QMessageBox.information(self, "Query Plan", f"{p.sql}\n\n{plan}")
+    
+    # ========================================================================
+    # DATABASE MAINTENANCE
+    # ========================================================================
+    
+    def rebuild_member_search_index(self):
+        """Rebuild members_fts from the members table"""
+        try:
+            self.db.rebuild_member_search_index()
+            
+            QMessageBox.information(
+                self,
+                "Success",
+                "Member search index rebuilt."
+            )
+        
+        except Exception as e:
+            QMessageBox.critical(
+                self,
+                "Error",
+                f"Failed to rebuild the member search index:\n{str(e)}"
+            )
@@ -13,6 +13,8 @@ from PyQt6.QtCore import Qt
 from PyQt6.QtGui import QFont
 from datetime import datetime
 
+from .async_query import AsyncQueryRunner
+
 
 class StationsModule(QWidget):
     """Stations overview and management module"""
@@ -22,6 +24,10 @@ class StationsModule(QWidget):
         self.app = app
         self.db = app.db_manager
         self.current_user = app.current_user
+        self.queries = AsyncQueryRunner(self.db, self)
+        self.summary_before_load = ""
+        # Per-station statistics from the last refresh, keyed by station_id
+        self.station_stats = {}
         self.setup_ui()
         self.refresh()
     
@@ -102,6 +108,9 @@ class StationsModule(QWidget):
         self.table.setColumnWidth(8, 120)   # Total Loans - shows total amount owed
         self.table.setColumnWidth(9, 200)   # Actions - enough space for two buttons
         
+        # Double-click a station for its details
+        self.table.cellDoubleClicked.connect(self.on_row_double_clicked)
+        
         layout.addWidget(self.table)
         
         # Summary
@@ -111,16 +120,51 @@ class StationsModule(QWidget):
         layout.addWidget(self.summary_label)
     
     def refresh(self):
-        """Refresh stations list with summaries"""
+        """Refresh stations list with summaries (loaded in the background)"""
+        if not self.queries.is_pending():
+            self.summary_before_load = self.summary_label.text()
+        self.table.setEnabled(False)
+        self.summary_label.setText("⏳ Loading stations...")
+        self.queries.submit(self._load_stations, self.on_stations_loaded, self.on_load_failed)
+    
+    def cancel_pending(self):
+        """Drop an in-flight refresh when the user leaves the module"""
+        if self.queries.is_pending():
+            self.queries.cancel_pending()
+            self.table.setEnabled(True)
+            self.summary_label.setText(self.summary_before_load)
+    
+    def _load_stations(self, db):
+        """Fetch stations and their statistics (runs on a worker thread)"""
+        return db.get_all_stations(enabled_only=False), db.get_station_stats_bulk()
+    
+    def on_stations_loaded(self, result):
+        """Show loaded stations"""
+        stations, self.station_stats = result
+        self.table.setEnabled(True)
+        
         # Temporarily disable sorting while populating
         self.table.setSortingEnabled(False)
         
-        stations = self.db.get_all_stations(enabled_only=False)
         self.populate_table(stations)
         
         # Re-enable sorting after populating
         self.table.setSortingEnabled(True)
     
+    def get_station_stats(self, station_id):
+        """Cached statistics for a station (zeros if it has no members yet)"""
+        return self.station_stats.get(station_id, {
+            'total_members': 0,
+            'active_members': 0,
+            'total_savings': 0,
+            'total_loans_amount': 0
+        })
+    
+    def on_load_failed(self, message):
+        """Report a failed refresh"""
+        self.table.setEnabled(True)
+        self.summary_label.setText(f"Failed to load stations: {message}")
+    
     def populate_table(self, stations):
         """Populate table with stations and their summaries"""
         self.table.setRowCount(0)
@@ -137,11 +181,12 @@ class StationsModule(QWidget):
             station_id = station['station_id']
             
             # Get station statistics
-            stats = self._get_station_stats(station_id)
+            stats = self.get_station_stats(station_id)
             
             # Station ID
             id_item = QTableWidgetItem(station_id)
             id_item.setFont(QFont("Segoe UI", 10, QFont.Weight.Bold))
+            id_item.setData(Qt.ItemDataRole.UserRole, station)
             self.table.setItem(row, 0, id_item)
             
             # Station Name
@@ -235,46 +280,12 @@ class StationsModule(QWidget):
             f"Total Loans Owed: ₦{total_loans_amount:,.2f}"
         )
     
-    def _get_station_stats(self, station_id):
-        """Get statistics for a station"""
-        # Get member counts
-        members = self.db.fetchall(
-            "SELECT is_active FROM members WHERE station_id = ?",
-            (station_id,)
-        )
-        total_members = len(members)
-        active_members = sum(1 for m in members if m['is_active'])
-        
-        # Get total savings balance
-        savings_result = self.db.fetchone(
-            """
-            SELECT COALESCE(SUM(sa.current_balance), 0) as total_savings
-            FROM savings_accounts sa
-            JOIN members m ON sa.member_id = m.member_id
-            WHERE m.station_id = ?
-            """,
-            (station_id,)
-        )
-        total_savings = savings_result['total_savings'] if savings_result else 0
-        
-        # Get total loans AMOUNT (what the station owes)
-        loans_result = self.db.fetchone(
-            """
-            SELECT COALESCE(SUM(l.balance_outstanding), 0) as total_loans_amount
-            FROM loans l
-            JOIN members m ON l.member_id = m.member_id
-            WHERE m.station_id = ? AND l.status = 'Active'
-            """,
-            (station_id,)
-        )
-        total_loans_amount = loans_result['total_loans_amount'] if loans_result else 0
-        
-        return {
-            'total_members': total_members,
-            'active_members': active_members,
-            'total_savings': total_savings,
-            'total_loans_amount': total_loans_amount
-        }
+    def on_row_double_clicked(self, row, column):
+        """Open the details dialog for a station row"""
+        item = self.table.item(row, 0)
+        if item:
+            station = item.data(Qt.ItemDataRole.UserRole)
+            self.view_station_details(station, self.get_station_stats(station['station_id']))
     
     def view_station_details(self, station, stats):
         """Show detailed view of a station"""
@@ -284,13 +295,10 @@ class StationsModule(QWidget):
     def add_station(self):
         """Show add station dialog"""
         # Get the next sequential station ID
-        existing_stations = self.db.fetchall(
-            "SELECT station_id FROM stations ORDER BY station_id DESC LIMIT 1"
-        )
+        last_id = self.db.get_last_station_id()
         
-        if existing_stations and existing_stations[0]['station_id']:
-            # Get last station ID and increment
-            last_id = existing_stations[0]['station_id']
+        if last_id:
+            # Increment the last station ID
             try:
                 next_num = int(last_id) + 1
                 next_id = f"{next_num:02d}"  # Format as 01, 02, etc.
@@ -307,18 +315,7 @@ class StationsModule(QWidget):
                 station_data = dialog.get_station_data()
                 
                 # Add station to database
-                self.db.execute(
-                    """
-                    INSERT INTO stations (station_id, station_name, city, address, enabled)
-                    VALUES (?, ?, ?, ?, 1)
-                    """,
-                    (
-                        station_data['station_id'],
-                        station_data['station_name'],
-                        station_data['city'],
-                        station_data['address']
-                    )
-                )
+                self.db.insert_station(station_data)
                 
                 QMessageBox.information(
                     self,
@@ -358,19 +355,7 @@ class StationsModule(QWidget):
                 station_data = dialog.get_station_data()
                 
                 # Update station in database
-                self.db.execute(
-                    """
-                    UPDATE stations
-                    SET station_name = ?, city = ?, address = ?
-                    WHERE station_id = ?
-                    """,
-                    (
-                        station_data['station_name'],
-                        station_data['city'],
-                        station_data['address'],
-                        station['station_id']
-                    )
-                )
+                self.db.update_station(station['station_id'], station_data)
                 
                 QMessageBox.information(
                     self,
@@ -437,10 +422,7 @@ class StationsModule(QWidget):
             if final_reply == QMessageBox.StandardButton.Yes:
                 try:
                     # Delete station from database
-                    self.db.execute(
-                        "DELETE FROM stations WHERE station_id = ?",
-                        (station['station_id'],)
-                    )
+                    self.db.delete_station(station['station_id'])
                     
                     QMessageBox.information(
                         self,
@@ -537,10 +519,7 @@ class StationDetailsDialog(QDialog):
         members_table.setSortingEnabled(True)
         
         # Get members for this station
-        members = self.db.fetchall(
-            "SELECT * FROM members WHERE station_id = ? ORDER BY member_id",
-            (self.station['station_id'],)
-        )
+        members = self.db.get_station_members(self.station['station_id'])
         
         # Temporarily disable sorting while populating
         members_table.setSortingEnabled(False)
@@ -723,10 +702,7 @@ class StationDialog(QDialog):
         
         # Check for duplicate station ID (only in add mode)
         if not self.is_edit_mode:
-            existing = self.db.fetchone(
-                "SELECT station_id FROM stations WHERE station_id = ?",
-                (self.station_id_input.text().strip(),)
-            )
+            existing = self.db.get_station(self.station_id_input.text().strip())
             if existing:
                 QMessageBox.warning(
                     self,
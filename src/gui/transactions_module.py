@@ -5,11 +5,15 @@ Transactions Module - View all transactions
 
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
-    QTableWidget, QTableWidgetItem, QDateEdit, QComboBox, QLineEdit
+    QTableWidget, QTableWidgetItem, QDateEdit, QComboBox, QLineEdit,
+    QFileDialog, QMessageBox, QApplication
 )
 from PyQt6.QtCore import Qt, QDate
 from PyQt6.QtGui import QFont
 
+from database.db_manager import BatchPostingError
+from utils.payroll_import import read_payroll_csv
+
 
 class TransactionsModule(QWidget):
     """Transactions viewing module"""
@@ -18,6 +22,7 @@ class TransactionsModule(QWidget):
         super().__init__(parent)
         self.app = app
         self.db = app.db_manager
+        self.current_user = app.current_user
         self.setup_ui()
         self.refresh()
     
@@ -33,6 +38,11 @@ class TransactionsModule(QWidget):
         header_layout.addWidget(title)
         header_layout.addStretch()
         
+        import_btn = QPushButton("📥 Import Payroll")
+        import_btn.setToolTip("Post monthly savings and loan deductions from a CSV file")
+        import_btn.clicked.connect(self.import_payroll)
+        header_layout.addWidget(import_btn)
+        
         refresh_btn = QPushButton("🔄 Refresh")
         refresh_btn.clicked.connect(self.refresh)
         header_layout.addWidget(refresh_btn)
@@ -127,3 +137,69 @@ class TransactionsModule(QWidget):
             f"Total Credits: ₦{total_credit:,.2f} | "
             f"Total Debits: ₦{total_debit:,.2f}"
         )
+    
+    def import_payroll(self):
+        """Post a payroll deduction CSV as one batch"""
+        filepath, _ = QFileDialog.getOpenFileName(
+            self, "Import Payroll Deductions", "", "CSV Files (*.csv)"
+        )
+        if not filepath:
+            return
+        
+        try:
+            entries, errors = read_payroll_csv(filepath)
+        except (OSError, UnicodeDecodeError) as e:
+            QMessageBox.critical(self, "Error", f"Could not read file:\n{str(e)}")
+            return
+        
+        if errors:
+            self.show_import_errors(errors)
+            return
+        if not entries:
+            QMessageBox.information(self, "Import Payroll", "The file contains no entries.")
+            return
+        
+        total = sum(e['amount'] for e in entries)
+        reply = QMessageBox.question(
+            self,
+            "Confirm Import",
+            f"Post {len(entries):,} payroll entries totalling ₦{total:,.2f}?",
+            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
+        )
+        if reply != QMessageBox.StandardButton.Yes:
+            return
+        
+        QApplication.setOverrideCursor(Qt.CursorShape.WaitCursor)
+        try:
+            result = self.db.post_batch(entries, self.current_user['username'])
+        except BatchPostingError as e:
+            QApplication.restoreOverrideCursor()
+            self.show_import_errors(e.errors)
+            return
+        except Exception as e:
+            QApplication.restoreOverrideCursor()
+            QMessageBox.critical(self, "Error", f"Import failed, nothing was posted:\n{str(e)}")
+            return
+        QApplication.restoreOverrideCursor()
+        
+        QMessageBox.information(
+            self,
+            "Import Complete",
+            f"Posted {result['entries']:,} entries for {result['members']:,} members.\n\n"
+            f"Savings deposits: {result['savings_entries']:,}\n"
+            f"Loan repayments: {result['loan_entries']:,}\n"
+            f"Loans completed: {result['loans_completed']:,}\n"
+            f"Total: ₦{result['total_amount']:,.2f}"
+        )
+        self.refresh()
+    
+    def show_import_errors(self, errors):
+        """List the lines that stopped an import"""
+        lines = [f"Line {line}: {message}" for line, message in errors[:20]]
+        if len(errors) > 20:
+            lines.append(f"... and {len(errors) - 20} more")
+        QMessageBox.warning(
+            self,
+            "Import Rejected",
+            f"{len(errors):,} problem(s) found. Nothing was posted.\n\n" + "\n".join(lines)
+        )
@@ -0,0 +1,123 @@
+"""
+Report Cache - Reuse finished report files
+==========================================
+A report is looked up by its type, its parameters and a fingerprint of the
+data it is built from. While none of those change, the file generated last
+time is handed back instead of being rebuilt.
+
+Entries are kept in an index file next to the reports. When the files it
+tracks grow past the size limit, the least recently used ones are deleted.
+A file that was overwritten or removed since it was cached is a miss.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from typing import Dict, Optional
+
+DEFAULT_MAX_BYTES = 200 * 1024 * 1024
+INDEX_FILENAME = '.report_cache.json'
+
+# One index per reports folder, shared by every ReportGenerator in the process
+_lock = threading.Lock()
+
+
+def cache_key(report: str, params, fingerprint) -> str:
+    """Stable key for a report type, its parameters and a data fingerprint"""
+    payload = json.dumps([report, params, fingerprint], sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+class ReportCache:
+    """Size-bounded LRU index of generated report files"""
+
+    def __init__(self, directory: str, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.index_path = os.path.join(directory, INDEX_FILENAME)
+
+    def get(self, key: str) -> Optional[str]:
+        """Path of the cached file for key, or None if it is missing or stale"""
+        with _lock:
+            entries = self._load()
+            entry = entries.get(key)
+            if entry is None:
+                return None
+            if self._stamp(entry['path']) != (entry['size'], entry['mtime']):
+                # Overwritten by a later run or deleted by hand
+                del entries[key]
+                self._save(entries)
+                return None
+            entry['last_used'] = time.time()
+            self._save(entries)
+            return entry['path']
+
+    def put(self, key: str, path: str) -> str:
+        """Record a freshly generated file under key and evict old files; returns path"""
+        size, mtime = self._stamp(path)
+        with _lock:
+            entries = self._load()
+            # The file now holds this report, whatever it held before
+            for other in [k for k, e in entries.items() if e['path'] == path]:
+                del entries[other]
+            entries[key] = {'path': path, 'size': size, 'mtime': mtime, 'last_used': time.time()}
+            self._evict(entries, keep=key)
+            self._save(entries)
+        return path
+
+    def clear(self):
+        """Forget every entry and delete the cached files"""
+        with _lock:
+            for entry in self._load().values():
+                self._remove(entry['path'])
+            self._save({})
+
+    def total_bytes(self) -> int:
+        """Size of the files currently tracked"""
+        with _lock:
+            return sum(entry['size'] for entry in self._load().values())
+
+    def _evict(self, entries: Dict, keep: str):
+        """Delete least recently used files until the total fits max_bytes"""
+        total = sum(entry['size'] for entry in entries.values())
+        for key in sorted(entries, key=lambda k: entries[k]['last_used']):
+            if total <= self.max_bytes:
+                break
+            if key == keep:
+                continue
+            total -= entries[key]['size']
+            self._remove(entries.pop(key)['path'])
+
+    @staticmethod
+    def _stamp(path: str):
+        """(size, mtime) of a file, or None if it no longer exists"""
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return (stat.st_size, stat.st_mtime_ns)
+
+    @staticmethod
+    def _remove(path: str):
+        """Delete a cached file, ignoring one that is already gone or open elsewhere"""
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    def _load(self) -> Dict:
+        """Read the index; an unreadable index is treated as empty"""
+        try:
+            with open(self.index_path, encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save(self, entries: Dict):
+        """Write the index atomically"""
+        tmp_path = self.index_path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(entries, f)
+        os.replace(tmp_path, self.index_path)
@@ -9,11 +9,40 @@ from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import inch
 from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, PageBreak
 from reportlab.lib.enums import TA_CENTER, TA_RIGHT, TA_LEFT
+from reportlab.pdfgen import canvas
 from openpyxl import Workbook
-from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Font, PatternFill, Alignment, Border, Side, NamedStyle
+from openpyxl.utils import get_column_letter
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
 from datetime import datetime
+from itertools import islice
+import multiprocessing
 import os
 
+from database.loan_analytics import AGING_LABELS, PAR_DAYS
+from .report_cache import ReportCache, cache_key
+
+
+# Shared by every cashbook page: header row, then brought-forward row first
+# and carried-forward row last
+CASHBOOK_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#2980B9')),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('ALIGN', (3, 0), (5, -1), 'RIGHT'),
+    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTNAME', (0, 1), (-1, 1), 'Helvetica-Bold'),
+    ('FONTNAME', (0, -1), (-1, -1), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, -1), 8),
+    ('TOPPADDING', (0, 0), (-1, -1), 2),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 2),
+    ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
+    ('BACKGROUND', (0, 1), (-1, 1), colors.lightgrey),
+    ('BACKGROUND', (0, -1), (-1, -1), colors.lightgrey),
+])
+
 
 class ReportGenerator:
     """Generate various reports in PDF and Excel formats"""
@@ -22,146 +51,147 @@ class ReportGenerator:
         self.db = db_manager
         self.reports_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), '..', 'data', 'reports')
         os.makedirs(self.reports_dir, exist_ok=True)
+        # Reuse an earlier file while its data and parameters are unchanged
+        self.use_cache = True
+    
+    def _cached(self, report, params, build):
+        """Path of the cached report for params if its data is unchanged, else build()
+
+        The key includes today's date, since reports print it.
+        """
+        if not self.use_cache:
+            return build()
+        
+        cache = ReportCache(self.reports_dir)
+        key = cache_key(report, params, [self.db.get_report_fingerprint(),
+                                         datetime.now().strftime('%Y-%m-%d')])
+        filepath = cache.get(key)
+        if filepath is None:
+            filepath = cache.put(key, build())
+        return filepath
     
     # ========================================================================
     # PDF REPORTS
     # ========================================================================
     
     def generate_member_statement_pdf(self, member_id, start_date, end_date):
-        """Generate member statement PDF"""
+        """Generate member statement PDF (cached)"""
+        return self._cached(
+            'member_statement', [member_id, start_date, end_date],
+            lambda: self._build_member_statement_pdf(member_id, start_date, end_date)
+        )
+    
+    def _build_member_statement_pdf(self, member_id, start_date, end_date):
+        """Render one member statement"""
         # Get member info
         member = self.db.get_member(member_id)
         if not member:
             raise ValueError(f"Member {member_id} not found")
         
-        # Create filename
-        filename = f"Member_Statement_{member_id}_{datetime.now().strftime('%Y%m%d')}.pdf"
-        filepath = os.path.join(self.reports_dir, filename)
-        
-        # Create PDF
-        doc = SimpleDocTemplate(filepath, pagesize=A4)
-        story = []
-        styles = getSampleStyleSheet()
-        
-        # Title style
-        title_style = ParagraphStyle(
-            'CustomTitle',
-            parent=styles['Heading1'],
-            fontSize=18,
-            textColor=colors.HexColor('#2980B9'),
-            spaceAfter=30,
-            alignment=TA_CENTER
-        )
-        
-        # Organization header
-        org_name = self.db.get_setting('organization_name') or 'NFC Cooperative'
-        story.append(Paragraph(org_name, title_style))
-        story.append(Paragraph("MEMBER ACCOUNT STATEMENT", styles['Heading2']))
-        story.append(Spacer(1, 0.2*inch))
-        
-        # Member info
-        full_name = f"{member['first_name']} "
-        if member['middle_name']:
-            full_name += f"{member['middle_name']} "
-        full_name += member['last_name']
-        
-        member_info = [
-            ['Member ID:', member_id],
-            ['Name:', full_name],
-            ['Date:', datetime.now().strftime('%B %d, %Y')],
-            ['Period:', f"{start_date} to {end_date}"]
-        ]
-        
-        member_table = Table(member_info, colWidths=[2*inch, 4*inch])
-        member_table.setStyle(TableStyle([
-            ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-            ('FONTNAME', (1, 0), (1, -1), 'Helvetica'),
-            ('FONTSIZE', (0, 0), (-1, -1), 10),
-            ('TOPPADDING', (0, 0), (-1, -1), 6),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
-        ]))
-        story.append(member_table)
-        story.append(Spacer(1, 0.3*inch))
-        
-        # Account Summary
+        filepath = os.path.join(self.reports_dir, member_statement_filename(member_id))
         summary = self.db.get_member_summary(member_id)
-        if summary:
-            summary = summary[0]
-            
-            story.append(Paragraph("ACCOUNT SUMMARY", styles['Heading3']))
-            
-            summary_data = [
-                ['Description', 'Amount (₦)'],
-                ['Total Savings', f"{summary['total_savings']:,.2f}"],
-                ['  - Premium Savings', f"{summary['premium_savings']:,.2f}"],
-                ['  - Fixed/Target Deposits', f"{summary['fixed_target_deposits']:,.2f}"],
-                ['  - Share Investment', f"{summary['shares_investment']:,.2f}"],
-                ['Total Loans Outstanding', f"{summary['total_loans_outstanding']:,.2f}"],
-                ['Net Balance', f"{summary['net_balance']:,.2f}"]
-            ]
-            
-            summary_table = Table(summary_data, colWidths=[3*inch, 2*inch])
-            summary_table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#2980B9')),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-                ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-                ('ALIGN', (1, 0), (1, -1), 'RIGHT'),
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                ('FONTSIZE', (0, 0), (-1, 0), 12),
-                ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-                ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-                ('GRID', (0, 0), (-1, -1), 1, colors.black),
-                ('FONTNAME', (0, -1), (-1, -1), 'Helvetica-Bold'),
-            ]))
-            story.append(summary_table)
-            story.append(Spacer(1, 0.3*inch))
-        
-        # Transactions
-        story.append(Paragraph("TRANSACTION HISTORY", styles['Heading3']))
-        
-        transactions = self.db.get_transactions(member_id, start_date, end_date)
-        
-        if transactions:
-            trans_data = [['Date', 'Type', 'Description', 'Debit (₦)', 'Credit (₦)']]
-            
-            for txn in transactions:
-                debit = f"{txn['amount']:,.2f}" if not txn['is_credit'] else '-'
-                credit = f"{txn['amount']:,.2f}" if txn['is_credit'] else '-'
-                
-                trans_data.append([
-                    txn['transaction_date'],
-                    txn['transaction_type'],
-                    txn['description'] or '',
-                    debit,
-                    credit
-                ])
-            
-            trans_table = Table(trans_data, colWidths=[1*inch, 1.5*inch, 2*inch, 1*inch, 1*inch])
-            trans_table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#34495E')),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-                ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-                ('ALIGN', (3, 0), (4, -1), 'RIGHT'),
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                ('FONTSIZE', (0, 0), (-1, -1), 9),
-                ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
-                ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.lightgrey]),
-            ]))
-            story.append(trans_table)
-        else:
-            story.append(Paragraph("No transactions found for this period.", styles['Normal']))
-        
-        # Build PDF
-        doc.build(story)
+        render_member_statement(
+            filepath,
+            self.db.get_setting('organization_name') or 'NFC Cooperative',
+            member,
+            summary[0] if summary else None,
+            self.db.get_transactions(member_id, start_date, end_date),
+            start_date, end_date
+        )
         return filepath
     
-    def generate_cashbook_pdf(self, start_date, end_date):
-        """Generate cashbook report"""
+    def generate_member_statements_pdf(self, start_date, end_date, member_ids=None, merge=False,
+                                       workers=None, progress=None, cancelled=None):
+        """Generate statements for many members (all active members by default)
+
+        The data comes from a few set-based queries and the PDFs are rendered
+        across a process pool. progress(done, total) is called as statements
+        finish; when cancelled() returns True, statements not yet started are
+        skipped. With merge=True the statements are also combined into one
+        printable PDF.
+
+        Returns a dict with folder, files, merged (path or None) and cancelled.
+        """
+        statements = self.db.get_member_statement_data(start_date, end_date, member_ids)
+        org_name = self.db.get_setting('organization_name') or 'NFC Cooperative'
+        folder = os.path.join(self.reports_dir, f"Member_Statements_{start_date}_to_{end_date}")
+        os.makedirs(folder, exist_ok=True)
+        
+        total = len(statements)
+        if progress:
+            progress(0, total)
+        
+        chunks = [statements[i:i + STATEMENT_CHUNK_SIZE]
+                  for i in range(0, total, STATEMENT_CHUNK_SIZE)]
+        files = {}
+        was_cancelled = False
+        
+        # spawn, not fork: never copy a running GUI process
+        with ProcessPoolExecutor(max_workers=workers,
+                                 mp_context=multiprocessing.get_context('spawn')) as pool:
+            futures = {
+                pool.submit(render_statement_chunk, folder, org_name, start_date, end_date, chunk): i
+                for i, chunk in enumerate(chunks)
+            }
+            pending = set(futures)
+            while pending:
+                # Wake up regularly to notice a cancel between chunks
+                done, pending = wait(pending, timeout=STATEMENT_CANCEL_POLL,
+                                     return_when=FIRST_COMPLETED)
+                for future in done:
+                    files[futures[future]] = future.result()
+                if done and progress:
+                    progress(sum(len(paths) for paths in files.values()), total)
+                if cancelled and cancelled():
+                    was_cancelled = True
+                    for future in pending:
+                        future.cancel()
+                    break
+        
+        # Leaving the pool waits for chunks already rendering; keep their files
+        for future, i in futures.items():
+            if i not in files and future.done() and not future.cancelled():
+                files[i] = future.result()
+        
+        # Member order, whatever order the workers finished in
+        paths = [path for i in sorted(files) for path in files[i]]
+        merged = None
+        if merge and paths and not was_cancelled:
+            merged = merge_pdfs(paths, os.path.join(
+                self.reports_dir, f"Member_Statements_{start_date}_to_{end_date}.pdf"
+            ))
+        
+        return {'folder': folder, 'files': paths, 'merged': merged, 'cancelled': was_cancelled}
+    
+    # Cashbook layout: a fixed row height makes the rows per page predictable
+    CASHBOOK_MARGIN = 0.6*inch
+    CASHBOOK_ROW_HEIGHT = 14
+    CASHBOOK_COLUMNS = [0.85*inch, 0.85*inch, 1.95*inch, 1.1*inch, 1.1*inch, 1.2*inch]
+    CASHBOOK_DESCRIPTION_CHARS = 30
+    CASHBOOK_HEADER = ['Date', 'Member ID', 'Description', 'Receipts (₦)', 'Payments (₦)', 'Balance (₦)']
+    
+    def generate_cashbook_pdf(self, start_date, end_date, payment_method='Cash'):
+        """Generate cashbook report (cached)"""
+        return self._cached(
+            'cashbook', [start_date, end_date, payment_method],
+            lambda: self._build_cashbook_pdf(start_date, end_date, payment_method)
+        )
+    
+    def _build_cashbook_pdf(self, start_date, end_date, payment_method):
+        """Render the cashbook
+
+        Transactions are streamed from the database and drawn one page at a
+        time, so memory stays flat however long the period. Every page
+        repeats the column headers and carries the running totals forward.
+        """
         filename = f"Cashbook_{start_date}_to_{end_date}.pdf"
         filepath = os.path.join(self.reports_dir, filename)
         
-        doc = SimpleDocTemplate(filepath, pagesize=A4)
-        story = []
+        page_width, page_height = A4
+        margin = self.CASHBOOK_MARGIN
+        width = page_width - 2*margin
+        # Compressed page streams make the file about a fifth of the size
+        pdf = canvas.Canvas(filepath, pagesize=A4, pageCompression=1)
         styles = getSampleStyleSheet()
         
         # Title
@@ -170,218 +200,544 @@ class ReportGenerator:
                                      alignment=TA_CENTER)
         
         org_name = self.db.get_setting('organization_name') or 'NFC Cooperative'
-        story.append(Paragraph(org_name, title_style))
-        story.append(Paragraph("CASHBOOK REPORT", styles['Heading2']))
-        story.append(Paragraph(f"Period: {start_date} to {end_date}", styles['Normal']))
-        story.append(Spacer(1, 0.3*inch))
-        
-        # Get all transactions
-        transactions = self.db.get_transactions(None, start_date, end_date)
-        
-        # Group by payment method
-        cash_transactions = [t for t in transactions if t.get('payment_method') == 'Cash']
-        
-        if cash_transactions:
-            data = [['Date', 'Member ID', 'Description', 'Receipts (₦)', 'Payments (₦)']]
-            
-            total_receipts = 0
-            total_payments = 0
+        top = page_height - margin
+        for flowable in (Paragraph(org_name, title_style),
+                         Paragraph("CASHBOOK REPORT", styles['Heading2']),
+                         Paragraph(f"Period: {start_date} to {end_date}", styles['Normal']),
+                         Spacer(1, 0.3*inch)):
+            top -= flowable.getSpaceBefore()
+            _, height = flowable.wrapOn(pdf, width, top - margin)
+            flowable.drawOn(pdf, margin, top - height)
+            top -= height + flowable.getSpaceAfter()
+        
+        rows = self.db.iter_cashbook(start_date, end_date, payment_method)
+        chunk = list(islice(rows, self._cashbook_rows_per_page(top - margin)))
+        
+        if not chunk:
+            message = Paragraph(f"No {payment_method.lower()} transactions found for this period.",
+                                styles['Normal'])
+            _, height = message.wrapOn(pdf, width, top - margin)
+            message.drawOn(pdf, margin, top - height)
+            pdf.save()
+            return filepath
+        
+        opening = self.db.get_cashbook_opening_balance(start_date, payment_method)
+        totals = {'receipts': 0.0, 'payments': 0.0, 'balance': opening}
+        full_page = self._cashbook_rows_per_page(page_height - 2*margin)
+        page = 1
+        
+        while chunk:
+            # Read one page ahead to know whether this page is the last
+            next_chunk = list(islice(rows, full_page))
             
-            for txn in cash_transactions:
+            data = [self.CASHBOOK_HEADER,
+                    self._cashbook_total_row('Opening balance' if page == 1 else 'Brought forward',
+                                             totals)]
+            for txn in chunk:
+                amount = txn['amount']
                 if txn['is_credit']:
-                    receipts = f"{txn['amount']:,.2f}"
+                    receipts = f"{amount:,.2f}"
                     payments = '-'
-                    total_receipts += txn['amount']
+                    totals['receipts'] += amount
+                    totals['balance'] += amount
                 else:
                     receipts = '-'
-                    payments = f"{txn['amount']:,.2f}"
-                    total_payments += txn['amount']
+                    payments = f"{amount:,.2f}"
+                    totals['payments'] += amount
+                    totals['balance'] -= amount
                 
                 data.append([
                     txn['transaction_date'],
                     txn['member_id'],
-                    txn['description'] or txn['transaction_type'],
+                    (txn['description'] or txn['transaction_type'])[:self.CASHBOOK_DESCRIPTION_CHARS],
                     receipts,
-                    payments
+                    payments,
+                    f"{totals['balance']:,.2f}"
                 ])
+            data.append(self._cashbook_total_row('Carried forward' if next_chunk else 'TOTALS:',
+                                                 totals))
             
-            # Totals
-            data.append(['', '', 'TOTALS:', f"{total_receipts:,.2f}", f"{total_payments:,.2f}"])
+            table = Table(data, colWidths=self.CASHBOOK_COLUMNS, rowHeights=self.CASHBOOK_ROW_HEIGHT)
+            table.setStyle(CASHBOOK_TABLE_STYLE)
+            _, height = table.wrapOn(pdf, width, top - margin)
+            table.drawOn(pdf, margin, top - height)
             
-            table = Table(data, colWidths=[1*inch, 1*inch, 2.5*inch, 1.2*inch, 1.2*inch])
-            table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#2980B9')),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-                ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-                ('ALIGN', (3, 0), (4, -1), 'RIGHT'),
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                ('FONTNAME', (0, -1), (-1, -1), 'Helvetica-Bold'),
-                ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
-                ('BACKGROUND', (0, -1), (-1, -1), colors.lightgrey),
-            ]))
-            story.append(table)
-        else:
-            story.append(Paragraph("No cash transactions found for this period.", styles['Normal']))
-        
-        doc.build(story)
+            pdf.setFont('Helvetica', 8)
+            pdf.drawRightString(page_width - margin, margin / 2, f"Page {page}")
+            pdf.showPage()
+            
+            page += 1
+            top = page_height - margin
+            chunk = next_chunk
+        
+        pdf.save()
         return filepath
     
+    def _cashbook_rows_per_page(self, height):
+        """Transactions that fit in height, leaving room for header and total rows"""
+        return max(int(height // self.CASHBOOK_ROW_HEIGHT) - 3, 1)
+    
+    @staticmethod
+    def _cashbook_total_row(label, totals):
+        """Brought forward / carried forward row with the running totals"""
+        return ['', '', label, f"{totals['receipts']:,.2f}", f"{totals['payments']:,.2f}",
+                f"{totals['balance']:,.2f}"]
+    
     # ========================================================================
     # EXCEL REPORTS
     # ========================================================================
     
     def generate_member_summary_excel(self, start_date, end_date):
-        """Generate member summary in Excel"""
+        """Generate member summary in Excel (cached)"""
+        return self._cached('member_summary', [], self._build_member_summary_excel)
+    
+    def _build_member_summary_excel(self):
+        """Write the member summary workbook (balances as at today)"""
         filename = f"Member_Summary_{datetime.now().strftime('%Y%m%d')}.xlsx"
         filepath = os.path.join(self.reports_dir, filename)
         
-        wb = Workbook()
-        ws = wb.active
-        ws.title = "Member Summary"
+        wb = excel_workbook()
+        ws = wb.create_sheet("Member Summary")
         
-        # Styles
-        header_fill = PatternFill(start_color="2980B9", end_color="2980B9", fill_type="solid")
-        header_font = Font(bold=True, color="FFFFFF", size=12)
-        title_font = Font(bold=True, size=14)
-        currency_format = '₦#,##0.00'
+        # Column widths (must be set before the first row is written)
+        ws.column_dimensions['A'].width = 15
+        ws.column_dimensions['B'].width = 30
+        for col in ['C', 'D', 'E', 'F', 'G', 'H']:
+            ws.column_dimensions[col].width = 18
         
         # Title
-        ws['A1'] = self.db.get_setting('organization_name') or 'NFC Cooperative'
-        ws['A1'].font = title_font
-        ws['A2'] = 'MEMBER SUMMARY REPORT'
-        ws['A2'].font = Font(bold=True, size=12)
-        ws['A3'] = f'As at: {datetime.now().strftime("%B %d, %Y")}'
+        ws.append([excel_cell(ws, self.db.get_setting('organization_name') or 'NFC Cooperative', 'NFC Title')])
+        ws.append([excel_cell(ws, 'MEMBER SUMMARY REPORT', 'NFC Subtitle')])
+        ws.append([f'As at: {datetime.now().strftime("%B %d, %Y")}'])
+        ws.append([])
         
         # Headers
         headers = ['Member ID', 'Name', 'Premium Savings', 'Fixed/Target Deposits',
                   'Share Investment', 'Total Savings', 'Loans Outstanding', 'Net Balance']
-        
-        for col, header in enumerate(headers, 1):
-            cell = ws.cell(row=5, column=col, value=header)
-            cell.fill = header_fill
-            cell.font = header_font
-            cell.alignment = Alignment(horizontal='center', vertical='center')
-        
-        # Get member summaries
-        summaries = self.db.get_member_summary()
-        
-        # Data rows
-        row = 6
-        for summary in summaries:
-            ws.cell(row=row, column=1, value=summary['member_id'])
-            ws.cell(row=row, column=2, value=summary['full_name'])
-            ws.cell(row=row, column=3, value=summary['premium_savings']).number_format = currency_format
-            ws.cell(row=row, column=4, value=summary['fixed_target_deposits']).number_format = currency_format
-            ws.cell(row=row, column=5, value=summary['shares_investment']).number_format = currency_format
-            ws.cell(row=row, column=6, value=summary['total_savings']).number_format = currency_format
-            ws.cell(row=row, column=7, value=summary['total_loans_outstanding']).number_format = currency_format
-            ws.cell(row=row, column=8, value=summary['net_balance']).number_format = currency_format
+        ws.append([excel_cell(ws, header, 'NFC Header') for header in headers])
+        
+        # Data rows, streamed from the summary view
+        append_row = excel_row_writer(ws, [None, None] + ['NFC Currency'] * 6)
+        first_row = row = 6
+        for summary in self.db.iter_member_summary():
+            append_row([
+                summary['member_id'],
+                summary['full_name'],
+                summary['premium_savings'],
+                summary['fixed_target_deposits'],
+                summary['shares_investment'],
+                summary['total_savings'],
+                summary['total_loans_outstanding'],
+                summary['net_balance'],
+            ])
             row += 1
         
         # Totals row
-        total_row = row
-        ws.cell(row=total_row, column=1, value='TOTALS').font = Font(bold=True)
-        ws.cell(row=total_row, column=2, value=f'{len(summaries)} Members').font = Font(bold=True)
-        
-        for col in range(3, 9):
-            formula = f'=SUM({ws.cell(row=6, column=col).coordinate}:{ws.cell(row=total_row-1, column=col).coordinate})'
-            cell = ws.cell(row=total_row, column=col, value=formula)
-            cell.number_format = currency_format
-            cell.font = Font(bold=True)
-        
-        # Column widths
-        ws.column_dimensions['A'].width = 15
-        ws.column_dimensions['B'].width = 30
-        for col in ['C', 'D', 'E', 'F', 'G', 'H']:
-            ws.column_dimensions[col].width = 18
+        ws.append(
+            [excel_cell(ws, 'TOTALS', 'NFC Label'),
+             excel_cell(ws, f'{row - first_row} Members', 'NFC Label')] +
+            [excel_cell(ws, f'=SUM({col}{first_row}:{col}{row - 1})', 'NFC Total')
+             for col in ['C', 'D', 'E', 'F', 'G', 'H']]
+        )
         
         # Save
         wb.save(filepath)
         return filepath
     
     def generate_loan_portfolio_excel(self):
-        """Generate loan portfolio analysis in Excel"""
+        """Generate loan portfolio analysis in Excel (cached)"""
+        return self._cached('loan_portfolio', [], self._build_loan_portfolio_excel)
+    
+    def _build_loan_portfolio_excel(self):
+        """Write the loan portfolio workbook"""
         filename = f"Loan_Portfolio_{datetime.now().strftime('%Y%m%d')}.xlsx"
         filepath = os.path.join(self.reports_dir, filename)
         
-        wb = Workbook()
+        wb = excel_workbook()
+        portfolio = self.db.get_loan_portfolio_summary()
         
         # Summary sheet
-        ws_summary = wb.active
-        ws_summary.title = "Portfolio Summary"
-        
-        # Get all loans
-        all_loans = self.db.fetchall("SELECT * FROM loans")
-        active_loans = [l for l in all_loans if l['status'] == 'Active']
+        ws_summary = wb.create_sheet("Portfolio Summary")
         
-        # Headers
-        header_fill = PatternFill(start_color="2980B9", end_color="2980B9", fill_type="solid")
-        header_font = Font(bold=True, color="FFFFFF")
+        title = 'LOAN PORTFOLIO ANALYSIS'
+        as_at = f'As at: {datetime.now().strftime("%B %d, %Y")}'
         
-        ws_summary['A1'] = 'LOAN PORTFOLIO ANALYSIS'
-        ws_summary['A1'].font = Font(bold=True, size=14)
-        ws_summary['A2'] = f'As at: {datetime.now().strftime("%B %d, %Y")}'
+        # Portfolio at risk, aging and collections, computed over NumPy arrays
+        # (shared with the dashboard, so its loaded columns are reused)
+        analytics = self.db.loan_analytics.analytics(db=self.db)
         
-        # Summary statistics
+        # Summary statistics (label, value, style)
         summary_data = [
-            ['Metric', 'Value'],
-            ['Total Loans Disbursed', len(all_loans)],
-            ['Active Loans', len(active_loans)],
-            ['Completed Loans', len([l for l in all_loans if l['status'] == 'Completed'])],
-            ['Total Amount Disbursed', sum(l['principal_amount'] for l in all_loans)],
-            ['Total Outstanding', sum(l['balance_outstanding'] for l in active_loans)],
-            ['Total Collected', sum(l['amount_paid'] for l in all_loans)],
+            ('Total Loans Disbursed', portfolio['total_loans'], None),
+            ('Active Loans', portfolio['active_loans'], None),
+            ('Completed Loans', portfolio['completed_loans'], None),
+            ('Total Amount Disbursed', portfolio['total_disbursed'], 'NFC Currency'),
+            ('Total Outstanding', portfolio['total_outstanding'], 'NFC Currency'),
+            ('Total Collected', portfolio['total_collected'], 'NFC Currency'),
         ]
+        for days in PAR_DAYS:
+            summary_data += [
+                (f'Portfolio at Risk > {days} Days', analytics.par(days), 'NFC Currency'),
+                (f'PAR{days}', analytics.par_ratio(days), 'NFC Percent'),
+            ]
+        
+        ws_summary.column_dimensions['A'].width = excel_width(
+            title, max(len(as_at), *(len(label) for label, _, _ in summary_data))
+        )
+        ws_summary.column_dimensions['B'].width = excel_width(
+            'Value', max(display_len(value, style) for _, value, style in summary_data)
+        )
+        
+        ws_summary.append([excel_cell(ws_summary, title, 'NFC Title')])
+        ws_summary.append([as_at])
+        ws_summary.append([])
+        ws_summary.append([excel_cell(ws_summary, 'Metric', 'NFC Label'),
+                           excel_cell(ws_summary, 'Value', 'NFC Label')])
+        for label, value, style in summary_data:
+            ws_summary.append([
+                excel_cell(ws_summary, label, 'NFC Label'),
+                excel_cell(ws_summary, value, style) if style else value
+            ])
+        
+        # Breakdowns, each grouped in SQL
+        amounts = [('Disbursed', 'disbursed', 'NFC Currency'),
+                   ('Outstanding', 'outstanding', 'NFC Currency'),
+                   ('Collected', 'collected', 'NFC Currency')]
+        for title, by in (('By Loan Type', 'type'), ('By Station', 'station')):
+            excel_table(
+                wb.create_sheet(title),
+                [('Loan Type' if by == 'type' else 'Station', 'name', None),
+                 ('Loans', 'loans', None), ('Active', 'active_loans', None)] + amounts,
+                self.db.get_loan_portfolio_breakdown(by)
+            )
         
-        for row, (label, value) in enumerate(summary_data, 4):
-            ws_summary.cell(row=row, column=1, value=label).font = Font(bold=True)
-            cell = ws_summary.cell(row=row, column=2, value=value)
-            if isinstance(value, (int, float)) and row > 4:
-                cell.number_format = '₦#,##0.00'
+        excel_table(
+            wb.create_sheet("Aging"),
+            [('Days Past Due', 'bucket', None), ('Open Loans', 'loans', None),
+             ('Outstanding', 'outstanding', 'NFC Currency'), ('Share', 'share', 'NFC Percent')],
+            analytics.aging_rows()
+        )
+        
+        # Aging per loan type and per station, with PAR30
+        buckets = [(label, f'bucket_{i}', 'NFC Currency') for i, label in enumerate(AGING_LABELS)]
+        for title, name, aging in (('Aging by Loan Type', 'Loan Type', analytics.aging_by_type),
+                                   ('Aging by Station', 'Station', analytics.aging_by_station)):
+            excel_table(
+                wb.create_sheet(title),
+                [(name, 'name', None), ('Open Loans', 'loans', None),
+                 ('Outstanding', 'outstanding', 'NFC Currency')] + buckets +
+                [('PAR30 Amount', 'par30', 'NFC Currency'), ('PAR30', 'par30_ratio', 'NFC Percent')],
+                [row for row in aging.rows() if row['loans']],
+                ratios={'par30_ratio': ('par30', 'outstanding')}
+            )
+        
+        excel_table(
+            wb.create_sheet("Collections"),
+            [('Month', 'month', None), ('Installments Due', 'due', 'NFC Currency'),
+             ('Collected', 'collected', 'NFC Currency'), ('Collection Rate', 'rate', 'NFC Percent')],
+            analytics.collections,
+            ratios={'rate': ('collected', 'due')}
+        )
         
         # Detailed loans sheet
         ws_details = wb.create_sheet("Loan Details")
         
-        headers = ['Loan Number', 'Member ID', 'Type', 'Principal', 'Interest',
-                  'Total Amount', 'Amount Paid', 'Balance', 'Status', 'Start Date']
+        # Widths come from the longest values in the table, measured in SQL
+        columns = [
+            ('Loan Number', portfolio['loan_number_len']),
+            ('Member ID', portfolio['member_id_len']),
+            ('Type', portfolio['type_name_len']),
+            ('Principal', currency_len(portfolio['principal_max'])),
+            ('Interest', currency_len(portfolio['interest_max'])),
+            ('Total Amount', currency_len(portfolio['total_max'])),
+            ('Amount Paid', currency_len(portfolio['paid_max'])),
+            ('Balance', currency_len(portfolio['balance_max'])),
+            ('Status', portfolio['status_len']),
+            ('Start Date', portfolio['start_date_len']),
+        ]
+        for col, (header, longest) in enumerate(columns, 1):
+            ws_details.column_dimensions[get_column_letter(col)].width = excel_width(header, longest)
         
-        for col, header in enumerate(headers, 1):
-            cell = ws_details.cell(row=1, column=col, value=header)
-            cell.fill = header_fill
-            cell.font = header_font
+        ws_details.append([excel_cell(ws_details, header, 'NFC Header') for header, _ in columns])
         
-        for row, loan in enumerate(all_loans, 2):
-            ws_details.cell(row=row, column=1, value=loan['loan_number'])
-            ws_details.cell(row=row, column=2, value=loan['member_id'])
-            
-            # Get loan type name
-            loan_type = self.db.fetchone(
-                "SELECT type_name FROM loan_types WHERE loan_type_id = ?",
-                (loan['loan_type_id'],)
-            )
-            ws_details.cell(row=row, column=3, value=loan_type['type_name'] if loan_type else '')
-            
-            ws_details.cell(row=row, column=4, value=loan['principal_amount']).number_format = '₦#,##0.00'
-            ws_details.cell(row=row, column=5, value=loan['interest_amount']).number_format = '₦#,##0.00'
-            ws_details.cell(row=row, column=6, value=loan['total_amount']).number_format = '₦#,##0.00'
-            ws_details.cell(row=row, column=7, value=loan['amount_paid']).number_format = '₦#,##0.00'
-            ws_details.cell(row=row, column=8, value=loan['balance_outstanding']).number_format = '₦#,##0.00'
-            ws_details.cell(row=row, column=9, value=loan['status'])
-            ws_details.cell(row=row, column=10, value=loan['start_date'])
-        
-        # Auto-size columns
-        for ws in [ws_summary, ws_details]:
-            for column in ws.columns:
-                max_length = 0
-                column_letter = column[0].column_letter
-                for cell in column:
-                    try:
-                        if len(str(cell.value)) > max_length:
-                            max_length = len(str(cell.value))
-                    except:
-                        pass
-                adjusted_width = min(max_length + 2, 50)
-                ws.column_dimensions[column_letter].width = adjusted_width
+        append_row = excel_row_writer(ws_details, [None] * 3 + ['NFC Currency'] * 5 + [None] * 2)
+        # One joined query; its columns are already in sheet order
+        for loan in self.db.iter_loan_portfolio():
+            append_row(loan.values())
         
         wb.save(filepath)
         return filepath
+
+
+# ============================================================================
+# EXCEL
+# ============================================================================
+# Exports stream rows into write-only workbooks, so memory stays flat however
+# many rows there are. Column widths must therefore be known up front.
+
+CURRENCY_FORMAT = '₦#,##0.00'
+
+# Registered once per workbook; cells refer to them by name, so every styled
+# cell shares one style record rather than carrying its own font and fill
+EXCEL_STYLES = {
+    'NFC Title': dict(font=Font(bold=True, size=14)),
+    'NFC Subtitle': dict(font=Font(bold=True, size=12)),
+    'NFC Header': dict(
+        font=Font(bold=True, color="FFFFFF", size=12),
+        fill=PatternFill(start_color="2980B9", end_color="2980B9", fill_type="solid"),
+        alignment=Alignment(horizontal='center', vertical='center')
+    ),
+    'NFC Label': dict(font=Font(bold=True)),
+    'NFC Currency': dict(number_format=CURRENCY_FORMAT),
+    'NFC Total': dict(font=Font(bold=True), number_format=CURRENCY_FORMAT),
+    'NFC Percent': dict(number_format='0.0%'),
+    'NFC Total Percent': dict(font=Font(bold=True), number_format='0.0%'),
+}
+
+# Totals-row style for each column style
+EXCEL_TOTAL_STYLES = {None: 'NFC Label', 'NFC Currency': 'NFC Total', 'NFC Percent': 'NFC Total Percent'}
+
+
+def excel_workbook():
+    """A write-only workbook with the shared export styles registered"""
+    wb = Workbook(write_only=True)
+    for name, attributes in EXCEL_STYLES.items():
+        wb.add_named_style(NamedStyle(name=name, **attributes))
+    return wb
+
+
+def excel_cell(ws, value, style):
+    """A write-only cell in one of the shared styles"""
+    cell = WriteOnlyCell(ws, value=value)
+    cell.style = style
+    return cell
+
+
+def excel_row_writer(ws, styles):
+    """Return an append function for rows whose columns have fixed styles
+
+    styles holds a shared style name, or None, per column. A write-only sheet
+    serialises each row as it is appended, so one styled cell per column is
+    refilled for every row instead of building and styling new cells.
+    """
+    cells = [excel_cell(ws, None, style) if style else None for style in styles]
+    
+    def append_row(values):
+        row = []
+        for cell, value in zip(cells, values):
+            if cell is None:
+                row.append(value)
+            else:
+                cell.value = value
+                row.append(cell)
+        ws.append(row)
+    
+    return append_row
+
+
+def excel_table(ws, columns, rows, ratios=None):
+    """Write a small table of dicts with a totals row
+
+    columns are (header, key, style) triples; every column after the first
+    is totalled. A column in ratios, as key: (numerator key, denominator
+    key), is a rate and its total divides the other two totals instead.
+    Rows are already in memory, so widths are measured from them before
+    anything is written.
+    """
+    ratios = ratios or {}
+    for col, (header, key, style) in enumerate(columns, 1):
+        longest = max((display_len(row[key], style) for row in rows), default=0)
+        ws.column_dimensions[get_column_letter(col)].width = excel_width(header, longest)
+    
+    ws.append([excel_cell(ws, header, 'NFC Header') for header, _, _ in columns])
+    append_row = excel_row_writer(ws, [style for _, _, style in columns])
+    for row in rows:
+        append_row([row[key] for _, key, _ in columns])
+    
+    last_row = len(rows) + 1
+    letters = {key: get_column_letter(col) for col, (_, key, _) in enumerate(columns, 1)}
+    
+    def total(key):
+        if key in ratios:
+            numerator, denominator = (f'{letters[k]}{last_row + 1}' for k in ratios[key])
+            return f'=IF({denominator}=0,0,{numerator}/{denominator})'
+        return f'=SUM({letters[key]}2:{letters[key]}{last_row})'
+    
+    ws.append([excel_cell(ws, 'TOTAL', 'NFC Label')] + [
+        excel_cell(ws, total(key), EXCEL_TOTAL_STYLES[style])
+        for _, key, style in columns[1:]
+    ])
+
+
+def excel_width(header, longest):
+    """Width of a column from its header and its longest value, capped at 50"""
+    return min(max(len(header), longest or 0) + 2, 50)
+
+
+def currency_len(value):
+    """Displayed length of an amount in CURRENCY_FORMAT"""
+    return len(f"₦{value:,.2f}") if value is not None else 0
+
+
+def display_len(value, style):
+    """Displayed length of a value in one of the shared styles"""
+    if style == 'NFC Currency':
+        return currency_len(value)
+    if style == 'NFC Percent':
+        return len(f"{value:.1%}")
+    return len(str(value))
+
+
+# ============================================================================
+# MEMBER STATEMENTS
+# ============================================================================
+# Module-level so batch statements can be rendered in worker processes
+
+# Members per worker task: large enough to amortise pickling, small enough
+# that a cancel only waits for a few statements per worker
+STATEMENT_CHUNK_SIZE = 5
+# Seconds between cancel checks while waiting for chunks
+STATEMENT_CANCEL_POLL = 0.2
+
+
+def member_statement_filename(member_id):
+    """File name of a member statement generated today"""
+    return f"Member_Statement_{member_id}_{datetime.now().strftime('%Y%m%d')}.pdf"
+
+
+def render_member_statement(filepath, org_name, member, summary, transactions, start_date, end_date):
+    """Write one member statement PDF from already-fetched data"""
+    # Create PDF
+    doc = SimpleDocTemplate(filepath, pagesize=A4)
+    story = []
+    styles = getSampleStyleSheet()
+    
+    # Title style
+    title_style = ParagraphStyle(
+        'CustomTitle',
+        parent=styles['Heading1'],
+        fontSize=18,
+        textColor=colors.HexColor('#2980B9'),
+        spaceAfter=30,
+        alignment=TA_CENTER
+    )
+    
+    # Organization header
+    story.append(Paragraph(org_name, title_style))
+    story.append(Paragraph("MEMBER ACCOUNT STATEMENT", styles['Heading2']))
+    story.append(Spacer(1, 0.2*inch))
+    
+    # Member info
+    full_name = f"{member['first_name']} "
+    if member['middle_name']:
+        full_name += f"{member['middle_name']} "
+    full_name += member['last_name']
+    
+    member_info = [
+        ['Member ID:', member['member_id']],
+        ['Name:', full_name],
+        ['Date:', datetime.now().strftime('%B %d, %Y')],
+        ['Period:', f"{start_date} to {end_date}"]
+    ]
+    
+    member_table = Table(member_info, colWidths=[2*inch, 4*inch])
+    member_table.setStyle(TableStyle([
+        ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
+        ('FONTNAME', (1, 0), (1, -1), 'Helvetica'),
+        ('FONTSIZE', (0, 0), (-1, -1), 10),
+        ('TOPPADDING', (0, 0), (-1, -1), 6),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
+    ]))
+    story.append(member_table)
+    story.append(Spacer(1, 0.3*inch))
+    
+    # Account Summary
+    if summary:
+        story.append(Paragraph("ACCOUNT SUMMARY", styles['Heading3']))
+    
+        summary_data = [
+            ['Description', 'Amount (₦)'],
+            ['Total Savings', f"{summary['total_savings']:,.2f}"],
+            ['  - Premium Savings', f"{summary['premium_savings']:,.2f}"],
+            ['  - Fixed/Target Deposits', f"{summary['fixed_target_deposits']:,.2f}"],
+            ['  - Share Investment', f"{summary['shares_investment']:,.2f}"],
+            ['Total Loans Outstanding', f"{summary['total_loans_outstanding']:,.2f}"],
+            ['Net Balance', f"{summary['net_balance']:,.2f}"]
+        ]
+    
+        summary_table = Table(summary_data, colWidths=[3*inch, 2*inch])
+        summary_table.setStyle(TableStyle([
+            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#2980B9')),
+            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+            ('ALIGN', (1, 0), (1, -1), 'RIGHT'),
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+            ('FONTSIZE', (0, 0), (-1, 0), 12),
+            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+            ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
+            ('GRID', (0, 0), (-1, -1), 1, colors.black),
+            ('FONTNAME', (0, -1), (-1, -1), 'Helvetica-Bold'),
+        ]))
+        story.append(summary_table)
+        story.append(Spacer(1, 0.3*inch))
+    
+    # Transactions
+    story.append(Paragraph("TRANSACTION HISTORY", styles['Heading3']))
+    
+    if transactions:
+        trans_data = [['Date', 'Type', 'Description', 'Debit (₦)', 'Credit (₦)']]
+    
+        for txn in transactions:
+            debit = f"{txn['amount']:,.2f}" if not txn['is_credit'] else '-'
+            credit = f"{txn['amount']:,.2f}" if txn['is_credit'] else '-'
+    
+            trans_data.append([
+                txn['transaction_date'],
+                txn['transaction_type'],
+                txn['description'] or '',
+                debit,
+                credit
+            ])
+    
+        trans_table = Table(trans_data, colWidths=[1*inch, 1.5*inch, 2*inch, 1*inch, 1*inch])
+        trans_table.setStyle(TableStyle([
+            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#34495E')),
+            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+            ('ALIGN', (3, 0), (4, -1), 'RIGHT'),
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+            ('FONTSIZE', (0, 0), (-1, -1), 9),
+            ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
+            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.lightgrey]),
+        ]))
+        story.append(trans_table)
+    else:
+        story.append(Paragraph("No transactions found for this period.", styles['Normal']))
+    
+    # Build PDF
+    doc.build(story)
+
+
+def render_statement_chunk(output_dir, org_name, start_date, end_date, statements):
+    """Render a list of statements (worker process entry point); returns their paths"""
+    paths = []
+    for statement in statements:
+        filepath = os.path.join(output_dir,
+                                member_statement_filename(statement['member']['member_id']))
+        render_member_statement(filepath, org_name, statement['member'], statement['summary'],
+                                statement['transactions'], start_date, end_date)
+        paths.append(filepath)
+    return paths
+
+
+def merge_pdfs(paths, filepath):
+    """Concatenate PDFs into one printable document"""
+    from pypdf import PdfWriter
+    
+    writer = PdfWriter()
+    for path in paths:
+        writer.append(path)
+    with open(filepath, 'wb') as f:
+        writer.write(f)
+    writer.close()
+    return filepath
@@ -0,0 +1,83 @@
+"""
+Payroll Import - Read monthly payroll deduction files
+=====================================================
+Turns a payroll CSV into entries for DatabaseManager.post_batch.
+
+Expected columns (header row required, case-insensitive):
+    entry_type    Savings or Loan
+    reference     savings account number or loan number
+    amount        deduction amount, commas allowed; rounded to kobo
+    transaction_date  YYYY-MM-DD, not in the future  (optional)
+    description, payment_method, cheque_number, receipt_number  (optional)
+"""
+
+import csv
+import math
+from datetime import date
+from typing import Dict, List, Tuple
+
+REQUIRED_COLUMNS = ('entry_type', 'reference', 'amount')
+OPTIONAL_COLUMNS = ('transaction_date', 'description', 'payment_method',
+                    'cheque_number', 'receipt_number')
+
+
+def read_payroll_csv(path: str, default_payment_method: str = 'Payroll'
+                     ) -> Tuple[List[Dict], List[Tuple[int, str]]]:
+    """Parse a payroll CSV into (entries, errors)
+
+    Line numbers in errors are file line numbers, counting the header as 1.
+    Rows that cannot be parsed are reported and left out of entries.
+    """
+    entries = []
+    errors = []
+
+    with open(path, newline='', encoding='utf-8-sig') as f:
+        reader = csv.DictReader(f)
+        header = {(name or '').strip().lower(): name for name in reader.fieldnames or []}
+        missing = [col for col in REQUIRED_COLUMNS if col not in header]
+        if missing:
+            return [], [(1, f"Missing column(s): {', '.join(missing)}")]
+
+        for line, row in enumerate(reader, start=2):
+            values = {col: (row.get(header[col]) or '').strip()
+                      for col in REQUIRED_COLUMNS + OPTIONAL_COLUMNS if col in header}
+
+            if not any(values.values()):
+                continue   # skip blank lines
+
+            entry_type = values['entry_type'].capitalize()
+            try:
+                amount = float(values['amount'].replace(',', '').lstrip('₦'))
+            except ValueError:
+                amount = None
+            # float() also accepts inf and nan
+            if amount is None or not math.isfinite(amount):
+                errors.append((line, f"Invalid amount: {values['amount']}"))
+                continue
+            amount = round(amount, 2)
+
+            if values.get('transaction_date'):
+                try:
+                    txn_date = date.fromisoformat(values['transaction_date'])
+                except ValueError:
+                    errors.append((line, f"Invalid transaction date (use YYYY-MM-DD): "
+                                         f"{values['transaction_date']}"))
+                    continue
+                if txn_date > date.today():
+                    errors.append((line, f"Transaction date is in the future: {txn_date}"))
+                    continue
+                values['transaction_date'] = txn_date.isoformat()
+
+            entry = {
+                'line': line,
+                'entry_type': entry_type,
+                'reference': values['reference'].upper(),
+                'amount': amount,
+                'payment_method': values.get('payment_method') or default_payment_method,
+            }
+            for col in OPTIONAL_COLUMNS:
+                if values.get(col) and col not in entry:
+                    entry[col] = values[col]
+            entries.append(entry)
+
+    return entries, errors
@@ -0,0 +1,87 @@
+"""
+Tests - Loan arrears job
+========================
+"""
+
+from datetime import date, timedelta
+
+import pytest
+
+START = date(2026, 1, 1)
+
+
+def days_after(days):
+    return (START + timedelta(days=days)).isoformat()
+
+
+def arrears(db, loan_id):
+    return db.fetchone("SELECT * FROM loan_arrears WHERE loan_id = ?", (loan_id,))
+
+
+def loan_status(db, loan_id):
+    return db.query_one('loans.get', (loan_id,))['status']
+
+
+@pytest.mark.parametrize('days, in_arrears, status', [
+    (0, False, 'Active'),        # first installment falls due today
+    (1, True, 'Active'),
+    (90, True, 'Active'),        # loan_default_days
+    (91, True, 'Defaulted'),
+])
+def test_days_past_due_boundaries(db, add_loan, days, in_arrears, status):
+    loan = add_loan(duration=12, start_date=START.isoformat())
+
+    db.run_arrears_job(days_after(days), 'pytest')
+
+    row = arrears(db, loan['loan_id'])
+    assert row['days_past_due'] == days
+    assert (row['arrears_amount'] > 0) == in_arrears
+    assert loan_status(db, loan['loan_id']) == status
+    listed = {r['loan_id'] for r in db.get_loans_in_arrears()}
+    assert (loan['loan_id'] in listed) == in_arrears
+
+
+def test_partial_installment_counts_from_its_own_due_date(db, add_loan):
+    # 1,200 over 4 installments of 300, due on the 1st of Jan-Apr
+    loan = add_loan(principal=1000, interest_rate=20, duration=4, start_date=START.isoformat())
+    db.record_loan_repayment(loan['loan_id'], 450, {'payment_date': '2026-01-20'}, 'pytest')
+
+    db.run_arrears_job('2026-02-11', 'pytest')
+
+    row = arrears(db, loan['loan_id'])
+    assert row['oldest_due_date'] == '2026-02-01'
+    assert row['days_past_due'] == 10
+    assert row['installments_overdue'] == 1
+    assert row['arrears_amount'] == 150
+
+
+def test_defaulted_loan_is_cured_once_it_catches_up(db, add_loan):
+    loan = add_loan(principal=1000, interest_rate=20, duration=12, start_date=START.isoformat())
+    first = db.run_arrears_job(days_after(100), 'pytest')
+    assert loan_status(db, loan['loan_id']) == 'Defaulted'
+    assert first['loans_defaulted'] >= 1
+
+    # Pay every installment due by then
+    db.record_loan_repayment(loan['loan_id'], 400, {'payment_date': days_after(100)}, 'pytest')
+    second = db.run_arrears_job(days_after(100), 'pytest')
+
+    assert loan_status(db, loan['loan_id']) == 'Active'
+    assert arrears(db, loan['loan_id'])['days_past_due'] == 0
+    assert second['loans_cured'] >= 1
+
+
+def test_dry_run_previews_without_changing_anything(db, add_loan):
+    loan = add_loan(duration=12, start_date=START.isoformat())
+    last_run = db.get_last_arrears_run()
+
+    preview = db.run_arrears_job(days_after(120), 'pytest', dry_run=True)
+
+    assert preview['dry_run'] and preview['run_id'] is None
+    assert preview['loans_defaulted'] >= 1
+    assert loan_status(db, loan['loan_id']) == 'Active'
+    assert arrears(db, loan['loan_id']) is None
+    assert db.get_last_arrears_run() == last_run
+
+    run = db.run_arrears_job(days_after(120), 'pytest')
+    assert run['loans_defaulted'] == preview['loans_defaulted']
+    assert loan_status(db, loan['loan_id']) == 'Defaulted'
@@ -0,0 +1,129 @@
+"""
+Tests - Batch posting and payroll import
+========================================
+"""
+
+from datetime import date, timedelta
+
+import pytest
+
+from database.db_manager import BatchPostingError
+from utils.payroll_import import read_payroll_csv
+
+
+def premium_balance(db, account_number):
+    return db.fetchone(
+        "SELECT current_balance FROM savings_accounts WHERE account_number = ?",
+        (account_number,)
+    )['current_balance']
+
+
+def test_post_batch_posts_savings_and_repayments(db, add_member, add_loan):
+    member_id, account = add_member()
+    loan = add_loan(principal=1000, interest_rate=20, duration=4)
+
+    result = db.post_batch([
+        {'entry_type': 'Savings', 'reference': account, 'amount': 1500.004},
+        {'entry_type': 'Loan', 'reference': loan['loan_number'], 'amount': 300,
+         'transaction_date': '2026-02-01'},
+    ], 'pytest')
+
+    assert result['entries'] == 2
+    assert result['total_amount'] == 1800.0
+    assert premium_balance(db, account) == 1500.0
+    updated = db.query_one('loans.get', (loan['loan_id'],))
+    assert updated['amount_paid'] == 300
+    assert updated['balance_outstanding'] == 900
+    assert db.get_member_summary(member_id)[0]['total_savings'] == 1500.0
+
+
+@pytest.mark.parametrize('amount', [0, -5, float('inf'), float('nan'), '100', True, 0.004])
+def test_post_batch_rejects_bad_amounts(db, add_member, amount):
+    _, account = add_member()
+
+    with pytest.raises(BatchPostingError) as raised:
+        db.post_batch([{'entry_type': 'Savings', 'reference': account, 'amount': amount}], 'pytest')
+
+    assert [line for line, _ in raised.value.errors] == [1]
+    assert premium_balance(db, account) == 0
+
+
+@pytest.mark.parametrize('txn_date, message', [
+    ('17/10/2026', 'Invalid transaction date'),
+    ('2026-02-30', 'Invalid transaction date'),
+    ((date.today() + timedelta(days=1)).isoformat(), 'in the future'),
+])
+def test_post_batch_rejects_bad_dates(db, add_member, txn_date, message):
+    _, account = add_member()
+
+    with pytest.raises(BatchPostingError) as raised:
+        db.post_batch([{'entry_type': 'Savings', 'reference': account, 'amount': 10,
+                        'transaction_date': txn_date, 'line': 7}], 'pytest')
+
+    [(line, error)] = raised.value.errors
+    assert line == 7 and message in error
+
+
+def test_post_batch_reports_every_bad_line_and_writes_nothing(db, add_member, add_loan):
+    _, account = add_member()
+    loan = add_loan()
+    transactions_before = db.query_one('transactions.last_id')['transaction_id']
+
+    with pytest.raises(BatchPostingError) as raised:
+        db.post_batch([
+            {'entry_type': 'Savings', 'reference': account, 'amount': 100},
+            {'entry_type': 'Savings', 'reference': 'NO-SUCH-ACCOUNT', 'amount': 100},
+            {'entry_type': 'Loan', 'reference': loan['loan_number'], 'amount': 50},
+            {'entry_type': 'Shares', 'reference': account, 'amount': 100},
+        ], 'pytest')
+
+    assert [line for line, _ in raised.value.errors] == [2, 4]
+    assert premium_balance(db, account) == 0
+    assert db.query_one('loans.get', (loan['loan_id'],))['amount_paid'] == 0
+    assert db.query_one('transactions.last_id')['transaction_id'] == transactions_before
+
+
+def test_post_batch_rolls_back_when_a_write_fails(db, add_member, add_loan, monkeypatch):
+    _, account = add_member()
+    loan = add_loan()
+    run_many = db.run_many
+
+    def failing_run_many(name, seq_of_params):
+        if name == 'transactions.insert':
+            raise RuntimeError("disk full")
+        return run_many(name, seq_of_params)
+
+    monkeypatch.setattr(db, 'run_many', failing_run_many)
+    with pytest.raises(RuntimeError):
+        db.post_batch([
+            {'entry_type': 'Savings', 'reference': account, 'amount': 100},
+            {'entry_type': 'Loan', 'reference': loan['loan_number'], 'amount': 50},
+        ], 'pytest')
+
+    assert premium_balance(db, account) == 0
+    assert db.query_one('loans.get', (loan['loan_id'],))['amount_paid'] == 0
+    assert db.fetchone("SELECT COUNT(*) AS n FROM loan_repayments WHERE loan_id = ?",
+                       (loan['loan_id'],))['n'] == 0
+    assert not db.conn.in_transaction
+
+
+def test_read_payroll_csv_validates_amounts_and_dates(tmp_path):
+    path = tmp_path / 'payroll.csv'
+    tomorrow = (date.today() + timedelta(days=1)).isoformat()
+    path.write_text(
+        "entry_type,reference,amount,transaction_date\n"
+        "savings,nfc0001-prem,\"1,250.555\",2026-01-31\n"
+        "savings,NFC0001-PREM,inf,2026-01-31\n"
+        "savings,NFC0001-PREM,nan,\n"
+        "savings,NFC0001-PREM,100,17/10/2026\n"
+        f"loan,L-1,100,{tomorrow}\n",
+        encoding='utf-8'
+    )
+
+    entries, errors = read_payroll_csv(str(path))
+
+    assert [(e['line'], e['reference'], e['amount'], e['transaction_date']) for e in entries] == [
+        (2, 'NFC0001-PREM', 1250.56, '2026-01-31'),
+    ]
+    assert [line for line, _ in errors] == [3, 4, 5, 6]
+    assert 'in the future' in errors[-1][1]
@@ -0,0 +1,96 @@
+"""
+Tests - Dashboard statistics
+============================
+"""
+
+import time
+from datetime import date
+from types import SimpleNamespace
+
+import pytest
+
+from database.dashboard_stats import DashboardStatsService
+from database.queries import QueryStats, query_stats
+
+TODAY = date(2026, 6, 1)
+
+
+def test_refresh_without_writes_reuses_the_snapshot(db):
+    service = DashboardStatsService(db)
+    first = service.snapshot('daily', TODAY)
+    calls = {name: stats.calls for name, stats in query_stats()}
+
+    assert service.snapshot('daily', TODAY) is first
+    assert {name: stats.calls for name, stats in query_stats()} == calls
+
+
+def test_a_write_refreshes_the_figures(db, add_loan):
+    service = DashboardStatsService(db)
+    before = service.snapshot('daily', TODAY)
+
+    add_loan(principal=1000, interest_rate=20, duration=4, start_date='2026-01-01')
+    after = service.snapshot('daily', TODAY)
+
+    assert after.total_loans == before.total_loans + 1
+    assert after.loans_outstanding == before.loans_outstanding + 1200
+    assert after.portfolio_at_risk[30] > before.portfolio_at_risk[30]
+
+
+def test_changing_the_period_reuses_the_risk_figures(db):
+    service = DashboardStatsService(db)
+    daily = service.snapshot('daily', TODAY)
+    yearly = service.snapshot('yearly', TODAY)
+
+    assert yearly is not daily
+    assert yearly.aging is daily.aging
+    assert list(yearly.period_transactions) == [str(TODAY.year - i) for i in range(5)]
+
+
+def calls(name):
+    return dict(query_stats()).get(name, QueryStats()).calls
+
+
+def test_dashboard_loads_reuse_the_module_service(db, add_loan, monkeypatch):
+    monkeypatch.setenv('QT_QPA_PLATFORM', 'offscreen')
+    QtWidgets = pytest.importorskip('PyQt6.QtWidgets')
+    pytest.importorskip('PyQt6.QtCharts')
+    from gui.dashboard_module import DashboardModule
+
+    qt = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    app = SimpleNamespace(db_manager=db, current_user={'username': 'pytest', 'role': 'Admin'})
+
+    def settle(module):
+        deadline = time.monotonic() + 30
+        while module.queries.is_pending() and time.monotonic() < deadline:
+            qt.processEvents()
+            time.sleep(0.01)
+        assert not module.queries.is_pending()
+
+    module = DashboardModule(app)
+    try:
+        settle(module)
+        loads = calls('analytics.loans')
+        first = module.stats
+
+        # Graphs by year: a new transaction bucket, same risk figures and arrays
+        module.view_combo.setCurrentIndex(module.view_combo.findData('graphs'))
+        module.period_combo.setCurrentIndex(module.period_combo.findData('yearly'))
+        settle(module)
+        assert module.stats is not first
+        assert module.stats.aging is first.aging
+        assert calls('analytics.loans') == loads
+
+        # No writes: nothing to load
+        module.refresh_if_changed()
+        module.refresh_data()
+        assert not module.queries.is_pending()
+
+        add_loan(start_date='2026-01-01')
+        module.refresh_if_changed()
+        settle(module)
+        assert module.stats.total_loans == first.total_loans + 1
+        assert calls('analytics.loans') == loads + 1
+    finally:
+        module.refresh_timer.stop()
+        module.queries.cancel_pending()
+        module.deleteLater()
@@ -0,0 +1,78 @@
+"""
+Tests - Death benefit levy
+==========================
+"""
+
+import pytest
+
+
+def premium_balance(db, account_number):
+    return db.fetchone(
+        "SELECT current_balance FROM savings_accounts WHERE account_number = ?",
+        (account_number,)
+    )['current_balance']
+
+
+def mark_deceased(db, member_id):
+    db.set_member_status(member_id, False, True, '2026-01-10', 'pytest')
+
+
+def test_levy_charges_members_who_can_pay_and_skips_the_rest(db, add_member):
+    deceased, _ = add_member('Late', 'Member')
+    covered, covered_account = add_member('Rich', 'Member', premium_balance=20_000)
+    short, short_account = add_member('Poor', 'Member', premium_balance=1_000)
+    mark_deceased(db, deceased)
+    eligible = db.fetchone(
+        "SELECT COUNT(*) AS n FROM members WHERE is_active = 1 AND is_deceased = 0"
+    )['n']
+
+    result = db.process_death_benefit(deceased, 'pytest')
+
+    assert result['per_member_charge'] == 5000
+    assert result['members_charged'] + result['members_skipped'] == eligible
+    assert result['members_skipped'] >= 1
+    assert result['total_benefit_amount'] == 5000 * result['members_charged']
+
+    assert premium_balance(db, covered_account) == 15_000
+    assert premium_balance(db, short_account) == 1_000
+    assert db.get_member_summary(covered)[0]['premium_savings'] == 15_000
+    assert db.get_member_summary(short)[0]['premium_savings'] == 1_000
+
+    charges = db.fetchall(
+        "SELECT c.member_id, c.charge_amount, t.transaction_type, t.amount "
+        "FROM death_benefit_charges c JOIN transactions t ON t.transaction_id = c.transaction_id "
+        "WHERE c.deceased_member_id = ?", (deceased,)
+    )
+    assert len(charges) == result['members_charged']
+    charged_members = {row['member_id'] for row in charges}
+    assert covered in charged_members and short not in charged_members
+    assert all(row['transaction_type'] == 'Death Benefit Levy' and row['amount'] == 5000
+               for row in charges)
+
+    payout = db.fetchone(
+        "SELECT amount FROM transactions WHERE member_id = ? AND transaction_type = 'Death Benefit'",
+        (deceased,)
+    )
+    assert payout['amount'] == result['total_benefit_amount']
+    benefit = db.get_death_benefit(deceased)
+    assert benefit['status'] == 'Completed'
+    assert benefit['total_members_charged'] == result['members_charged']
+
+
+def test_levy_is_processed_once(db, add_member):
+    deceased, _ = add_member()
+    _, account = add_member(premium_balance=20_000)
+    mark_deceased(db, deceased)
+    db.process_death_benefit(deceased, 'pytest')
+
+    with pytest.raises(ValueError, match="already processed"):
+        db.process_death_benefit(deceased, 'pytest')
+    assert premium_balance(db, account) == 15_000
+
+
+def test_levy_needs_a_deceased_member(db, add_member):
+    member_id, _ = add_member()
+
+    with pytest.raises(ValueError, match="not marked as deceased"):
+        db.process_death_benefit(member_id, 'pytest')
+    assert db.get_death_benefit(member_id) is None
@@ -0,0 +1,92 @@
+"""
+Tests - Monthly savings interest
+================================
+"""
+
+from datetime import date, timedelta
+
+import pytest
+
+
+def last_month():
+    return (date.today().replace(day=1) - timedelta(days=1)).strftime('%Y-%m')
+
+
+def account_balance(db, account_number):
+    return db.fetchone(
+        "SELECT current_balance, total_interest_earned FROM savings_accounts "
+        "WHERE account_number = ?", (account_number,)
+    )
+
+
+def test_interest_is_posted_once_with_matching_totals(db, add_member):
+    member_id, account = add_member(premium_balance=10_000)
+    period = last_month()
+
+    preview = db.post_monthly_interest(period, 'pytest', dry_run=True)
+    # A dry run writes nothing
+    assert db.get_interest_posting(period) is None
+    assert account_balance(db, account)['current_balance'] == 10_000
+
+    result = db.post_monthly_interest(period, 'pytest')
+
+    assert {k: result[k] for k in ('accounts', 'members', 'total_interest')} == \
+           {k: preview[k] for k in ('accounts', 'members', 'total_interest')}
+    assert result['total_interest'] == round(sum(row['interest'] for row in result['by_type']), 2)
+
+    # Premium savings earn 2% a month
+    assert account_balance(db, account)['current_balance'] == 10_200
+    assert account_balance(db, account)['total_interest_earned'] == 200
+    assert db.get_member_summary(member_id)[0]['total_savings'] == 10_200
+
+    posting = db.get_interest_posting(period)
+    assert posting['accounts'] == result['accounts']
+    assert posting['total_interest'] == result['total_interest']
+    ledger = db.fetchone(
+        "SELECT COUNT(*) AS n, ROUND(SUM(amount), 2) AS total FROM transactions "
+        "WHERE transaction_type = 'Interest' AND transaction_date = ?",
+        (result['posting_date'],)
+    )
+    assert (ledger['n'], ledger['total']) == (result['accounts'], result['total_interest'])
+
+    with pytest.raises(ValueError, match="already posted"):
+        db.post_monthly_interest(period, 'pytest')
+    assert account_balance(db, account)['current_balance'] == 10_200
+
+
+def test_periods_are_posted_in_order(db):
+    period = last_month()
+    assert db.get_next_interest_period() == period
+    assert db.get_due_interest_period() == period
+
+    # Nothing before the next period, and no skipping ahead
+    with pytest.raises(ValueError, match=f"next period to post is {period}"):
+        db.post_monthly_interest('2010-01', 'pytest')
+
+    db.post_monthly_interest(period, 'pytest')
+
+    year, month = map(int, period.split('-'))
+    following = f"{year + month // 12}-{month % 12 + 1:02d}"
+    assert db.get_next_interest_period() == following
+    # The following month is this month, which has not ended
+    assert db.get_due_interest_period() is None
+    with pytest.raises(ValueError, match="has not ended"):
+        db.post_monthly_interest(following, 'pytest')
+
+
+def test_interest_uses_the_balance_at_the_end_of_the_period(db, add_member):
+    _, account = add_member(premium_balance=10_000)
+    account_id = db.fetchone("SELECT account_id FROM savings_accounts WHERE account_number = ?",
+                             (account,))['account_id']
+    # Paid in after the period ended: earns nothing for it
+    db.deposit_to_savings(account_id, 5_000, {'transaction_date': date.today().isoformat()}, 'pytest')
+
+    db.post_monthly_interest(last_month(), 'pytest')
+
+    assert account_balance(db, account)['total_interest_earned'] == 200
+    assert account_balance(db, account)['current_balance'] == 15_200
+
+
+def test_invalid_period_is_rejected(db):
+    with pytest.raises(ValueError, match="YYYY-MM"):
+        db.post_monthly_interest('2026-13', 'pytest', dry_run=True)
@@ -0,0 +1,80 @@
+"""
+Tests - Portfolio at risk, aging and collections
+================================================
+"""
+
+from datetime import date
+
+import numpy as np
+import pytest
+
+from database.loan_analytics import AGING_EDGES, AGING_LABELS, PAR_DAYS, LoanAnalyticsService
+from database.queries import QueryStats, query_stats
+
+
+@pytest.mark.parametrize('days, label', [
+    (0, 'Current'), (1, '1-30 days'), (30, '1-30 days'), (31, '31-60 days'),
+    (90, '61-90 days'), (91, '91-180 days'), (180, '91-180 days'), (181, 'Over 180 days'),
+])
+def test_aging_bucket_boundaries(days, label):
+    assert AGING_LABELS[np.searchsorted(AGING_EDGES, days, side='right')] == label
+
+
+def test_par_agrees_with_the_arrears_snapshot(db, add_loan):
+    as_of = date(2026, 6, 1)
+    add_loan(duration=12, start_date='2026-01-01')
+    partly_paid = add_loan(principal=1000, interest_rate=20, duration=4, start_date='2026-03-01')
+    db.record_loan_repayment(partly_paid['loan_id'], 450, {'payment_date': '2026-03-05'}, 'pytest')
+    db.run_arrears_job(as_of.isoformat(), 'pytest')
+
+    portfolio = LoanAnalyticsService(db).analytics(as_of)
+
+    snapshot = db.fetchall(
+        "SELECT days_past_due, balance_outstanding FROM loan_arrears WHERE balance_outstanding > 0"
+    )
+    assert portfolio.open_loans == len(snapshot)
+    assert portfolio.outstanding == pytest.approx(sum(r['balance_outstanding'] for r in snapshot))
+    for days in PAR_DAYS:
+        expected = sum(r['balance_outstanding'] for r in snapshot if r['days_past_due'] > days)
+        assert portfolio.par(days) == pytest.approx(expected)
+    for row in portfolio.aging_rows():
+        bucket = AGING_LABELS.index(row['bucket'])
+        in_bucket = [r for r in snapshot
+                     if np.searchsorted(AGING_EDGES, r['days_past_due'], side='right') == bucket]
+        assert row['loans'] == len(in_bucket)
+
+
+def test_collections_total_the_schedule_and_repayments(db, add_loan):
+    loan = add_loan(principal=1000, interest_rate=20, duration=4, start_date='2026-03-01')
+    db.record_loan_repayment(loan['loan_id'], 450, {'payment_date': '2026-03-05'}, 'pytest')
+    months = {row['month']: row for row in LoanAnalyticsService(db).analytics(date(2026, 6, 1)).collections}
+    due = db.fetchall(
+        "SELECT substr(due_date, 1, 7) AS month, SUM(amount_due) AS due FROM loan_schedule "
+        "WHERE due_date BETWEEN '2025-07-01' AND '2026-06-30' GROUP BY month"
+    )
+
+    assert list(months)[-1] == '2026-06' and len(months) == 12
+    for row in due:
+        assert months[row['month']]['due'] == pytest.approx(row['due'])
+    assert months['2026-03']['collected'] >= 450
+
+
+def loan_loads():
+    return dict(query_stats()).get('analytics.loans', QueryStats()).calls
+
+
+def test_readers_share_the_writers_arrays_until_a_write(db, add_loan):
+    as_of = date(2026, 6, 1)
+    db.loan_analytics.analytics(as_of)
+    loads = loan_loads()
+
+    with db.reader() as reader:
+        assert reader.loan_analytics is db.loan_analytics
+        reader.loan_analytics.analytics(as_of, db=reader)
+    assert loan_loads() == loads
+
+    add_loan(start_date='2026-01-01')
+    with db.reader() as reader:
+        portfolio = reader.loan_analytics.analytics(as_of, db=reader)
+    assert loan_loads() == loads + 1
+    assert portfolio.open_loans == LoanAnalyticsService(db).analytics(as_of).open_loans
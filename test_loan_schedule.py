@@ -0,0 +1,71 @@
+"""
+Tests - Loan installment schedule
+=================================
+"""
+
+from database.db_manager import loan_schedule_rows
+from database.queries import LOAN_SCHEDULE_BACKFILL
+
+
+def schedule(db, loan_id):
+    return [(row['due_date'], row['amount_due'], row['amount_paid'], row['status'])
+            for row in db.get_loan_schedule(loan_id)]
+
+
+def repay(db, loan_id, amount, payment_date):
+    db.record_loan_repayment(loan_id, amount, {'payment_date': payment_date}, 'pytest')
+
+
+def test_schedule_steps_by_month_and_takes_the_rounding_remainder():
+    rows = loan_schedule_rows(7, '2026-01-31', 3, 1000)
+
+    assert rows == [
+        (7, 1, '2026-01-31', 333.33),
+        (7, 2, '2026-02-28', 333.33),
+        (7, 3, '2026-03-31', 333.34),
+    ]
+
+
+def test_backfill_matches_the_schedule_written_at_disbursement(db, add_loan):
+    loan = add_loan(principal=1000, interest_rate=0, duration=3, start_date='2026-01-31')
+    written = schedule(db, loan['loan_id'])
+
+    with db.transaction():
+        db.execute("DELETE FROM loan_schedule WHERE loan_id = ?", (loan['loan_id'],))
+        db.execute(LOAN_SCHEDULE_BACKFILL)
+
+    assert schedule(db, loan['loan_id']) == written
+
+
+def test_partial_payment_fills_installments_oldest_first(db, add_loan):
+    loan = add_loan(principal=1000, interest_rate=20, duration=4, start_date='2026-01-15')
+
+    repay(db, loan['loan_id'], 450, '2026-02-20')
+
+    assert schedule(db, loan['loan_id']) == [
+        ('2026-01-15', 300, 300, 'Paid'),
+        ('2026-02-15', 300, 150, 'Partial'),
+        ('2026-03-15', 300, 0, 'Pending'),
+        ('2026-04-15', 300, 0, 'Pending'),
+    ]
+    # Next payment is expected to clear what is due by then
+    assert db.get_expected_repayments([loan['loan_id']], '2026-03-15') == {loan['loan_id']: 450}
+
+    repay(db, loan['loan_id'], 150, '2026-03-01')
+    paid = db.get_loan_schedule(loan['loan_id'])[:2]
+    assert [row['status'] for row in paid] == ['Paid', 'Paid']
+    # An installment keeps the date it was first fully paid
+    assert [row['paid_date'] for row in paid] == ['2026-02-20', '2026-03-01']
+
+
+def test_over_payment_settles_every_installment(db, add_loan):
+    loan = add_loan(principal=1000, interest_rate=20, duration=4)
+
+    repay(db, loan['loan_id'], 2000, '2026-02-01')
+
+    assert [(amount_paid, status) for _, _, amount_paid, status in schedule(db, loan['loan_id'])] == \
+           [(300, 'Paid')] * 4
+    updated = db.query_one('loans.get', (loan['loan_id'],))
+    assert updated['status'] == 'Completed'
+    assert updated['balance_outstanding'] == 0
+    assert db.get_expected_repayments([loan['loan_id']], '2026-12-31') == {}
@@ -0,0 +1,29 @@
+"""
+Tests - Member search
+=====================
+"""
+
+
+def found(db, term):
+    return {row['member_id'] for row in db.search_members(term)}
+
+
+def test_search_matches_word_prefixes(db, add_member):
+    member_id, _ = add_member('Adebayo', 'Okonkwo')
+
+    assert member_id in found(db, 'Adeb')
+    assert member_id in found(db, 'okon adeb')
+    assert member_id in found(db, member_id[:-1])
+    # Prefix index: the middle of a Member ID does not match
+    assert member_id not in found(db, member_id[3:])
+
+
+def test_rebuild_restores_a_stale_index(db, add_member):
+    member_id, _ = add_member('Adebayo', 'Okonkwo')
+    with db.transaction():
+        db.execute("INSERT INTO members_fts(members_fts) VALUES ('delete-all')")
+    assert found(db, 'Adebayo') == set()
+
+    db.rebuild_member_search_index()
+
+    assert member_id in found(db, 'Adebayo')
@@ -0,0 +1,25 @@
+"""
+Tests - Batch member statements
+===============================
+"""
+
+import os
+
+from reports.report_generator import STATEMENT_CHUNK_SIZE, ReportGenerator
+
+
+def test_cancel_stops_before_the_remaining_chunks(db, tmp_path):
+    reports = ReportGenerator(db)
+    reports.reports_dir = str(tmp_path)
+    progress = []
+
+    result = reports.generate_member_statements_pdf(
+        '2026-01-01', '2026-01-31', workers=1,
+        progress=lambda done, total: progress.append((done, total)),
+        cancelled=lambda: len(progress) > 1
+    )
+
+    total = progress[0][1]
+    assert result['cancelled'] and result['merged'] is None
+    assert STATEMENT_CHUNK_SIZE <= len(result['files']) < total
+    assert all(os.path.exists(path) for path in result['files'])
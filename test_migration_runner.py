@@ -0,0 +1,83 @@
+"""
+Tests - Versioned migration runner
+==================================
+"""
+
+import os
+import shutil
+import sqlite3
+
+import pytest
+
+from database.migration_runner import MIGRATIONS, Migration, MigrationError, MigrationRunner
+
+
+@pytest.fixture
+def runner_for(tmp_path):
+    """Factory for runners over a scratch migrations folder; closes them after the test"""
+    runners = []
+
+    def factory(db_path, scripts):
+        for filename, sql in scripts.items():
+            (tmp_path / filename).write_text(sql, encoding='utf-8')
+        migrations = [Migration(n, name) for n, name in enumerate(scripts, start=1)]
+        runner = MigrationRunner(db_path, migrations=migrations, migrations_dir=str(tmp_path))
+        runners.append(runner)
+        return runner
+
+    yield factory
+    for runner in runners:
+        runner.close()
+
+
+def test_shipped_migrations_apply_once(tmp_path):
+    path = str(tmp_path / 'nfc_cooperative.db')
+    shutil.copyfile(os.path.join(os.path.dirname(__file__), 'data', 'nfc_cooperative.db'), path)
+
+    runner = MigrationRunner(path)
+    try:
+        applied = runner.apply_pending()
+        assert [r['version'] for r in applied] == [m.version for m in MIGRATIONS]
+        assert runner.pending() == []
+        assert runner.apply_pending() == []
+    finally:
+        runner.close()
+
+    # A new runner (next application start) finds nothing to do either
+    runner = MigrationRunner(path)
+    try:
+        assert runner.apply_pending() == []
+        steps = runner.conn.execute("SELECT COUNT(*) FROM schema_migration_steps").fetchone()[0]
+        assert steps > 0
+    finally:
+        runner.close()
+
+
+def test_add_column_is_skipped_when_the_column_exists(tmp_path, runner_for):
+    path = str(tmp_path / 'scratch.db')
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE t (id INTEGER PRIMARY KEY, note TEXT)")
+    conn.close()
+
+    runner = runner_for(path, {'add_note.sql': "ALTER TABLE t ADD COLUMN note TEXT;\n"})
+    [result] = runner.apply_pending()
+
+    assert result['steps'] == 1
+    assert runner.pending() == []
+
+
+def test_failed_migration_rolls_back_and_stays_pending(tmp_path, runner_for):
+    path = str(tmp_path / 'scratch.db')
+    runner = runner_for(path, {
+        'good.sql': "CREATE TABLE a (id INTEGER);\n",
+        'bad.sql': "CREATE TABLE b (id INTEGER);\nINSERT INTO missing VALUES (1);\n",
+    })
+
+    with pytest.raises(MigrationError) as raised:
+        runner.apply_pending()
+
+    assert raised.value.migration.filename == 'bad.sql'
+    assert raised.value.step == 2
+    assert [m.filename for m in runner.pending()] == ['bad.sql']
+    tables = {row[0] for row in runner.conn.execute("SELECT name FROM sqlite_master")}
+    assert 'a' in tables and 'b' not in tables
@@ -0,0 +1,35 @@
+"""
+Tests - Report fingerprint
+==========================
+"""
+
+import pytest
+
+
+def edit(db, sql, params=()):
+    with db.transaction():
+        db.execute(sql, params)
+
+
+@pytest.mark.parametrize('sql', [
+    "UPDATE members SET first_name = first_name || 'x' WHERE member_id = (SELECT MIN(member_id) FROM members)",
+    "UPDATE stations SET station_name = station_name || 'x' WHERE station_id = '01'",
+    "UPDATE savings_types SET type_name = type_name || 'x' WHERE savings_type_id = 1",
+    "UPDATE loan_types SET type_name = type_name || 'x' WHERE loan_type_id = 1",
+])
+def test_label_edits_change_the_fingerprint(db, sql):
+    before = db.get_report_fingerprint()
+    edit(db, sql)
+    after = db.get_report_fingerprint()
+    # A second edit in the same second still counts
+    edit(db, sql)
+
+    assert before != after != db.get_report_fingerprint()
+
+
+def test_reads_leave_the_fingerprint_alone(db):
+    before = db.get_report_fingerprint()
+    db.get_all_members()
+    db.get_all_stations(enabled_only=False)
+
+    assert db.get_report_fingerprint() == before
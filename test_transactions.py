@@ -0,0 +1,60 @@
+"""
+Tests - DatabaseManager.transaction()
+=====================================
+"""
+
+import pytest
+
+
+def test_outer_block_commits_once(db):
+    changes = db.change_count
+
+    with db.transaction():
+        db.update_setting('organization_name', 'First')
+        db.update_setting('currency_symbol', '$')
+        # Inner mutators join the open transaction instead of committing
+        assert db.change_count == changes
+        assert db.conn.in_transaction
+
+    assert db.change_count == changes + 1
+    assert not db.conn.in_transaction
+    assert db.get_setting('organization_name') == 'First'
+
+
+def test_outer_block_rolls_back_everything(db):
+    before = db.get_setting('organization_name')
+
+    with pytest.raises(RuntimeError):
+        with db.transaction():
+            db.update_setting('organization_name', 'Changed')
+            raise RuntimeError("fail")
+
+    assert db.get_setting('organization_name') == before
+    assert db.transaction_depth == 0
+    assert not db.conn.in_transaction
+
+
+def test_caught_inner_failure_only_undoes_the_inner_block(db):
+    with db.transaction():
+        db.update_setting('organization_name', 'Outer')
+        try:
+            with db.transaction():
+                db.update_setting('currency_symbol', '$')
+                raise RuntimeError("fail")
+        except RuntimeError:
+            pass
+        assert db.transaction_depth == 1
+
+    assert db.get_setting('organization_name') == 'Outer'
+    assert db.get_setting('currency_symbol') == '₦'
+
+
+def test_uncaught_inner_failure_undoes_the_outer_block(db):
+    with pytest.raises(RuntimeError):
+        with db.transaction():
+            db.update_setting('organization_name', 'Outer')
+            with db.transaction():
+                raise RuntimeError("fail")
+
+    assert db.get_setting('organization_name') == 'Nigerian Film Corporation'
+    assert db.transaction_depth == 0